@@ -1,3 +1,4 @@
 from .base import CachedAPIClient
+from .base_async import AsyncCachedAPIClient
 
-__all__ = ["CachedAPIClient"]
+__all__ = ["CachedAPIClient", "AsyncCachedAPIClient"]
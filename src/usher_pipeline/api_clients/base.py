@@ -1,24 +1,114 @@
 """Base API client with retry logic and persistent caching."""
 
 import logging
+import sqlite3
+import threading
 import time
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
+import orjson
 import requests
 import requests_cache
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError, HTTPError, Timeout
+from requests_cache.backends.sqlite import SQLiteCache, SQLiteDict
 from tenacity import (
     retry,
     retry_if_exception_type,
     stop_after_attempt,
-    wait_exponential,
+    wait_random_exponential,
 )
 
 from usher_pipeline.config.schema import PipelineConfig
 
 logger = logging.getLogger(__name__)
 
+# PRAGMAs applied to each SQLite cache connection beyond what requests_cache
+# sets for us (journal_mode=WAL, synchronous=NORMAL, busy_timeout). A large
+# page cache and mmap keep hot index pages in memory; temp_store avoids
+# spilling sort/temp structures to disk.
+_SQLITE_CACHE_PRAGMAS = (
+    "PRAGMA cache_size=-64000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA journal_size_limit=67108864",
+)
+
+
+class _ReadOptimizedSQLiteDict(SQLiteDict):
+    """SQLiteDict that serves reads from per-thread read-only connections.
+
+    Writes keep the parent's single persistent writer connection (serialized
+    via BEGIN IMMEDIATE), while lookups use thread-local connections opened
+    with ``mode=ro``. Under WAL this lets concurrent threads read the cache
+    without blocking on the writer's lock.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._local = threading.local()
+        super().__init__(*args, **kwargs)
+
+    def _reader(self) -> sqlite3.Connection:
+        """Get (or open) this thread's read-only connection."""
+        con = getattr(self._local, "connection", None)
+        if con is None:
+            con = sqlite3.connect(
+                f"file:{self.db_path}?mode=ro",
+                uri=True,
+                check_same_thread=False,
+            )
+            # Readers bypass requests_cache's connection setup, so set
+            # busy_timeout ourselves — otherwise a read landing during a
+            # WAL checkpoint raises SQLITE_BUSY instead of waiting
+            con.execute("PRAGMA busy_timeout=5000")
+            for pragma in _SQLITE_CACHE_PRAGMAS:
+                con.execute(pragma)
+            self._local.connection = con
+        return con
+
+    @contextmanager
+    def connection(self, commit=False):
+        if commit:
+            with super().connection(commit=True) as con:
+                yield con
+            return
+        # Only connection acquisition is guarded: the yield must stay
+        # outside the except block, or an OperationalError raised in the
+        # caller's with-body would be thrown into the generator, caught
+        # here, and hit a second yield (contextlib forbids that).
+        try:
+            con = self._reader()
+        except sqlite3.OperationalError:
+            # Read-only open can fail (e.g. db not yet on disk); fall back
+            # to the shared writer connection for this lookup
+            self._local.connection = None
+            with super().connection() as fallback_con:
+                yield fallback_con
+            return
+        yield con
+
+
+class _ReadOptimizedSQLiteCache(SQLiteCache):
+    """SQLiteCache whose tables split read-only and read-write connections."""
+
+    def __init__(self, db_path="http_cache", serializer=None, **kwargs):
+        super().__init__(db_path, serializer=serializer, **kwargs)
+        skwargs = {"serializer": serializer, **kwargs} if serializer else kwargs
+        self.responses.close()
+        self.redirects.close()
+        self.responses = _ReadOptimizedSQLiteDict(
+            db_path, table_name="responses", **skwargs
+        )
+        self.redirects = _ReadOptimizedSQLiteDict(
+            db_path,
+            table_name="redirects",
+            lock=self.responses._lock,
+            serializer=None,
+            **kwargs,
+        )
+
 
 class CachedAPIClient:
     """
@@ -38,6 +128,8 @@ class CachedAPIClient:
         max_retries: int = 5,
         cache_ttl: int = 86400,
         timeout: int = 30,
+        ttl_overrides: dict[str, int] | None = None,
+        max_concurrent: int = 4,
     ):
         """
         Initialize API client with caching and retry logic.
@@ -48,38 +140,162 @@ class CachedAPIClient:
             max_retries: Maximum retry attempts on failure
             cache_ttl: Cache time-to-live in seconds (0 = infinite)
             timeout: Request timeout in seconds
+            ttl_overrides: Per-URL TTL map (URL glob pattern -> seconds)
+                for endpoints whose freshness differs from the global TTL
+            max_concurrent: Maximum in-flight requests when the client is
+                shared across threads
         """
         self.cache_dir = Path(cache_dir)
         self.rate_limit = rate_limit
         self.max_retries = max_retries
         self.timeout = timeout
 
+        # Token bucket for rate limiting: starts full so short bursts go out
+        # immediately; credit accrues while cache hits are served.
+        self._tokens = float(rate_limit)
+        self._last_refill = time.monotonic()
+
+        # Cache hit/miss counters for this client's lifetime
+        self._hits = 0
+        self._misses = 0
+
+        # Memoized cache_stats() result: (monotonic timestamp, stats dict)
+        self._stats_cache: tuple[float, dict[str, Any]] | None = None
+
+        # Cap in-flight requests so a thread pool can't pile retrying
+        # workers onto an already-throttled endpoint
+        self._sem = threading.BoundedSemaphore(max_concurrent)
+
+        # Wrap the network call in the retry policy once; re-wrapping per
+        # get() would allocate fresh Retrying state on every request
+        self._get_with_retry = self._create_retry_decorator()(self._do_get)
+
         # Create cache directory
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-        # Initialize requests_cache session
+        # Initialize requests_cache session. The .sqlite path is computed
+        # once here; cache_stats() and friends reuse the attribute.
         cache_path = self.cache_dir / "api_cache"
+        self._sqlite_path = cache_path.with_suffix(".sqlite")
         expire_after = cache_ttl if cache_ttl > 0 else None
 
+        # auto_vacuum can only be set before any data is written, so on
+        # first creation initialize the DB with incremental vacuuming to
+        # keep the file from growing monotonically as TTL'd rows expire
+        if not self._sqlite_path.exists():
+            con = sqlite3.connect(self._sqlite_path)
+            con.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            con.execute("VACUUM")
+            con.close()
+
+        # requests_cache keeps one persistent, thread-shareable connection per
+        # backend table (check_same_thread=False), so each get() reuses it
+        # rather than paying sqlite3_open/close per request. The read-optimized
+        # backend additionally routes lookups through per-thread read-only
+        # connections so reads don't contend with the writer.
         self.session = requests_cache.CachedSession(
-            cache_name=str(cache_path),
-            backend="sqlite",
+            backend=_ReadOptimizedSQLiteCache(
+                db_path=str(cache_path),
+                wal=True,
+                busy_timeout=5000,
+            ),
             expire_after=expire_after,
+            urls_expire_after=ttl_overrides or None,
         )
+        self._tune_cache_connections()
+
+        # Enlarge the connection pool (requests defaults to 10) so keep-alive
+        # connections are reused across threads instead of being evicted and
+        # re-handshaken. Adapter-level retries stay off — tenacity owns retry.
+        adapter = HTTPAdapter(pool_connections=64, pool_maxsize=64, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def _tune_cache_connections(self) -> None:
+        """Apply performance PRAGMAs to the SQLite cache connections.
+
+        WAL mode, synchronous=NORMAL, and busy_timeout are handled by
+        requests_cache itself (via ``wal``/``busy_timeout`` above); this adds
+        the remaining memory-oriented PRAGMAs on both backend tables.
+        """
+        for storage in (self.session.cache.responses, self.session.cache.redirects):
+            with storage.connection() as con:
+                for pragma in _SQLITE_CACHE_PRAGMAS:
+                    con.execute(pragma)
 
     def _should_rate_limit(self, response: requests.Response) -> bool:
         """Check if response came from cache (no rate limit needed)."""
         return not getattr(response, "from_cache", False)
 
+    def _acquire_token(self) -> None:
+        """Take one token from the bucket, sleeping only if it's empty.
+
+        The bucket refills at ``rate_limit`` tokens per second up to a burst
+        capacity of ``rate_limit``, so runs dominated by cache hits are not
+        throttled and uncached bursts still honor the long-run rate.
+        """
+        now = time.monotonic()
+        self._tokens = min(
+            float(self.rate_limit),
+            self._tokens + (now - self._last_refill) * self.rate_limit,
+        )
+        self._last_refill = now
+
+        if self._tokens < 1:
+            time.sleep((1 - self._tokens) / self.rate_limit)
+            self._tokens = 0.0
+            self._last_refill = time.monotonic()
+        else:
+            self._tokens -= 1
+
     def _create_retry_decorator(self):
-        """Create retry decorator with exponential backoff."""
+        """Create retry decorator with full-jitter exponential backoff.
+
+        Jitter (delay drawn from [0, 2**attempt], capped) decorrelates
+        concurrent clients retrying after the same 429, avoiding a
+        thundering herd of synchronized retries.
+        """
         return retry(
             stop=stop_after_attempt(self.max_retries),
-            wait=wait_exponential(multiplier=1, min=2, max=60),
+            wait=wait_random_exponential(multiplier=1, max=60),
             retry=retry_if_exception_type((HTTPError, Timeout, ConnectionError)),
             reraise=True,
         )
 
+    def _is_cached(self, url: str, params: dict[str, Any] | None = None) -> bool:
+        """Check whether a matching GET response is already in the cache."""
+        request = requests.Request("GET", url, params=params)
+        return self.session.cache.contains(request=request)
+
+    def _do_get(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+        **kwargs,
+    ) -> requests.Response:
+        """Single GET attempt through the cache session (no retry)."""
+        with self._sem:
+            response = self.session.get(
+                url,
+                params=params,
+                timeout=self.timeout,
+                **kwargs,
+            )
+
+        # Inline status check: the common 2xx path skips raise_for_status()
+        # entirely; only error responses pay for building the HTTPError
+        status = response.status_code
+        if status >= 400:
+            # Log warning for rate limiting
+            if status == 429:
+                logger.warning(
+                    f"Rate limited by API (429). "
+                    f"URL: {url}. Will retry with backoff."
+                )
+            response.raise_for_status()
+
+        return response
+
     def get(
         self,
         url: str,
@@ -102,36 +318,26 @@ class CachedAPIClient:
             Timeout: On timeout after retries exhausted
             ConnectionError: On connection error after retries exhausted
         """
-        # Apply retry decorator dynamically
-        @self._create_retry_decorator()
-        def _get_with_retry():
-            response = self.session.get(
-                url,
-                params=params,
-                timeout=self.timeout,
-                **kwargs,
-            )
-
-            # Check for HTTP errors
+        # Fast path: a cached response can't raise network errors, so skip
+        # the tenacity machinery entirely. If the entry turned out to be
+        # expired and the refetch failed, fall through to the retry path.
+        response = None
+        if self._is_cached(url, params):
             try:
-                response.raise_for_status()
-            except HTTPError as e:
-                # Log warning for rate limiting
-                if response.status_code == 429:
-                    logger.warning(
-                        f"Rate limited by API (429). "
-                        f"URL: {url}. Will retry with backoff."
-                    )
-                raise e
+                response = self._do_get(url, params=params, **kwargs)
+            except (HTTPError, Timeout, ConnectionError):
+                response = None
 
-            return response
-
-        # Make request with retry
-        response = _get_with_retry()
+        if response is None:
+            # Make request with retry
+            response = self._get_with_retry(url, params, **kwargs)
 
         # Rate limit only non-cached requests
         if self._should_rate_limit(response):
-            time.sleep(1 / self.rate_limit)
+            self._misses += 1
+            self._acquire_token()
+        else:
+            self._hits += 1
 
         return response
 
@@ -157,7 +363,9 @@ class CachedAPIClient:
             JSONDecodeError: If response is not valid JSON
         """
         response = self.get(url, params=params, **kwargs)
-        return response.json()
+        # orjson parses the raw bytes directly, skipping response.text's
+        # encoding round-trip and the stdlib Python-level parser
+        return orjson.loads(response.content)
 
     @classmethod
     def from_config(cls, config: PipelineConfig) -> "CachedAPIClient":
@@ -176,10 +384,37 @@ class CachedAPIClient:
             max_retries=config.api.max_retries,
             cache_ttl=config.api.cache_ttl_seconds,
             timeout=config.api.timeout_seconds,
+            ttl_overrides=config.api.ttl_overrides,
         )
 
+    @contextmanager
+    def bulk(self):
+        """Batch cache writes from many requests into one SQLite transaction.
+
+        Useful for cold-cache stages making many consecutive uncached
+        requests — the COMMIT (and its fsync) is deferred until the block
+        exits instead of being paid per response.
+
+        Example:
+            with client.bulk():
+                for url in urls:
+                    client.get(url)
+        """
+        with self.session.cache.responses.bulk_commit():
+            yield
+
+    def maintenance(self) -> None:
+        """Reclaim free pages and refresh query-planner statistics.
+
+        Cheap enough to run at client shutdown or on a timer; keeps the
+        cache file compact so hot index pages stay in the page cache.
+        """
+        with self.session.cache.responses.connection(commit=True) as con:
+            con.execute("PRAGMA incremental_vacuum(128000)")
+            con.execute("PRAGMA optimize")
+
     def clear_cache(self) -> None:
-        """Clear all cached responses."""
+        """Clear all cached responses (also VACUUMs the backing file)."""
         self.session.cache.clear()
         logger.info("API cache cleared")
 
@@ -189,19 +424,30 @@ class CachedAPIClient:
 
         Returns:
             Dictionary with cache statistics
+
+        Notes:
+            Filesystem metadata is refreshed at most once per second, so
+            tight polling loops don't pay stat() syscalls on every call.
         """
-        # requests_cache doesn't provide built-in stats,
-        # so we return basic info about cache state
-        cache_path = self.cache_dir / "api_cache.sqlite"
-
-        stats = {
-            "cache_enabled": True,
-            "cache_path": str(cache_path),
-            "cache_exists": cache_path.exists(),
-        }
-
-        # Get cache size if it exists
-        if cache_path.exists():
-            stats["cache_size_bytes"] = cache_path.stat().st_size
+        now = time.monotonic()
+        if self._stats_cache is not None and now - self._stats_cache[0] < 1.0:
+            stats = dict(self._stats_cache[1])
+        else:
+            stats = {
+                "cache_enabled": True,
+                "cache_path": str(self._sqlite_path),
+            }
+            try:
+                stats["cache_exists"] = True
+                stats["cache_size_bytes"] = self._sqlite_path.stat().st_size
+            except FileNotFoundError:
+                stats["cache_exists"] = False
+            self._stats_cache = (now, dict(stats))
+
+        # Counters are in-memory — always current, never memoized
+        total = self._hits + self._misses
+        stats["hits"] = self._hits
+        stats["misses"] = self._misses
+        stats["hit_rate"] = self._hits / total if total else 0.0
 
         return stats
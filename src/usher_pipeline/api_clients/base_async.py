@@ -0,0 +1,242 @@
+"""Async API client for concurrent fan-out over I/O-bound endpoints."""
+
+import asyncio
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlencode
+
+import httpx
+import orjson
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+from usher_pipeline.api_clients.base import _SQLITE_CACHE_PRAGMAS
+from usher_pipeline.config.schema import PipelineConfig
+
+logger = logging.getLogger(__name__)
+
+_RETRYABLE_EXCEPTIONS = (
+    httpx.HTTPStatusError,
+    httpx.ConnectError,
+    httpx.TimeoutException,
+)
+
+
+class AsyncCachedAPIClient:
+    """
+    Async HTTP client with rate limiting, retry logic, and SQLite caching.
+
+    Counterpart to :class:`CachedAPIClient` for stages that fetch many URLs:
+    requests overlap on the event loop instead of paying N sequential round
+    trips, while the token bucket still bounds the long-run request rate.
+
+    Usage:
+        async with AsyncCachedAPIClient.from_config(config) as client:
+            results = await asyncio.gather(*(client.get_json(u) for u in urls))
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        rate_limit: int = 5,
+        max_retries: int = 5,
+        cache_ttl: int = 86400,
+        timeout: int = 30,
+        max_concurrent: int = 8,
+    ):
+        """
+        Initialize async API client.
+
+        Args:
+            cache_dir: Directory for SQLite cache storage
+            rate_limit: Maximum requests per second
+            max_retries: Maximum retry attempts on failure
+            cache_ttl: Cache time-to-live in seconds (0 = infinite)
+            timeout: Request timeout in seconds
+            max_concurrent: Maximum in-flight requests on the event loop
+        """
+        self.cache_dir = Path(cache_dir)
+        self.rate_limit = rate_limit
+        self.max_retries = max_retries
+        self.cache_ttl = cache_ttl
+        self.timeout = timeout
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._sqlite_path = self.cache_dir / "api_cache_async.sqlite"
+
+        # Response-body cache; lookups/writes are microsecond-scale, so the
+        # synchronous sqlite3 module is fine inside the event loop
+        self._con = sqlite3.connect(
+            self._sqlite_path, check_same_thread=False, isolation_level=None
+        )
+        self._con.execute("PRAGMA journal_mode=WAL")
+        self._con.execute("PRAGMA synchronous=NORMAL")
+        self._con.execute("PRAGMA busy_timeout=5000")
+        for pragma in _SQLITE_CACHE_PRAGMAS:
+            self._con.execute(pragma)
+        self._con.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "    key TEXT PRIMARY KEY,"
+            "    body BLOB,"
+            "    expires REAL"
+            ")"
+        )
+
+        self._client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_concurrent * 2,
+                max_keepalive_connections=max_concurrent,
+            ),
+        )
+        self._sem = asyncio.Semaphore(max_concurrent)
+
+        # Token bucket shared by all coroutines (same semantics as the
+        # sync client: full at start, refills at rate_limit tokens/sec)
+        self._tokens = float(rate_limit)
+        self._last_refill = time.monotonic()
+        self._token_lock = asyncio.Lock()
+
+    @staticmethod
+    def _cache_key(url: str, params: dict[str, Any] | None) -> str:
+        """Build a deterministic cache key from URL and sorted params."""
+        if not params:
+            return url
+        return f"{url}?{urlencode(sorted(params.items()))}"
+
+    def _cache_get(self, key: str) -> bytes | None:
+        """Return unexpired cached body for key, or None."""
+        row = self._con.execute(
+            "SELECT body, expires FROM responses WHERE key=?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        body, expires = row
+        if expires is not None and expires < time.time():
+            return None
+        return body
+
+    def _cache_put(self, key: str, body: bytes) -> None:
+        """Store a response body with TTL-derived expiry."""
+        expires = time.time() + self.cache_ttl if self.cache_ttl > 0 else None
+        self._con.execute(
+            "INSERT OR REPLACE INTO responses (key, body, expires) VALUES (?, ?, ?)",
+            (key, body, expires),
+        )
+
+    async def _acquire_token(self) -> None:
+        """Take one token from the bucket, sleeping only if it's empty."""
+        async with self._token_lock:
+            now = time.monotonic()
+            self._tokens = min(
+                float(self.rate_limit),
+                self._tokens + (now - self._last_refill) * self.rate_limit,
+            )
+            self._last_refill = now
+
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate_limit)
+                self._tokens = 0.0
+                self._last_refill = time.monotonic()
+            else:
+                self._tokens -= 1
+
+    async def get_bytes(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+    ) -> bytes:
+        """
+        Make GET request and return the raw response body, using the cache.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+
+        Returns:
+            Response body as bytes
+
+        Raises:
+            httpx.HTTPStatusError: On HTTP error after retries exhausted
+            httpx.TimeoutException: On timeout after retries exhausted
+            httpx.ConnectError: On connection error after retries exhausted
+        """
+        key = self._cache_key(url, params)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+
+        async for attempt in AsyncRetrying(
+            stop=stop_after_attempt(self.max_retries),
+            wait=wait_random_exponential(multiplier=1, max=60),
+            retry=retry_if_exception_type(_RETRYABLE_EXCEPTIONS),
+            reraise=True,
+        ):
+            with attempt:
+                await self._acquire_token()
+                async with self._sem:
+                    response = await self._client.get(url, params=params)
+                if response.status_code == 429:
+                    logger.warning(
+                        f"Rate limited by API (429). "
+                        f"URL: {url}. Will retry with backoff."
+                    )
+                response.raise_for_status()
+                body = response.content
+
+        self._cache_put(key, body)
+        return body
+
+    async def get_json(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Make GET request and return parsed JSON response.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+
+        Returns:
+            Parsed JSON response as dict
+        """
+        return orjson.loads(await self.get_bytes(url, params=params))
+
+    async def aclose(self) -> None:
+        """Close the HTTP client and the cache connection."""
+        await self._client.aclose()
+        self._con.close()
+
+    async def __aenter__(self) -> "AsyncCachedAPIClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    @classmethod
+    def from_config(cls, config: PipelineConfig) -> "AsyncCachedAPIClient":
+        """
+        Create client from pipeline configuration.
+
+        Args:
+            config: PipelineConfig instance
+
+        Returns:
+            Configured AsyncCachedAPIClient instance
+        """
+        return cls(
+            cache_dir=config.cache_dir,
+            rate_limit=config.api.rate_limit_per_second,
+            max_retries=config.api.max_retries,
+            cache_ttl=config.api.cache_ttl_seconds,
+            timeout=config.api.timeout_seconds,
+        )
@@ -9,9 +9,11 @@ Commands for downloading and processing various evidence sources:
 
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 import click
+import polars as pl
 import structlog
 
 from usher_pipeline.config.loader import load_config
@@ -50,8 +52,104 @@ from usher_pipeline.evidence.expression import (
 logger = logging.getLogger(__name__)
 
 
+def _category_counts(df: pl.DataFrame, col: str) -> dict:
+    """Count rows per category in one Polars aggregation pass."""
+    return dict(df.group_by(col).len().iter_rows())
+
+
+# Pre-styled banners and style helpers shared by all subcommands; the
+# repeated literals are styled once at import instead of per echo
+_SUMMARY_HEADER = click.style("=== Summary ===", bold=True)
+_CHECKPOINT_READY = click.style(
+    "Evidence layer ready (used existing checkpoint)", fg='green'
+)
+
+# Tier counts and percentages in one grouped aggregate (window over the
+# grouped counts), shared by the checkpoint and post-load summaries
+_TIER_DISTRIBUTION_SQL = (
+    "SELECT evidence_tier, COUNT(*) AS count, "
+    "100.0 * COUNT(*) / SUM(COUNT(*)) OVER () AS pct "
+    "FROM literature_evidence GROUP BY evidence_tier ORDER BY count DESC"
+)
+
+
+def _ok(s: str) -> str:
+    return click.style(s, fg='green')
+
+
+def _fail(s: str) -> str:
+    return click.style(s, fg='red')
+
+
+def _echo_lines(lines: list) -> None:
+    """Emit several output lines as a single buffered write.
+
+    One join + one write(2) instead of a syscall per click.echo call.
+    """
+    click.echo("\n".join(str(line) for line in lines))
+
+
+def _open_resources(ctx):
+    """Open config, store, and provenance on first use, memoized in ctx.obj.
+
+    Initialization is deferred to subcommand bodies rather than the group
+    callback so 'evidence <sub> --help' stays side-effect-free: no config
+    parse, no data-directory creation, and no DuckDB open (which would
+    contend with the single-writer lock held by a running command). The
+    first caller pays the open; later accesses in the same invocation
+    reuse the objects, and the store is closed when the context unwinds.
+
+    Returns:
+        Tuple of (config, store, provenance)
+    """
+    obj = ctx.obj
+    if 'store' not in obj:
+        try:
+            config = load_config(obj['config_path'])
+            store = PipelineStore.from_config(config)
+            provenance = ProvenanceTracker.from_config(config)
+        except Exception as e:
+            click.echo(_fail(f"Failed to initialize pipeline resources: {e}"), err=True)
+            logger.exception("Evidence resource initialization failed")
+            ctx.exit(1)
+
+        obj['config'] = config
+        obj['store'] = store
+        obj['provenance'] = provenance
+        ctx.call_on_close(store.close)
+
+    return obj['config'], obj['store'], obj['provenance']
+
+
+def _shared_resources(ctx):
+    """Fetch the shared config/store/provenance, opening them on first use.
+
+    Echoes the standard "Config loaded" line so each subcommand's preamble
+    collapses to a single call.
+    """
+    resources = _open_resources(ctx)
+    click.echo(_ok(f"  Config loaded: {ctx.obj['config_path']}"))
+    return resources
+
+
+def _load_gene_universe(ctx, columns=None):
+    """Load the gene_universe table once per CLI invocation.
+
+    Evidence subcommands each need the gene universe; the store memoizes
+    per (table, columns), so chained invocations materialize each needed
+    projection of the ~20k-row table from DuckDB only once. Passing
+    columns limits the read to just those columns (columnar scan).
+
+    Returns:
+        gene_universe DataFrame, or None if the table doesn't exist
+    """
+    _, store, _ = _open_resources(ctx)
+    return store.load_dataframe('gene_universe', columns=columns)
+
+
 @click.group('evidence')
-def evidence():
+@click.pass_context
+def evidence(ctx):
     """Fetch and process evidence layer data.
 
     Evidence sources include constraint metrics (gnomAD), gene-disease
@@ -59,8 +157,12 @@ def evidence():
 
     Each evidence source follows the fetch -> transform -> load pattern
     with checkpoint-restart and provenance tracking.
+
+    Configuration, the DuckDB store, and provenance tracking are opened
+    lazily on first use (see _open_resources) and shared by subcommands
+    via the Click context, so chained invocations don't pay repeated
+    DuckDB open/close costs and '--help' has no side effects.
     """
-    pass
 
 
 @evidence.command('gnomad')
@@ -107,27 +209,15 @@ def gnomad(ctx, force, url, min_depth, min_cds_pct):
         # Use custom quality thresholds
         usher-pipeline evidence gnomad --min-depth 20 --min-cds-pct 0.8
     """
-    config_path = ctx.obj['config_path']
 
     click.echo(click.style("=== gnomAD Constraint Evidence ===", bold=True))
     click.echo()
 
-    store = None
     try:
-        # Load config
-        click.echo("Loading configuration...")
-        config = load_config(config_path)
-        click.echo(click.style(f"  Config loaded: {config_path}", fg='green'))
+        config, store, provenance = _shared_resources(ctx)
         click.echo(f"  gnomAD Version: {config.versions.gnomad_version}")
         click.echo()
 
-        # Initialize storage and provenance
-        click.echo("Initializing storage and provenance tracking...")
-        store = PipelineStore.from_config(config)
-        provenance = ProvenanceTracker.from_config(config)
-        click.echo(click.style("  Storage initialized", fg='green'))
-        click.echo()
-
         # Check checkpoint
         has_checkpoint = store.has_checkpoint('gnomad_constraint')
 
@@ -138,22 +228,24 @@ def gnomad(ctx, force, url, min_depth, min_cds_pct):
             ))
             click.echo()
 
-            # Load existing data for summary display
-            df = store.load_dataframe('gnomad_constraint')
-            if df is not None:
-                total_genes = len(df)
-                measured = df.filter(df['quality_flag'] == 'measured').height
-                incomplete = df.filter(df['quality_flag'] == 'incomplete_coverage').height
-                no_data = df.filter(df['quality_flag'] == 'no_data').height
-
-                click.echo(click.style("=== Summary ===", bold=True))
-                click.echo(f"Total Genes: {total_genes}")
-                click.echo(f"  Measured (good coverage): {measured}")
-                click.echo(f"  Incomplete coverage: {incomplete}")
-                click.echo(f"  No data: {no_data}")
-                click.echo(f"DuckDB Path: {config.duckdb_path}")
-                click.echo()
-                click.echo(click.style("Evidence layer ready (used existing checkpoint)", fg='green'))
+            # Summarize existing data with a single DuckDB aggregate
+            counts = store.count_by('gnomad_constraint', 'quality_flag')
+            if counts is not None:
+                total_genes = sum(counts.values())
+                measured = counts.get('measured', 0)
+                incomplete = counts.get('incomplete_coverage', 0)
+                no_data = counts.get('no_data', 0)
+
+                _echo_lines([
+                    _SUMMARY_HEADER,
+                    f"Total Genes: {total_genes}",
+                    f"  Measured (good coverage): {measured}",
+                    f"  Incomplete coverage: {incomplete}",
+                    f"  No data: {no_data}",
+                    f"DuckDB Path: {config.duckdb_path}",
+                    "",
+                    _CHECKPOINT_READY,
+                ])
                 return
 
         # Download gnomAD constraint metrics
@@ -161,7 +253,7 @@ def gnomad(ctx, force, url, min_depth, min_cds_pct):
         click.echo(f"  URL: {url}")
         click.echo(f"  Version: {config.versions.gnomad_version}")
 
-        gnomad_dir = Path(config.data_dir) / "gnomad"
+        gnomad_dir = config.data_dir / "gnomad"
         gnomad_dir.mkdir(parents=True, exist_ok=True)
         tsv_path = gnomad_dir / "constraint_metrics.tsv"
 
@@ -171,12 +263,9 @@ def gnomad(ctx, force, url, min_depth, min_cds_pct):
                 url=url,
                 force=force
             )
-            click.echo(click.style(
-                f"  Downloaded to: {tsv_path}",
-                fg='green'
-            ))
+            click.echo(_ok(f"  Downloaded to: {tsv_path}"))
         except Exception as e:
-            click.echo(click.style(f"  Error downloading: {e}", fg='red'), err=True)
+            click.echo(_fail(f"  Error downloading: {e}"), err=True)
             logger.exception("Failed to download gnomAD constraint metrics")
             sys.exit(1)
 
@@ -198,12 +287,9 @@ def gnomad(ctx, force, url, min_depth, min_cds_pct):
                 min_depth=min_depth,
                 min_cds_pct=min_cds_pct
             )
-            click.echo(click.style(
-                f"  Processed {len(df)} genes",
-                fg='green'
-            ))
+            click.echo(_ok(f"  Processed {df.height} genes"))
         except Exception as e:
-            click.echo(click.style(f"  Error processing: {e}", fg='red'), err=True)
+            click.echo(_fail(f"  Error processing: {e}"), err=True)
             logger.exception("Failed to process gnomAD constraint metrics")
             sys.exit(1)
 
@@ -211,7 +297,7 @@ def gnomad(ctx, force, url, min_depth, min_cds_pct):
         provenance.record_step('process_gnomad_constraint', {
             'min_depth': min_depth,
             'min_cds_pct': min_cds_pct,
-            'total_genes': len(df),
+            'total_genes': df.height,
         })
 
         # Load to DuckDB
@@ -224,12 +310,9 @@ def gnomad(ctx, force, url, min_depth, min_cds_pct):
                 provenance=provenance,
                 description=f"gnomAD {config.versions.gnomad_version} constraint metrics"
             )
-            click.echo(click.style(
-                f"  Saved to 'gnomad_constraint' table",
-                fg='green'
-            ))
+            click.echo(_ok(f"  Saved to 'gnomad_constraint' table"))
         except Exception as e:
-            click.echo(click.style(f"  Error loading: {e}", fg='red'), err=True)
+            click.echo(_fail(f"  Error loading: {e}"), err=True)
             logger.exception("Failed to load gnomAD constraint data to DuckDB")
             sys.exit(1)
 
@@ -239,16 +322,17 @@ def gnomad(ctx, force, url, min_depth, min_cds_pct):
         click.echo("Saving provenance metadata...")
         provenance_path = gnomad_dir / "constraint.provenance.json"
         provenance.save_sidecar(provenance_path)
-        click.echo(click.style(f"  Provenance saved: {provenance_path}", fg='green'))
+        click.echo(_ok(f"  Provenance saved: {provenance_path}"))
         click.echo()
 
-        # Display summary
-        measured = df.filter(df['quality_flag'] == 'measured').height
-        incomplete = df.filter(df['quality_flag'] == 'incomplete_coverage').height
-        no_data = df.filter(df['quality_flag'] == 'no_data').height
+        # Display summary (one aggregation pass instead of three scans)
+        counts = _category_counts(df, 'quality_flag')
+        measured = counts.get('measured', 0)
+        incomplete = counts.get('incomplete_coverage', 0)
+        no_data = counts.get('no_data', 0)
 
-        click.echo(click.style("=== Summary ===", bold=True))
-        click.echo(f"Total Genes: {len(df)}")
+        click.echo(_SUMMARY_HEADER)
+        click.echo(f"Total Genes: {df.height}")
         click.echo(f"  Measured (good coverage): {measured}")
         click.echo(f"  Incomplete coverage: {incomplete}")
         click.echo(f"  No data: {no_data}")
@@ -258,13 +342,9 @@ def gnomad(ctx, force, url, min_depth, min_cds_pct):
         click.echo(click.style("gnomAD evidence layer complete!", fg='green', bold=True))
 
     except Exception as e:
-        click.echo(click.style(f"Evidence command failed: {e}", fg='red'), err=True)
+        click.echo(_fail(f"Evidence command failed: {e}"), err=True)
         logger.exception("Evidence command failed")
         sys.exit(1)
-    finally:
-        # Clean up resources
-        if store is not None:
-            store.close()
 
 
 @evidence.command('annotation')
@@ -292,24 +372,12 @@ def annotation(ctx, force):
         # Force reprocessing
         usher-pipeline evidence annotation --force
     """
-    config_path = ctx.obj['config_path']
 
     click.echo(click.style("=== Annotation Completeness Evidence ===", bold=True))
     click.echo()
 
-    store = None
     try:
-        # Load config
-        click.echo("Loading configuration...")
-        config = load_config(config_path)
-        click.echo(click.style(f"  Config loaded: {config_path}", fg='green'))
-        click.echo()
-
-        # Initialize storage and provenance
-        click.echo("Initializing storage and provenance tracking...")
-        store = PipelineStore.from_config(config)
-        provenance = ProvenanceTracker.from_config(config)
-        click.echo(click.style("  Storage initialized", fg='green'))
+        config, store, provenance = _shared_resources(ctx)
         click.echo()
 
         # Check checkpoint
@@ -322,27 +390,29 @@ def annotation(ctx, force):
             ))
             click.echo()
 
-            # Load existing data for summary display
-            df = store.load_dataframe('annotation_completeness')
-            if df is not None:
-                total_genes = len(df)
-                well_annotated = df.filter(df['annotation_tier'] == 'well_annotated').height
-                partial = df.filter(df['annotation_tier'] == 'partially_annotated').height
-                poor = df.filter(df['annotation_tier'] == 'poorly_annotated').height
-
-                click.echo(click.style("=== Summary ===", bold=True))
-                click.echo(f"Total Genes: {total_genes}")
-                click.echo(f"  Well annotated: {well_annotated}")
-                click.echo(f"  Partially annotated: {partial}")
-                click.echo(f"  Poorly annotated: {poor}")
-                click.echo(f"DuckDB Path: {config.duckdb_path}")
-                click.echo()
-                click.echo(click.style("Evidence layer ready (used existing checkpoint)", fg='green'))
+            # Summarize existing data with a single DuckDB aggregate
+            counts = store.count_by('annotation_completeness', 'annotation_tier')
+            if counts is not None:
+                total_genes = sum(counts.values())
+                well_annotated = counts.get('well_annotated', 0)
+                partial = counts.get('partially_annotated', 0)
+                poor = counts.get('poorly_annotated', 0)
+
+                _echo_lines([
+                    _SUMMARY_HEADER,
+                    f"Total Genes: {total_genes}",
+                    f"  Well annotated: {well_annotated}",
+                    f"  Partially annotated: {partial}",
+                    f"  Poorly annotated: {poor}",
+                    f"DuckDB Path: {config.duckdb_path}",
+                    "",
+                    _CHECKPOINT_READY,
+                ])
                 return
 
         # Load gene universe (need gene_ids and uniprot mappings)
         click.echo("Loading gene universe from DuckDB...")
-        gene_universe = store.load_dataframe('gene_universe')
+        gene_universe = _load_gene_universe(ctx)
 
         if gene_universe is None or gene_universe.height == 0:
             click.echo(click.style(
@@ -351,15 +421,16 @@ def annotation(ctx, force):
             ), err=True)
             sys.exit(1)
 
-        gene_ids = gene_universe.select("gene_id").to_series().to_list()
-        uniprot_mapping = gene_universe.select(["gene_id", "uniprot_accession"]).filter(
-            gene_universe["uniprot_accession"].is_not_null()
+        # Pass the column as a Series — no Python list materialization
+        gene_ids = gene_universe["gene_id"]
+        # Project and null-filter inside DuckDB: only the two mapped
+        # columns' non-null rows cross into Python
+        uniprot_mapping = store.execute_query(
+            "SELECT gene_id, uniprot_accession FROM gene_universe "
+            "WHERE uniprot_accession IS NOT NULL"
         )
 
-        click.echo(click.style(
-            f"  Loaded {len(gene_ids)} genes ({uniprot_mapping.height} with UniProt mapping)",
-            fg='green'
-        ))
+        click.echo(_ok(f"  Loaded {len(gene_ids)} genes ({uniprot_mapping.height} with UniProt mapping)"))
         click.echo()
 
         # Process annotation evidence
@@ -371,24 +442,21 @@ def annotation(ctx, force):
                 gene_ids=gene_ids,
                 uniprot_mapping=uniprot_mapping
             )
-            click.echo(click.style(
-                f"  Processed {len(df)} genes",
-                fg='green'
-            ))
+            click.echo(_ok(f"  Processed {df.height} genes"))
         except Exception as e:
-            click.echo(click.style(f"  Error processing: {e}", fg='red'), err=True)
+            click.echo(_fail(f"  Error processing: {e}"), err=True)
             logger.exception("Failed to process annotation evidence")
             sys.exit(1)
 
         click.echo()
         provenance.record_step('process_annotation_evidence', {
-            'total_genes': len(df),
+            'total_genes': df.height,
         })
 
         # Load to DuckDB
         click.echo("Loading to DuckDB...")
 
-        annotation_dir = Path(config.data_dir) / "annotation"
+        annotation_dir = config.data_dir / "annotation"
         annotation_dir.mkdir(parents=True, exist_ok=True)
 
         try:
@@ -398,12 +466,9 @@ def annotation(ctx, force):
                 provenance=provenance,
                 description="Gene annotation completeness metrics from GO terms, UniProt scores, and pathway membership"
             )
-            click.echo(click.style(
-                f"  Saved to 'annotation_completeness' table",
-                fg='green'
-            ))
+            click.echo(_ok(f"  Saved to 'annotation_completeness' table"))
         except Exception as e:
-            click.echo(click.style(f"  Error loading: {e}", fg='red'), err=True)
+            click.echo(_fail(f"  Error loading: {e}"), err=True)
             logger.exception("Failed to load annotation data to DuckDB")
             sys.exit(1)
 
@@ -413,16 +478,17 @@ def annotation(ctx, force):
         click.echo("Saving provenance metadata...")
         provenance_path = annotation_dir / "completeness.provenance.json"
         provenance.save_sidecar(provenance_path)
-        click.echo(click.style(f"  Provenance saved: {provenance_path}", fg='green'))
+        click.echo(_ok(f"  Provenance saved: {provenance_path}"))
         click.echo()
 
-        # Display summary
-        well_annotated = df.filter(df['annotation_tier'] == 'well_annotated').height
-        partial = df.filter(df['annotation_tier'] == 'partially_annotated').height
-        poor = df.filter(df['annotation_tier'] == 'poorly_annotated').height
+        # Display summary (one aggregation pass instead of three scans)
+        counts = _category_counts(df, 'annotation_tier')
+        well_annotated = counts.get('well_annotated', 0)
+        partial = counts.get('partially_annotated', 0)
+        poor = counts.get('poorly_annotated', 0)
 
-        click.echo(click.style("=== Summary ===", bold=True))
-        click.echo(f"Total Genes: {len(df)}")
+        click.echo(_SUMMARY_HEADER)
+        click.echo(f"Total Genes: {df.height}")
         click.echo(f"  Well annotated: {well_annotated}")
         click.echo(f"  Partially annotated: {partial}")
         click.echo(f"  Poorly annotated: {poor}")
@@ -432,13 +498,9 @@ def annotation(ctx, force):
         click.echo(click.style("Annotation evidence layer complete!", fg='green', bold=True))
 
     except Exception as e:
-        click.echo(click.style(f"Evidence command failed: {e}", fg='red'), err=True)
+        click.echo(_fail(f"Evidence command failed: {e}"), err=True)
         logger.exception("Evidence command failed")
         sys.exit(1)
-    finally:
-        # Clean up resources
-        if store is not None:
-            store.close()
 
 
 @evidence.command('localization')
@@ -466,24 +528,12 @@ def localization(ctx, force):
         # Force re-download and reprocess
         usher-pipeline evidence localization --force
     """
-    config_path = ctx.obj['config_path']
 
     click.echo(click.style("=== Subcellular Localization Evidence ===", bold=True))
     click.echo()
 
-    store = None
     try:
-        # Load config
-        click.echo("Loading configuration...")
-        config = load_config(config_path)
-        click.echo(click.style(f"  Config loaded: {config_path}", fg='green'))
-        click.echo()
-
-        # Initialize storage and provenance
-        click.echo("Initializing storage and provenance tracking...")
-        store = PipelineStore.from_config(config)
-        provenance = ProvenanceTracker.from_config(config)
-        click.echo(click.style("  Storage initialized", fg='green'))
+        config, store, provenance = _shared_resources(ctx)
         click.echo()
 
         # Check checkpoint
@@ -496,29 +546,34 @@ def localization(ctx, force):
             ))
             click.echo()
 
-            # Load existing data for summary display
-            df = store.load_dataframe('subcellular_localization')
-            if df is not None:
-                total_genes = len(df)
-                experimental = df.filter(df['evidence_type'] == 'experimental').height
-                computational = df.filter(df['evidence_type'] == 'computational').height
-                both = df.filter(df['evidence_type'] == 'both').height
-                cilia_localized = df.filter(df['cilia_proximity_score'] > 0.5).height
-
-                click.echo(click.style("=== Summary ===", bold=True))
-                click.echo(f"Total Genes: {total_genes}")
-                click.echo(f"  Experimental evidence: {experimental}")
-                click.echo(f"  Computational evidence: {computational}")
-                click.echo(f"  Both: {both}")
-                click.echo(f"  Cilia-localized (proximity > 0.5): {cilia_localized}")
-                click.echo(f"DuckDB Path: {config.duckdb_path}")
-                click.echo()
-                click.echo(click.style("Evidence layer ready (used existing checkpoint)", fg='green'))
+            # Summarize existing data with DuckDB aggregates
+            counts = store.count_by('subcellular_localization', 'evidence_type')
+            if counts is not None:
+                total_genes = sum(counts.values())
+                experimental = counts.get('experimental', 0)
+                computational = counts.get('computational', 0)
+                both = counts.get('both', 0)
+                cilia_localized = store.conn.execute(
+                    "SELECT COUNT(*) FILTER (WHERE cilia_proximity_score > 0.5) "
+                    "FROM subcellular_localization"
+                ).fetchone()[0]
+
+                _echo_lines([
+                    _SUMMARY_HEADER,
+                    f"Total Genes: {total_genes}",
+                    f"  Experimental evidence: {experimental}",
+                    f"  Computational evidence: {computational}",
+                    f"  Both: {both}",
+                    f"  Cilia-localized (proximity > 0.5): {cilia_localized}",
+                    f"DuckDB Path: {config.duckdb_path}",
+                    "",
+                    _CHECKPOINT_READY,
+                ])
                 return
 
         # Load gene universe (need gene_ids and gene_symbol mapping)
         click.echo("Loading gene universe from DuckDB...")
-        gene_universe = store.load_dataframe('gene_universe')
+        gene_universe = _load_gene_universe(ctx)
 
         if gene_universe is None or gene_universe.height == 0:
             click.echo(click.style(
@@ -527,17 +582,15 @@ def localization(ctx, force):
             ), err=True)
             sys.exit(1)
 
-        gene_ids = gene_universe.select("gene_id").to_series().to_list()
+        # Pass the column as a Series — no Python list materialization
+        gene_ids = gene_universe["gene_id"]
         gene_symbol_map = gene_universe.select(["gene_id", "gene_symbol"])
 
-        click.echo(click.style(
-            f"  Loaded {len(gene_ids)} genes",
-            fg='green'
-        ))
+        click.echo(_ok(f"  Loaded {len(gene_ids)} genes"))
         click.echo()
 
         # Create localization data directory
-        localization_dir = Path(config.data_dir) / "localization"
+        localization_dir = config.data_dir / "localization"
         localization_dir.mkdir(parents=True, exist_ok=True)
 
         # Process localization evidence
@@ -552,18 +605,15 @@ def localization(ctx, force):
                 cache_dir=localization_dir,
                 force=force,
             )
-            click.echo(click.style(
-                f"  Processed {len(df)} genes",
-                fg='green'
-            ))
+            click.echo(_ok(f"  Processed {df.height} genes"))
         except Exception as e:
-            click.echo(click.style(f"  Error processing: {e}", fg='red'), err=True)
+            click.echo(_fail(f"  Error processing: {e}"), err=True)
             logger.exception("Failed to process localization evidence")
             sys.exit(1)
 
         click.echo()
         provenance.record_step('process_localization_evidence', {
-            'total_genes': len(df),
+            'total_genes': df.height,
         })
 
         # Load to DuckDB
@@ -576,12 +626,9 @@ def localization(ctx, force):
                 provenance=provenance,
                 description="HPA subcellular localization with cilia/centrosome proteomics cross-references"
             )
-            click.echo(click.style(
-                f"  Saved to 'subcellular_localization' table",
-                fg='green'
-            ))
+            click.echo(_ok(f"  Saved to 'subcellular_localization' table"))
         except Exception as e:
-            click.echo(click.style(f"  Error loading: {e}", fg='red'), err=True)
+            click.echo(_fail(f"  Error loading: {e}"), err=True)
             logger.exception("Failed to load localization data to DuckDB")
             sys.exit(1)
 
@@ -591,17 +638,18 @@ def localization(ctx, force):
         click.echo("Saving provenance metadata...")
         provenance_path = localization_dir / "subcellular.provenance.json"
         provenance.save_sidecar(provenance_path)
-        click.echo(click.style(f"  Provenance saved: {provenance_path}", fg='green'))
+        click.echo(_ok(f"  Provenance saved: {provenance_path}"))
         click.echo()
 
-        # Display summary
-        experimental = df.filter(df['evidence_type'] == 'experimental').height
-        computational = df.filter(df['evidence_type'] == 'computational').height
-        both = df.filter(df['evidence_type'] == 'both').height
-        cilia_localized = df.filter(df['cilia_proximity_score'] > 0.5).height
+        # Display summary (one aggregation pass instead of four scans)
+        counts = _category_counts(df, 'evidence_type')
+        experimental = counts.get('experimental', 0)
+        computational = counts.get('computational', 0)
+        both = counts.get('both', 0)
+        cilia_localized = df.select((pl.col('cilia_proximity_score') > 0.5).sum()).item()
 
-        click.echo(click.style("=== Summary ===", bold=True))
-        click.echo(f"Total Genes: {len(df)}")
+        click.echo(_SUMMARY_HEADER)
+        click.echo(f"Total Genes: {df.height}")
         click.echo(f"  Experimental evidence: {experimental}")
         click.echo(f"  Computational evidence: {computational}")
         click.echo(f"  Both: {both}")
@@ -612,13 +660,9 @@ def localization(ctx, force):
         click.echo(click.style("Localization evidence layer complete!", fg='green', bold=True))
 
     except Exception as e:
-        click.echo(click.style(f"Evidence command failed: {e}", fg='red'), err=True)
+        click.echo(_fail(f"Evidence command failed: {e}"), err=True)
         logger.exception("Evidence command failed")
         sys.exit(1)
-    finally:
-        # Clean up resources
-        if store is not None:
-            store.close()
 
 
 @evidence.command('protein')
@@ -646,24 +690,12 @@ def protein(ctx, force):
         # Force re-fetch and reprocess
         usher-pipeline evidence protein --force
     """
-    config_path = ctx.obj['config_path']
 
     click.echo(click.style("=== Protein Features Evidence ===", bold=True))
     click.echo()
 
-    store = None
     try:
-        # Load config
-        click.echo("Loading configuration...")
-        config = load_config(config_path)
-        click.echo(click.style(f"  Config loaded: {config_path}", fg='green'))
-        click.echo()
-
-        # Initialize storage and provenance
-        click.echo("Initializing storage and provenance tracking...")
-        store = PipelineStore.from_config(config)
-        provenance = ProvenanceTracker.from_config(config)
-        click.echo(click.style("  Storage initialized", fg='green'))
+        config, store, provenance = _shared_resources(ctx)
         click.echo()
 
         # Check checkpoint
@@ -676,29 +708,34 @@ def protein(ctx, force):
             ))
             click.echo()
 
-            # Load existing data for summary display
-            df = store.load_dataframe('protein_features')
-            if df is not None:
-                total_genes = len(df)
-                with_uniprot = df.filter(df['uniprot_id'].is_not_null()).height
-                cilia_domains = df.filter(df['has_cilia_domain'] == True).height
-                scaffold_domains = df.filter(df['scaffold_adaptor_domain'] == True).height
-                coiled_coils = df.filter(df['coiled_coil'] == True).height
-
-                click.echo(click.style("=== Summary ===", bold=True))
-                click.echo(f"Total Genes: {total_genes}")
-                click.echo(f"  With UniProt data: {with_uniprot}")
-                click.echo(f"  With cilia domains: {cilia_domains}")
-                click.echo(f"  With scaffold domains: {scaffold_domains}")
-                click.echo(f"  With coiled-coils: {coiled_coils}")
-                click.echo(f"DuckDB Path: {config.duckdb_path}")
-                click.echo()
-                click.echo(click.style("Evidence layer ready (used existing checkpoint)", fg='green'))
+            # Summarize existing data with a single DuckDB aggregate
+            row = store.conn.execute("""
+                SELECT COUNT(*),
+                       COUNT(uniprot_id),
+                       COUNT(*) FILTER (WHERE has_cilia_domain),
+                       COUNT(*) FILTER (WHERE scaffold_adaptor_domain),
+                       COUNT(*) FILTER (WHERE coiled_coil)
+                FROM protein_features
+            """).fetchone()
+            if row is not None:
+                total_genes, with_uniprot, cilia_domains, scaffold_domains, coiled_coils = row
+
+                _echo_lines([
+                    _SUMMARY_HEADER,
+                    f"Total Genes: {total_genes}",
+                    f"  With UniProt data: {with_uniprot}",
+                    f"  With cilia domains: {cilia_domains}",
+                    f"  With scaffold domains: {scaffold_domains}",
+                    f"  With coiled-coils: {coiled_coils}",
+                    f"DuckDB Path: {config.duckdb_path}",
+                    "",
+                    _CHECKPOINT_READY,
+                ])
                 return
 
         # Load gene universe for gene IDs and UniProt mappings
         click.echo("Loading gene universe...")
-        gene_universe = store.load_dataframe('gene_universe')
+        gene_universe = _load_gene_universe(ctx)
         if gene_universe is None:
             click.echo(click.style(
                 "Error: gene_universe not found. Run 'usher-pipeline setup gene-universe' first.",
@@ -706,11 +743,9 @@ def protein(ctx, force):
             ), err=True)
             sys.exit(1)
 
-        gene_ids = gene_universe.select("gene_id").to_series().to_list()
-        click.echo(click.style(
-            f"  Loaded {len(gene_ids)} genes from gene_universe",
-            fg='green'
-        ))
+        # Pass the column as a Series — no Python list materialization
+        gene_ids = gene_universe["gene_id"]
+        click.echo(_ok(f"  Loaded {len(gene_ids)} genes from gene_universe"))
         click.echo()
 
         # Process protein evidence
@@ -723,24 +758,21 @@ def protein(ctx, force):
                 gene_ids=gene_ids,
                 uniprot_mapping=gene_universe,
             )
-            click.echo(click.style(
-                f"  Processed {len(df)} genes",
-                fg='green'
-            ))
+            click.echo(_ok(f"  Processed {df.height} genes"))
         except Exception as e:
-            click.echo(click.style(f"  Error processing: {e}", fg='red'), err=True)
+            click.echo(_fail(f"  Error processing: {e}"), err=True)
             logger.exception("Failed to process protein features")
             sys.exit(1)
 
         click.echo()
         provenance.record_step('process_protein_features', {
-            'total_genes': len(df),
+            'total_genes': df.height,
         })
 
         # Load to DuckDB
         click.echo("Loading to DuckDB...")
 
-        protein_dir = Path(config.data_dir) / "protein"
+        protein_dir = config.data_dir / "protein"
         protein_dir.mkdir(parents=True, exist_ok=True)
 
         try:
@@ -750,12 +782,9 @@ def protein(ctx, force):
                 provenance=provenance,
                 description="Protein features from UniProt/InterPro with domain composition and cilia motif detection"
             )
-            click.echo(click.style(
-                f"  Saved to 'protein_features' table",
-                fg='green'
-            ))
+            click.echo(_ok(f"  Saved to 'protein_features' table"))
         except Exception as e:
-            click.echo(click.style(f"  Error loading: {e}", fg='red'), err=True)
+            click.echo(_fail(f"  Error loading: {e}"), err=True)
             logger.exception("Failed to load protein features to DuckDB")
             sys.exit(1)
 
@@ -765,17 +794,19 @@ def protein(ctx, force):
         click.echo("Saving provenance metadata...")
         provenance_path = protein_dir / "features.provenance.json"
         provenance.save_sidecar(provenance_path)
-        click.echo(click.style(f"  Provenance saved: {provenance_path}", fg='green'))
+        click.echo(_ok(f"  Provenance saved: {provenance_path}"))
         click.echo()
 
-        # Display summary
-        total_genes = len(df)
-        with_uniprot = df.filter(df['uniprot_id'].is_not_null()).height
-        cilia_domains = df.filter(df['has_cilia_domain'] == True).height
-        scaffold_domains = df.filter(df['scaffold_adaptor_domain'] == True).height
-        coiled_coils = df.filter(df['coiled_coil'] == True).height
+        # Display summary (one aggregation pass instead of four scans)
+        total_genes = df.height
+        with_uniprot, cilia_domains, scaffold_domains, coiled_coils = df.select([
+            pl.col('uniprot_id').is_not_null().sum(),
+            pl.col('has_cilia_domain').sum(),
+            pl.col('scaffold_adaptor_domain').sum(),
+            pl.col('coiled_coil').sum(),
+        ]).row(0)
 
-        click.echo(click.style("=== Summary ===", bold=True))
+        click.echo(_SUMMARY_HEADER)
         click.echo(f"Total Genes: {total_genes}")
         click.echo(f"  With UniProt data: {with_uniprot}")
         click.echo(f"  With cilia domains: {cilia_domains}")
@@ -787,13 +818,9 @@ def protein(ctx, force):
         click.echo(click.style("Protein evidence layer complete!", fg='green', bold=True))
 
     except Exception as e:
-        click.echo(click.style(f"Evidence command failed: {e}", fg='red'), err=True)
+        click.echo(_fail(f"Evidence command failed: {e}"), err=True)
         logger.exception("Evidence command failed")
         sys.exit(1)
-    finally:
-        # Clean up resources
-        if store is not None:
-            store.close()
 
 
 @evidence.command('animal-models')
@@ -821,24 +848,12 @@ def animal_models(ctx, force):
         # Force reprocessing
         usher-pipeline evidence animal-models --force
     """
-    config_path = ctx.obj['config_path']
 
     click.echo(click.style("=== Animal Model Phenotype Evidence ===", bold=True))
     click.echo()
 
-    store = None
     try:
-        # Load config
-        click.echo("Loading configuration...")
-        config = load_config(config_path)
-        click.echo(click.style(f"  Config loaded: {config_path}", fg='green'))
-        click.echo()
-
-        # Initialize storage and provenance
-        click.echo("Initializing storage and provenance tracking...")
-        store = PipelineStore.from_config(config)
-        provenance = ProvenanceTracker.from_config(config)
-        click.echo(click.style("  Storage initialized", fg='green'))
+        config, store, provenance = _shared_resources(ctx)
         click.echo()
 
         # Check checkpoint
@@ -851,27 +866,32 @@ def animal_models(ctx, force):
             ))
             click.echo()
 
-            # Load existing data for summary display
-            df = store.load_dataframe('animal_model_phenotypes')
-            if df is not None:
-                total_genes = len(df)
-                with_mouse = df.filter(df['mouse_ortholog'].is_not_null()).height
-                with_zebrafish = df.filter(df['zebrafish_ortholog'].is_not_null()).height
-                with_sensory = df.filter(df['sensory_phenotype_count'].is_not_null()).height
-
-                click.echo(click.style("=== Summary ===", bold=True))
-                click.echo(f"Total Genes: {total_genes}")
-                click.echo(f"  With mouse ortholog: {with_mouse}")
-                click.echo(f"  With zebrafish ortholog: {with_zebrafish}")
-                click.echo(f"  With sensory phenotypes: {with_sensory}")
-                click.echo(f"DuckDB Path: {config.duckdb_path}")
-                click.echo()
-                click.echo(click.style("Evidence layer ready (used existing checkpoint)", fg='green'))
+            # Summarize existing data with a single DuckDB aggregate
+            row = store.conn.execute("""
+                SELECT COUNT(*),
+                       COUNT(mouse_ortholog),
+                       COUNT(zebrafish_ortholog),
+                       COUNT(sensory_phenotype_count)
+                FROM animal_model_phenotypes
+            """).fetchone()
+            if row is not None:
+                total_genes, with_mouse, with_zebrafish, with_sensory = row
+
+                _echo_lines([
+                    _SUMMARY_HEADER,
+                    f"Total Genes: {total_genes}",
+                    f"  With mouse ortholog: {with_mouse}",
+                    f"  With zebrafish ortholog: {with_zebrafish}",
+                    f"  With sensory phenotypes: {with_sensory}",
+                    f"DuckDB Path: {config.duckdb_path}",
+                    "",
+                    _CHECKPOINT_READY,
+                ])
                 return
 
         # Load gene universe (need gene_ids)
         click.echo("Loading gene universe from DuckDB...")
-        gene_universe = store.load_dataframe('gene_universe')
+        gene_universe = _load_gene_universe(ctx, columns=['gene_id'])
 
         if gene_universe is None or gene_universe.height == 0:
             click.echo(click.style(
@@ -880,12 +900,10 @@ def animal_models(ctx, force):
             ), err=True)
             sys.exit(1)
 
-        gene_ids = gene_universe.select("gene_id").to_series().to_list()
+        # Hand the column over as a Series — no per-element Python boxing
+        gene_ids = gene_universe["gene_id"]
 
-        click.echo(click.style(
-            f"  Loaded {len(gene_ids)} genes",
-            fg='green'
-        ))
+        click.echo(_ok(f"  Loaded {len(gene_ids)} genes"))
         click.echo()
 
         # Process animal model evidence
@@ -893,25 +911,26 @@ def animal_models(ctx, force):
         click.echo("  This may take several minutes (HCOP, MGI, ZFIN, IMPC downloads)...")
 
         try:
-            df = process_animal_model_evidence(gene_ids=gene_ids)
-            click.echo(click.style(
-                f"  Processed {len(df)} genes",
-                fg='green'
-            ))
+            df = process_animal_model_evidence(
+                gene_ids=gene_ids,
+                cache_dir=config.data_dir / "animal_models",
+                force=force,
+            )
+            click.echo(_ok(f"  Processed {df.height} genes"))
         except Exception as e:
-            click.echo(click.style(f"  Error processing: {e}", fg='red'), err=True)
+            click.echo(_fail(f"  Error processing: {e}"), err=True)
             logger.exception("Failed to process animal model evidence")
             sys.exit(1)
 
         click.echo()
         provenance.record_step('process_animal_model_evidence', {
-            'total_genes': len(df),
+            'total_genes': df.height,
         })
 
         # Load to DuckDB
         click.echo("Loading to DuckDB...")
 
-        animal_models_dir = Path(config.data_dir) / "animal_models"
+        animal_models_dir = config.data_dir / "animal_models"
         animal_models_dir.mkdir(parents=True, exist_ok=True)
 
         try:
@@ -921,12 +940,9 @@ def animal_models(ctx, force):
                 provenance=provenance,
                 description="Animal model phenotypes from MGI, ZFIN, and IMPC with ortholog confidence scoring"
             )
-            click.echo(click.style(
-                f"  Saved to 'animal_model_phenotypes' table",
-                fg='green'
-            ))
+            click.echo(_ok(f"  Saved to 'animal_model_phenotypes' table"))
         except Exception as e:
-            click.echo(click.style(f"  Error loading: {e}", fg='red'), err=True)
+            click.echo(_fail(f"  Error loading: {e}"), err=True)
             logger.exception("Failed to load animal model data to DuckDB")
             sys.exit(1)
 
@@ -936,21 +952,27 @@ def animal_models(ctx, force):
         click.echo("Saving provenance metadata...")
         provenance_path = animal_models_dir / "phenotypes.provenance.json"
         provenance.save_sidecar(provenance_path)
-        click.echo(click.style(f"  Provenance saved: {provenance_path}", fg='green'))
+        click.echo(_ok(f"  Provenance saved: {provenance_path}"))
         click.echo()
 
         # Display summary
-        with_mouse = df.filter(df['mouse_ortholog'].is_not_null()).height
-        with_zebrafish = df.filter(df['zebrafish_ortholog'].is_not_null()).height
-        with_sensory = df.filter(df['sensory_phenotype_count'].is_not_null()).height
-
-        # Top scoring genes
-        top_genes = df.filter(df['animal_model_score_normalized'].is_not_null()).sort(
-            'animal_model_score_normalized', descending=True
-        ).head(10).select(['gene_id', 'sensory_phenotype_count', 'animal_model_score_normalized'])
+        with_mouse, with_zebrafish, with_sensory = df.select([
+            pl.col('mouse_ortholog').is_not_null().sum(),
+            pl.col('zebrafish_ortholog').is_not_null().sum(),
+            pl.col('sensory_phenotype_count').is_not_null().sum(),
+        ]).row(0)
+
+        # Top scoring genes — DuckDB top-N over the just-saved table beats a
+        # full Polars sort of the frame
+        top_genes = store.execute_query(
+            "SELECT gene_id, sensory_phenotype_count, animal_model_score_normalized "
+            "FROM animal_model_phenotypes "
+            "WHERE animal_model_score_normalized IS NOT NULL "
+            "ORDER BY animal_model_score_normalized DESC LIMIT 10"
+        )
 
-        click.echo(click.style("=== Summary ===", bold=True))
-        click.echo(f"Total Genes: {len(df)}")
+        click.echo(_SUMMARY_HEADER)
+        click.echo(f"Total Genes: {df.height}")
         click.echo(f"  With mouse ortholog: {with_mouse}")
         click.echo(f"  With zebrafish ortholog: {with_zebrafish}")
         click.echo(f"  With sensory phenotypes: {with_sensory}")
@@ -965,13 +987,9 @@ def animal_models(ctx, force):
         click.echo(click.style("Animal model evidence layer complete!", fg='green', bold=True))
 
     except Exception as e:
-        click.echo(click.style(f"Evidence command failed: {e}", fg='red'), err=True)
+        click.echo(_fail(f"Evidence command failed: {e}"), err=True)
         logger.exception("Evidence command failed")
         sys.exit(1)
-    finally:
-        # Clean up resources
-        if store is not None:
-            store.close()
 
 
 @evidence.command('literature')
@@ -1025,7 +1043,6 @@ def literature(ctx, force, email, api_key, batch_size):
         # Force restart from scratch
         usher-pipeline evidence literature --email you@example.com --api-key YOUR_KEY --force
     """
-    config_path = ctx.obj['config_path']
 
     click.echo(click.style("=== Literature Evidence (PubMed) ===", bold=True))
     click.echo()
@@ -1040,19 +1057,8 @@ def literature(ctx, force, email, api_key, batch_size):
         click.echo(click.style("  Get API key at: https://www.ncbi.nlm.nih.gov/account/settings/", fg='yellow'))
     click.echo()
 
-    store = None
     try:
-        # Load config
-        click.echo("Loading configuration...")
-        config = load_config(config_path)
-        click.echo(click.style(f"  Config loaded: {config_path}", fg='green'))
-        click.echo()
-
-        # Initialize storage and provenance
-        click.echo("Initializing storage and provenance tracking...")
-        store = PipelineStore.from_config(config)
-        provenance = ProvenanceTracker.from_config(config)
-        click.echo(click.style("  Storage initialized", fg='green'))
+        config, store, provenance = _shared_resources(ctx)
         click.echo()
 
         # Check checkpoint
@@ -1065,32 +1071,26 @@ def literature(ctx, force, email, api_key, batch_size):
             ))
             click.echo()
 
-            # Load existing data for summary display
-            df = store.load_dataframe('literature_evidence')
-            if df is not None:
-                total_genes = len(df)
-                tier_counts = (
-                    df.group_by("evidence_tier")
-                    .agg(pl.len().alias("count"))
-                    .sort("count", descending=True)
-                )
-
-                click.echo(click.style("=== Summary ===", bold=True))
-                click.echo(f"Total Genes: {total_genes}")
-                click.echo("Evidence Tier Distribution:")
-                for row in tier_counts.to_dicts():
-                    tier = row["evidence_tier"]
-                    count = row["count"]
-                    pct = (count / total_genes) * 100
-                    click.echo(f"  {tier}: {count} ({pct:.1f}%)")
-                click.echo(f"DuckDB Path: {config.duckdb_path}")
-                click.echo()
-                click.echo(click.style("Evidence layer ready (used existing checkpoint)", fg='green'))
+            # Summarize existing data with a single DuckDB aggregate; the
+            # window function computes percentages alongside the counts
+            tier_rows = store.conn.execute(_TIER_DISTRIBUTION_SQL).fetchall()
+            if tier_rows:
+                total_genes = sum(count for _, count, _ in tier_rows)
+
+                lines = [
+                    _SUMMARY_HEADER,
+                    f"Total Genes: {total_genes}",
+                    "Evidence Tier Distribution:",
+                ]
+                for tier, count, pct in tier_rows:
+                    lines.append(f"  {tier}: {count} ({pct:.1f}%)")
+                lines += [f"DuckDB Path: {config.duckdb_path}", "", _CHECKPOINT_READY]
+                _echo_lines(lines)
                 return
 
         # Load gene universe (need gene_ids and gene_symbols)
         click.echo("Loading gene universe from DuckDB...")
-        gene_universe = store.load_dataframe('gene_universe')
+        gene_universe = _load_gene_universe(ctx, columns=['gene_id', 'gene_symbol'])
 
         if gene_universe is None or gene_universe.height == 0:
             click.echo(click.style(
@@ -1099,20 +1099,20 @@ def literature(ctx, force, email, api_key, batch_size):
             ), err=True)
             sys.exit(1)
 
-        gene_ids = gene_universe.select("gene_id").to_series().to_list()
+        gene_ids = gene_universe["gene_id"]
         gene_symbol_map = gene_universe.select(["gene_id", "gene_symbol"]).filter(
             gene_universe["gene_symbol"].is_not_null()
         )
 
-        click.echo(click.style(
-            f"  Loaded {len(gene_ids)} genes ({gene_symbol_map.height} with symbols)",
-            fg='green'
-        ))
+        click.echo(_ok(f"  Loaded {len(gene_ids)} genes ({gene_symbol_map.height} with symbols)"))
         click.echo()
 
-        # Load partial checkpoint if exists (for resume after interrupt)
+        # Load partial checkpoint if exists (for resume after interrupt).
+        # --force restarts from scratch, so discard any stale partial state.
         partial_checkpoint = None
-        if store.has_checkpoint('literature_partial'):
+        if force:
+            store.delete_checkpoint('literature_partial')
+        elif store.has_checkpoint('literature_partial'):
             partial_checkpoint = store.load_dataframe('literature_partial')
             if partial_checkpoint is not None and partial_checkpoint.height > 0:
                 click.echo(click.style(
@@ -1122,20 +1122,22 @@ def literature(ctx, force, email, api_key, batch_size):
             else:
                 partial_checkpoint = None
 
-        # Define checkpoint callback to persist partial results to DuckDB
-        def save_partial_checkpoint(partial_df: pl.DataFrame):
+        # Define checkpoint callback to stream each fetched wave into DuckDB.
+        # Waves are appended so each checkpoint writes only batch_size rows
+        # instead of re-materializing everything fetched so far.
+        def save_partial_checkpoint(wave_df: pl.DataFrame):
             store.save_dataframe(
-                df=partial_df,
+                df=wave_df,
                 table_name="literature_partial",
                 description="Partial literature fetch checkpoint (in-progress)",
-                replace=True,
+                replace=not store.has_checkpoint('literature_partial'),
             )
 
         # Process literature evidence
         click.echo("Fetching and processing literature evidence from PubMed...")
         click.echo(f"  Email: {email}")
         click.echo(f"  Batch size: {batch_size} genes")
-        click.echo(f"  This will take several hours. Progress logged every 100 genes.")
+        click.echo(f"  This will take several hours. Progress logged once per batch.")
         click.echo()
 
         try:
@@ -1148,18 +1150,15 @@ def literature(ctx, force, email, api_key, batch_size):
                 checkpoint_df=partial_checkpoint,
                 checkpoint_callback=save_partial_checkpoint,
             )
-            click.echo(click.style(
-                f"  Processed {len(df)} genes",
-                fg='green'
-            ))
+            click.echo(_ok(f"  Processed {df.height} genes"))
         except Exception as e:
-            click.echo(click.style(f"  Error processing: {e}", fg='red'), err=True)
+            click.echo(_fail(f"  Error processing: {e}"), err=True)
             logger.exception("Failed to process literature evidence")
             sys.exit(1)
 
         click.echo()
         provenance.record_step('process_literature_evidence', {
-            'total_genes': len(df),
+            'total_genes': df.height,
             'email': email,
             'has_api_key': api_key is not None,
             'batch_size': batch_size,
@@ -1168,7 +1167,7 @@ def literature(ctx, force, email, api_key, batch_size):
         # Load to DuckDB
         click.echo("Loading to DuckDB...")
 
-        literature_dir = Path(config.data_dir) / "literature"
+        literature_dir = config.data_dir / "literature"
         literature_dir.mkdir(parents=True, exist_ok=True)
 
         try:
@@ -1180,16 +1179,12 @@ def literature(ctx, force, email, api_key, batch_size):
             )
             # Clean up partial checkpoint after successful full load
             try:
-                store.conn.execute("DROP TABLE IF EXISTS literature_partial")
-                store.conn.execute("DELETE FROM _checkpoints WHERE table_name = 'literature_partial'")
+                store.delete_checkpoint('literature_partial')
             except Exception:
                 pass  # Non-critical cleanup
-            click.echo(click.style(
-                f"  Saved to 'literature_evidence' table",
-                fg='green'
-            ))
+            click.echo(_ok(f"  Saved to 'literature_evidence' table"))
         except Exception as e:
-            click.echo(click.style(f"  Error loading: {e}", fg='red'), err=True)
+            click.echo(_fail(f"  Error loading: {e}"), err=True)
             logger.exception("Failed to load literature evidence to DuckDB")
             sys.exit(1)
 
@@ -1199,27 +1194,22 @@ def literature(ctx, force, email, api_key, batch_size):
         click.echo("Saving provenance metadata...")
         provenance_path = literature_dir / "pubmed.provenance.json"
         provenance.save_sidecar(provenance_path)
-        click.echo(click.style(f"  Provenance saved: {provenance_path}", fg='green'))
+        click.echo(_ok(f"  Provenance saved: {provenance_path}"))
         click.echo()
 
-        # Display summary
-        tier_counts = (
-            df.group_by("evidence_tier")
-            .agg(pl.len().alias("count"))
-            .sort("count", descending=True)
-        )
+        # Display summary from the just-saved table — one grouped aggregate
+        # with a window function gives counts and percentages together
+        tier_rows = store.conn.execute(_TIER_DISTRIBUTION_SQL).fetchall()
 
-        genes_with_evidence = df.filter(
-            df["evidence_tier"].is_in(["direct_experimental", "functional_mention", "hts_hit"])
-        ).height
+        genes_with_evidence = sum(
+            count for tier, count, _ in tier_rows
+            if tier in ("direct_experimental", "functional_mention", "hts_hit")
+        )
 
-        click.echo(click.style("=== Summary ===", bold=True))
-        click.echo(f"Total Genes: {len(df)}")
+        click.echo(_SUMMARY_HEADER)
+        click.echo(f"Total Genes: {df.height}")
         click.echo("Evidence Tier Distribution:")
-        for row in tier_counts.to_dicts():
-            tier = row["evidence_tier"]
-            count = row["count"]
-            pct = (count / len(df)) * 100
+        for tier, count, pct in tier_rows:
             click.echo(f"  {tier}: {count} ({pct:.1f}%)")
         click.echo()
         click.echo(f"Genes with Evidence (direct/functional/hts): {genes_with_evidence}")
@@ -1229,13 +1219,9 @@ def literature(ctx, force, email, api_key, batch_size):
         click.echo(click.style("Literature evidence layer complete!", fg='green', bold=True))
 
     except Exception as e:
-        click.echo(click.style(f"Evidence command failed: {e}", fg='red'), err=True)
+        click.echo(_fail(f"Evidence command failed: {e}"), err=True)
         logger.exception("Evidence command failed")
         sys.exit(1)
-    finally:
-        # Clean up resources
-        if store is not None:
-            store.close()
 
 
 @evidence.command('expression')
@@ -1275,24 +1261,12 @@ def expression_cmd(ctx, force, skip_cellxgene):
         # Force re-download and reprocess
         usher-pipeline evidence expression --force --skip-cellxgene
     """
-    config_path = ctx.obj['config_path']
 
     click.echo(click.style("=== Tissue Expression Evidence ===", bold=True))
     click.echo()
 
-    store = None
     try:
-        # Load config
-        click.echo("Loading configuration...")
-        config = load_config(config_path)
-        click.echo(click.style(f"  Config loaded: {config_path}", fg='green'))
-        click.echo()
-
-        # Initialize storage and provenance
-        click.echo("Initializing storage and provenance tracking...")
-        store = PipelineStore.from_config(config)
-        provenance = ProvenanceTracker.from_config(config)
-        click.echo(click.style("  Storage initialized", fg='green'))
+        config, store, provenance = _shared_resources(ctx)
         click.echo()
 
         # Check checkpoint
@@ -1305,31 +1279,34 @@ def expression_cmd(ctx, force, skip_cellxgene):
             ))
             click.echo()
 
-            # Load existing data for summary display
-            df = store.load_dataframe('tissue_expression')
-            if df is not None:
-                total_genes = len(df)
-                retina_expr = df.filter(
-                    df['hpa_retina_tpm'].is_not_null() |
-                    df['gtex_retina_tpm'].is_not_null() |
-                    df['cellxgene_photoreceptor_expr'].is_not_null()
-                ).height
-                inner_ear_expr = df.filter(df['cellxgene_hair_cell_expr'].is_not_null()).height
-                mean_tau = df.select('tau_specificity').mean().item()
-
-                click.echo(click.style("=== Summary ===", bold=True))
-                click.echo(f"Total Genes: {total_genes}")
-                click.echo(f"  With retina expression: {retina_expr}")
-                click.echo(f"  With inner ear expression: {inner_ear_expr}")
-                click.echo(f"  Mean Tau specificity: {mean_tau:.3f}" if mean_tau else "  Mean Tau specificity: N/A")
-                click.echo(f"DuckDB Path: {config.duckdb_path}")
-                click.echo()
-                click.echo(click.style("Evidence layer ready (used existing checkpoint)", fg='green'))
+            # Summarize existing data with a single DuckDB aggregate
+            row = store.conn.execute("""
+                SELECT COUNT(*),
+                       COUNT(*) FILTER (WHERE hpa_retina_tpm IS NOT NULL
+                                           OR gtex_retina_tpm IS NOT NULL
+                                           OR cellxgene_photoreceptor_expr IS NOT NULL),
+                       COUNT(cellxgene_hair_cell_expr),
+                       AVG(tau_specificity)
+                FROM tissue_expression
+            """).fetchone()
+            if row is not None:
+                total_genes, retina_expr, inner_ear_expr, mean_tau = row
+
+                _echo_lines([
+                    _SUMMARY_HEADER,
+                    f"Total Genes: {total_genes}",
+                    f"  With retina expression: {retina_expr}",
+                    f"  With inner ear expression: {inner_ear_expr}",
+                    f"  Mean Tau specificity: {mean_tau:.3f}" if mean_tau else "  Mean Tau specificity: N/A",
+                    f"DuckDB Path: {config.duckdb_path}",
+                    "",
+                    _CHECKPOINT_READY,
+                ])
                 return
 
-        # Load gene universe (need gene_ids)
+        # Load gene universe (need gene_ids plus symbols for the HPA merge)
         click.echo("Loading gene universe from DuckDB...")
-        gene_universe = store.load_dataframe('gene_universe')
+        gene_universe = _load_gene_universe(ctx, columns=['gene_id', 'gene_symbol'])
 
         if gene_universe is None or gene_universe.height == 0:
             click.echo(click.style(
@@ -1339,15 +1316,11 @@ def expression_cmd(ctx, force, skip_cellxgene):
             sys.exit(1)
 
         gene_ids = gene_universe.select("gene_id").to_series().to_list()
-
-        click.echo(click.style(
-            f"  Loaded {len(gene_ids)} genes",
-            fg='green'
-        ))
+        click.echo(_ok(f"  Loaded {len(gene_ids)} genes"))
         click.echo()
 
         # Create expression data directory
-        expression_dir = Path(config.data_dir) / "expression"
+        expression_dir = config.data_dir / "expression"
         expression_dir.mkdir(parents=True, exist_ok=True)
 
         # Process expression evidence
@@ -1370,18 +1343,15 @@ def expression_cmd(ctx, force, skip_cellxgene):
                 skip_cellxgene=skip_cellxgene,
                 gene_symbol_map=gene_symbol_map,
             )
-            click.echo(click.style(
-                f"  Processed {len(df)} genes",
-                fg='green'
-            ))
+            click.echo(_ok(f"  Processed {df.height} genes"))
         except Exception as e:
-            click.echo(click.style(f"  Error processing: {e}", fg='red'), err=True)
+            click.echo(_fail(f"  Error processing: {e}"), err=True)
             logger.exception("Failed to process expression evidence")
             sys.exit(1)
 
         click.echo()
         provenance.record_step('process_expression_evidence', {
-            'total_genes': len(df),
+            'total_genes': df.height,
             'skip_cellxgene': skip_cellxgene,
         })
 
@@ -1395,12 +1365,9 @@ def expression_cmd(ctx, force, skip_cellxgene):
                 provenance=provenance,
                 description="HPA, GTEx, and CellxGene tissue expression with Tau specificity and Usher enrichment scores"
             )
-            click.echo(click.style(
-                f"  Saved to 'tissue_expression' table",
-                fg='green'
-            ))
+            click.echo(_ok(f"  Saved to 'tissue_expression' table"))
         except Exception as e:
-            click.echo(click.style(f"  Error loading: {e}", fg='red'), err=True)
+            click.echo(_fail(f"  Error loading: {e}"), err=True)
             logger.exception("Failed to load expression evidence to DuckDB")
             sys.exit(1)
 
@@ -1410,7 +1377,7 @@ def expression_cmd(ctx, force, skip_cellxgene):
         click.echo("Saving provenance metadata...")
         provenance_path = expression_dir / "tissue.provenance.json"
         provenance.save_sidecar(provenance_path)
-        click.echo(click.style(f"  Provenance saved: {provenance_path}", fg='green'))
+        click.echo(_ok(f"  Provenance saved: {provenance_path}"))
         click.echo()
 
         # Display summary
@@ -1427,8 +1394,8 @@ def expression_cmd(ctx, force, skip_cellxgene):
             'usher_tissue_enrichment', descending=True
         ).head(10).select(['gene_id', 'usher_tissue_enrichment', 'tau_specificity', 'expression_score_normalized'])
 
-        click.echo(click.style("=== Summary ===", bold=True))
-        click.echo(f"Total Genes: {len(df)}")
+        click.echo(_SUMMARY_HEADER)
+        click.echo(f"Total Genes: {df.height}")
         click.echo(f"  With retina expression: {retina_expr}")
         click.echo(f"  With inner ear expression: {inner_ear_expr}")
         click.echo(f"  Mean Tau specificity: {mean_tau:.3f}" if mean_tau else "  Mean Tau specificity: N/A")
@@ -1445,10 +1412,189 @@ def expression_cmd(ctx, force, skip_cellxgene):
         click.echo(click.style("Expression evidence layer complete!", fg='green', bold=True))
 
     except Exception as e:
-        click.echo(click.style(f"Evidence command failed: {e}", fg='red'), err=True)
+        click.echo(_fail(f"Evidence command failed: {e}"), err=True)
         logger.exception("Evidence command failed")
         sys.exit(1)
-    finally:
-        # Clean up resources
-        if store is not None:
-            store.close()
+
+
+@evidence.command('all')
+@click.option(
+    '--force',
+    is_flag=True,
+    help='Re-fetch and reprocess sources even if checkpoints exist'
+)
+@click.option(
+    '--max-workers',
+    type=int,
+    default=6,
+    help='Maximum concurrent evidence fetches (default: 6)'
+)
+@click.option(
+    '--skip-cellxgene',
+    is_flag=True,
+    help='Skip the CellxGene fetch in the expression layer'
+)
+@click.pass_context
+def all_evidence(ctx, force, max_workers, skip_cellxgene):
+    """Run all evidence layers with their fetch phases overlapped.
+
+    The per-source fetch/transform work is network-bound and independent
+    once gene_universe exists, so it runs concurrently in a thread pool;
+    wall clock drops toward max(source times) instead of their sum.
+    DuckDB loads then run serially on the main thread to respect the
+    store's single-writer design.
+
+    The literature layer is excluded — it requires --email and runs for
+    hours; invoke 'usher-pipeline evidence literature' separately.
+    """
+    config, store, provenance = _open_resources(ctx)
+
+    click.echo(click.style("=== All Evidence Layers ===", bold=True))
+    click.echo()
+
+    gene_universe = _load_gene_universe(ctx)
+    if gene_universe is None or gene_universe.height == 0:
+        click.echo(_fail(
+            "Error: gene_universe table not found. Run 'usher-pipeline setup' first."
+        ), err=True)
+        sys.exit(1)
+
+    # Shared inputs are computed up front on the main thread — worker
+    # threads must not touch the single DuckDB connection concurrently
+    gene_ids = gene_universe["gene_id"]
+    gene_id_list = gene_ids.to_list()
+    gene_symbol_map = gene_universe.select(["gene_id", "gene_symbol"])
+    uniprot_mapping = store.execute_query(
+        "SELECT gene_id, uniprot_accession FROM gene_universe "
+        "WHERE uniprot_accession IS NOT NULL"
+    )
+
+    def _fetch_gnomad():
+        gnomad_dir = config.data_dir / "gnomad"
+        gnomad_dir.mkdir(parents=True, exist_ok=True)
+        tsv_path = download_constraint_metrics(
+            output_path=gnomad_dir / "constraint_metrics.tsv",
+            force=force,
+        )
+        return process_gnomad_constraint(tsv_path=tsv_path)
+
+    def _fetch_annotation():
+        return process_annotation_evidence(
+            gene_ids=gene_ids,
+            uniprot_mapping=uniprot_mapping,
+        )
+
+    def _fetch_localization():
+        localization_dir = config.data_dir / "localization"
+        localization_dir.mkdir(parents=True, exist_ok=True)
+        return process_localization_evidence(
+            gene_ids=gene_ids,
+            gene_symbol_map=gene_symbol_map,
+            cache_dir=localization_dir,
+            force=force,
+        )
+
+    def _fetch_protein():
+        return process_protein_evidence(
+            gene_ids=gene_ids,
+            uniprot_mapping=gene_universe,
+        )
+
+    def _fetch_animal_models():
+        return process_animal_model_evidence(
+            gene_ids=gene_ids,
+            cache_dir=config.data_dir / "animal_models",
+            force=force,
+        )
+
+    def _fetch_expression():
+        expression_dir = config.data_dir / "expression"
+        expression_dir.mkdir(parents=True, exist_ok=True)
+        return process_expression_evidence(
+            gene_ids=gene_id_list,
+            cache_dir=expression_dir,
+            force=force,
+            skip_cellxgene=skip_cellxgene,
+            gene_symbol_map=gene_symbol_map,
+        )
+
+    sources = [
+        ('gnomad', 'gnomad_constraint', _fetch_gnomad, gnomad_load_to_duckdb),
+        ('annotation', 'annotation_completeness', _fetch_annotation,
+         annotation_load_to_duckdb),
+        ('localization', 'subcellular_localization', _fetch_localization,
+         localization_load_to_duckdb),
+        ('protein', 'protein_features', _fetch_protein, protein_load_to_duckdb),
+        ('animal-models', 'animal_model_phenotypes', _fetch_animal_models,
+         animal_models_load_to_duckdb),
+        ('expression', 'tissue_expression', _fetch_expression,
+         expression_load_to_duckdb),
+    ]
+
+    to_run = []
+    for name, table, fetch_fn, load_fn in sources:
+        if store.has_checkpoint(table) and not force:
+            click.echo(click.style(
+                f"{name}: checkpoint exists, skipping (use --force to re-run)",
+                fg='yellow'
+            ))
+        else:
+            to_run.append((name, fetch_fn, load_fn))
+
+    if not to_run:
+        click.echo()
+        click.echo(_CHECKPOINT_READY)
+        return
+
+    click.echo(f"Fetching {len(to_run)} evidence layers concurrently...")
+    click.echo()
+
+    failures = []
+    results = {}
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(to_run))) as executor:
+        futures = {
+            executor.submit(fetch_fn): (name, load_fn)
+            for name, fetch_fn, load_fn in to_run
+        }
+        for future in as_completed(futures):
+            name, load_fn = futures[future]
+            try:
+                results[name] = future.result()
+                click.echo(_ok(f"  {name}: processed {len(results[name])} genes"))
+            except Exception as e:
+                failures.append(name)
+                click.echo(_fail(f"  {name}: {e}"), err=True)
+                logger.exception("Failed to process %s evidence", name)
+
+    # DuckDB loads run serially on the main thread (single-writer store)
+    click.echo()
+    click.echo("Loading to DuckDB...")
+    for name, fetch_fn, load_fn in to_run:
+        if name not in results:
+            continue
+        try:
+            load_fn(
+                df=results[name],
+                store=store,
+                provenance=provenance,
+                description="",
+            )
+            click.echo(_ok(f"  {name}: loaded"))
+        except Exception as e:
+            failures.append(name)
+            click.echo(_fail(f"  {name}: {e}"), err=True)
+            logger.exception("Failed to load %s evidence to DuckDB", name)
+
+    # Save one combined provenance sidecar for the batch run
+    click.echo()
+    provenance_path = config.data_dir / "evidence_all.provenance.json"
+    provenance.save_sidecar(provenance_path)
+    click.echo(_ok(f"Provenance saved: {provenance_path}"))
+
+    if failures:
+        click.echo(_fail(f"Completed with failures: {', '.join(failures)}"), err=True)
+        sys.exit(1)
+
+    click.echo()
+    click.echo(click.style("All evidence layers complete!", fg='green', bold=True))
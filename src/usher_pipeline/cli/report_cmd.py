@@ -8,8 +8,12 @@ Orchestrates the full output pipeline:
 - Creates reproducibility reports
 """
 
+import hashlib
 import logging
+import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import click
@@ -20,7 +24,7 @@ from usher_pipeline.output import (
     assign_tiers,
     add_evidence_summary,
     write_candidate_output,
-    generate_all_plots,
+    write_candidate_output_from_table,
     generate_reproducibility_report,
 )
 
@@ -79,10 +83,15 @@ logger = logging.getLogger(__name__)
     default=2,
     help='Minimum evidence layers for MEDIUM tier (default: 2)'
 )
+@click.option(
+    '--compress-tsv',
+    is_flag=True,
+    help='Write the TSV gzip-compressed (candidates.tsv.gz)'
+)
 @click.pass_context
 def report(ctx, output_dir, force, skip_viz, skip_report,
            high_threshold, medium_threshold, low_threshold,
-           min_evidence_high, min_evidence_medium):
+           min_evidence_high, min_evidence_medium, compress_tsv):
     """Generate tiered candidate lists with visualizations and reproducibility reports.
 
     Reads scored_genes from DuckDB, applies confidence tier classification,
@@ -145,13 +154,17 @@ def report(ctx, output_dir, force, skip_viz, skip_report,
 
         # Set output directory
         if output_dir is None:
-            output_dir = Path(config.data_dir) / "report"
+            output_dir = config.data_dir / "report"
 
+        # One makedirs covers the whole tree: creating plots/ also creates
+        # output_dir, so no later step needs its own mkdir
         output_dir = Path(output_dir)
-        output_dir.mkdir(parents=True, exist_ok=True)
+        plots_dir = output_dir / "plots"
+        os.makedirs(plots_dir if not skip_viz else output_dir, exist_ok=True)
 
         # Check for existing files
-        candidate_tsv = output_dir / "candidates.tsv"
+        tsv_name = "candidates.tsv.gz" if compress_tsv else "candidates.tsv"
+        candidate_tsv = output_dir / tsv_name
         candidate_parquet = output_dir / "candidates.parquet"
 
         if candidate_tsv.exists() and not force:
@@ -166,12 +179,21 @@ def report(ctx, output_dir, force, skip_viz, skip_report,
             click.echo()
             return
 
-        # Step 1: Load scored genes
+        # Step 1: Load scored genes. With --skip-viz --skip-report only
+        # aggregates may be needed, so the full load is deferred until a
+        # tier-cache miss proves the frame is actually required.
         click.echo(click.style("Step 1: Loading scored genes from DuckDB...", bold=True))
 
+        defer_load = skip_viz and skip_report
         try:
-            scored_df = store.load_dataframe('scored_genes')
-            total_scored = scored_df.height
+            if defer_load:
+                scored_df = None
+                total_scored = store.conn.execute(
+                    "SELECT COUNT(*) FROM scored_genes"
+                ).fetchone()[0]
+            else:
+                scored_df = store.load_dataframe('scored_genes')
+                total_scored = scored_df.height
             click.echo(click.style(
                 f"  Loaded {total_scored} scored genes",
                 fg='green'
@@ -208,28 +230,68 @@ def report(ctx, output_dir, force, skip_viz, skip_report,
         click.echo(f"  LOW:    score >= {low_threshold}")
         click.echo()
 
-        # Step 3: Apply tiering
-        click.echo(click.style("Step 3: Applying tier classification...", bold=True))
-
-        try:
-            tiered_df = assign_tiers(scored_df, thresholds=tier_thresholds)
-
-            # Count tiers
-            high_count = tiered_df.filter(tiered_df['confidence_tier'] == 'HIGH').height
-            medium_count = tiered_df.filter(tiered_df['confidence_tier'] == 'MEDIUM').height
-            low_count = tiered_df.filter(tiered_df['confidence_tier'] == 'LOW').height
-            total_candidates = tiered_df.height
-
+        # Tier cache key: scored_genes checkpoint timestamp + thresholds.
+        # If neither changed since the last report run, the tiered table in
+        # DuckDB is still valid and Steps 3-4 can be skipped.
+        scored_meta = store.conn.execute(
+            "SELECT created_at FROM _checkpoints WHERE table_name = 'scored_genes'"
+        ).fetchone()
+        tier_key = hashlib.blake2b(
+            f"{scored_meta[0]}:{sorted(tier_thresholds.items())}".encode(),
+            digest_size=16,
+        ).hexdigest()
+
+        cached_meta = store.conn.execute(
+            "SELECT description FROM _checkpoints WHERE table_name = 'tiered_candidates'"
+        ).fetchone()
+        tier_cache_hit = (
+            not force
+            and cached_meta is not None
+            and cached_meta[0] == f"tier_key={tier_key}"
+        )
+
+        # With a cache hit and both --skip-viz and --skip-report, nothing
+        # downstream needs the frame in Python: outputs are copied straight
+        # from the DuckDB table and the summary uses SQL aggregates.
+        fast_path = tier_cache_hit and skip_viz and skip_report
+
+        if tier_cache_hit:
+            # Steps 3-4 cached: reload tiered candidates from DuckDB
             click.echo(click.style(
-                f"  Classified into tiers: HIGH={high_count}, MEDIUM={medium_count}, LOW={low_count}",
-                fg='green'
+                "Steps 3-4: Reusing cached tier classification (same scores and thresholds)...",
+                bold=True
             ))
-            click.echo(f"  Total candidates: {total_candidates} (from {total_scored} scored genes)")
-        except Exception as e:
-            click.echo(click.style(f"  Error applying tiers: {e}", fg='red'), err=True)
-            logger.exception("Failed to apply tier classification")
-            sys.exit(1)
+            tiered_df = None if fast_path else store.load_dataframe('tiered_candidates')
+        else:
+            # Step 3: Apply tiering
+            click.echo(click.style("Step 3: Applying tier classification...", bold=True))
 
+            try:
+                if scored_df is None:
+                    # Deferred load: the cache missed, so the frame is needed
+                    scored_df = store.load_dataframe('scored_genes')
+                tiered_df = assign_tiers(scored_df, thresholds=tier_thresholds)
+            except Exception as e:
+                click.echo(click.style(f"  Error applying tiers: {e}", fg='red'), err=True)
+                logger.exception("Failed to apply tier classification")
+                sys.exit(1)
+
+        # Count tiers in one grouped pass instead of a scan per tier
+        if fast_path:
+            tier_counts = store.count_by('tiered_candidates', 'confidence_tier')
+            total_candidates = sum(tier_counts.values())
+        else:
+            tier_counts = dict(tiered_df.group_by('confidence_tier').len().iter_rows())
+            total_candidates = tiered_df.height
+        high_count = tier_counts.get('HIGH', 0)
+        medium_count = tier_counts.get('MEDIUM', 0)
+        low_count = tier_counts.get('LOW', 0)
+
+        click.echo(click.style(
+            f"  Classified into tiers: HIGH={high_count}, MEDIUM={medium_count}, LOW={low_count}",
+            fg='green'
+        ))
+        click.echo(f"  Total candidates: {total_candidates} (from {total_scored} scored genes)")
         click.echo()
         provenance.record_step('apply_tier_classification', {
             'total_candidates': total_candidates,
@@ -237,33 +299,72 @@ def report(ctx, output_dir, force, skip_viz, skip_report,
             'medium_count': medium_count,
             'low_count': low_count,
             'excluded_count': total_scored - total_candidates,
+            'from_cache': tier_cache_hit,
         })
 
-        # Step 4: Add evidence summary
-        click.echo(click.style("Step 4: Adding evidence summary...", bold=True))
+        if not tier_cache_hit:
+            # Step 4: Add evidence summary
+            click.echo(click.style("Step 4: Adding evidence summary...", bold=True))
 
-        try:
-            tiered_df = add_evidence_summary(tiered_df)
-            click.echo(click.style(
-                "  Added supporting_layers and evidence_gaps columns",
-                fg='green'
-            ))
-        except Exception as e:
-            click.echo(click.style(f"  Error adding evidence summary: {e}", fg='red'), err=True)
-            logger.exception("Failed to add evidence summary")
-            sys.exit(1)
+            try:
+                tiered_df = add_evidence_summary(tiered_df)
+                click.echo(click.style(
+                    "  Added supporting_layers and evidence_gaps columns",
+                    fg='green'
+                ))
+            except Exception as e:
+                click.echo(click.style(f"  Error adding evidence summary: {e}", fg='red'), err=True)
+                logger.exception("Failed to add evidence summary")
+                sys.exit(1)
+
+            # Checkpoint the tiered frame so identical reruns skip Steps 3-4
+            store.save_dataframe(
+                df=tiered_df,
+                table_name='tiered_candidates',
+                description=f"tier_key={tier_key}",
+            )
 
         click.echo()
 
+        # Kick off plot rendering before Step 5: the TSV/Parquet write is
+        # disk-bound and the matplotlib render is CPU-bound, so the two
+        # overlap. Results are collected when Step 6 joins the thread.
+        plot_thread = None
+        plot_paths: dict = {}
+        plot_errors: list = []
+        if not skip_viz:
+            # Deferred so --skip-viz runs never import matplotlib
+            from usher_pipeline.output import generate_all_plots
+
+            def _render_plots():
+                try:
+                    plot_paths.update(generate_all_plots(tiered_df, plots_dir))
+                except Exception as e:
+                    plot_errors.append(e)
+
+            plot_thread = threading.Thread(target=_render_plots, name="plot-render")
+            plot_thread.start()
+
         # Step 5: Write dual-format output
         click.echo(click.style("Step 5: Writing candidate output...", bold=True))
 
         try:
-            output_paths = write_candidate_output(
-                tiered_df,
-                output_dir=output_dir,
-                filename_base="candidates"
-            )
+            if fast_path:
+                output_paths = write_candidate_output_from_table(
+                    store.conn,
+                    'tiered_candidates',
+                    output_dir=output_dir,
+                    filename_base="candidates",
+                    compress_tsv=compress_tsv,
+                )
+            else:
+                output_paths = write_candidate_output(
+                    tiered_df,
+                    output_dir=output_dir,
+                    filename_base="candidates",
+                    compress_tsv=compress_tsv,
+                    conn=store.conn,
+                )
 
             click.echo(click.style(
                 f"  TSV:        {output_paths['tsv']}",
@@ -289,29 +390,28 @@ def report(ctx, output_dir, force, skip_viz, skip_report,
             'parquet_path': str(output_paths['parquet']),
         })
 
-        # Step 6: Generate visualizations (unless --skip-viz)
+        # Step 6: Collect visualizations started before Step 5 (unless --skip-viz)
         if not skip_viz:
             click.echo(click.style("Step 6: Generating visualizations...", bold=True))
 
-            plots_dir = output_dir / "plots"
-            plots_dir.mkdir(parents=True, exist_ok=True)
-
-            try:
-                plot_paths = generate_all_plots(tiered_df, plots_dir)
+            plot_thread.join()
 
-                for plot_name, plot_path in plot_paths.items():
-                    click.echo(click.style(
-                        f"  {plot_name}: {plot_path}",
-                        fg='green'
-                    ))
-            except Exception as e:
-                click.echo(click.style(f"  Warning: Visualization generation failed: {e}", fg='yellow'))
-                logger.exception("Failed to generate visualizations")
+            if plot_errors:
+                click.echo(click.style(
+                    f"  Warning: Visualization generation failed: {plot_errors[0]}",
+                    fg='yellow'
+                ))
+                logger.error("Failed to generate visualizations", exc_info=plot_errors[0])
+            for plot_name, plot_path in plot_paths.items():
+                click.echo(click.style(
+                    f"  {plot_name}: {plot_path}",
+                    fg='green'
+                ))
 
             click.echo()
             provenance.record_step('generate_visualizations', {
                 'plots_dir': str(plots_dir),
-                'plot_count': len(plot_paths) if 'plot_paths' in locals() else 0,
+                'plot_count': len(plot_paths),
             })
         else:
             click.echo(click.style("Step 6: Skipping visualizations (--skip-viz)", fg='yellow'))
@@ -322,14 +422,12 @@ def report(ctx, output_dir, force, skip_viz, skip_report,
             click.echo(click.style("Step 7: Creating reproducibility report...", bold=True))
 
             try:
-                # Try to load validation result if available
+                # Try to load validation result if available — only the
+                # first row is needed, so LIMIT 1 stays inside DuckDB
                 validation_result = None
                 if store.has_checkpoint('validation_results'):
                     try:
-                        validation_df = store.load_dataframe('validation_results')
-                        if validation_df is not None and validation_df.height > 0:
-                            # Convert to dict for report
-                            validation_result = validation_df.to_dicts()[0]
+                        validation_result = store.fetch_one('validation_results')
                     except Exception:
                         logger.debug("Could not load validation results, continuing without")
 
@@ -341,19 +439,18 @@ def report(ctx, output_dir, force, skip_viz, skip_report,
                     validation_result=validation_result
                 )
 
-                # Write JSON format
+                # JSON and Markdown are independent serializations of the
+                # same object — write them concurrently
                 json_path = output_dir / "reproducibility.json"
-                report_obj.to_json(json_path)
-                click.echo(click.style(
-                    f"  JSON:     {json_path}",
-                    fg='green'
-                ))
-
-                # Write Markdown format
                 md_path = output_dir / "reproducibility.md"
-                report_obj.to_markdown(md_path)
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    json_future = executor.submit(report_obj.to_json, json_path)
+                    md_future = executor.submit(report_obj.to_markdown, md_path)
+                    json_future.result()
+                    md_future.result()
+
                 click.echo(click.style(
-                    f"  Markdown: {md_path}",
+                    f"  JSON:     {json_path}\n  Markdown: {md_path}",
                     fg='green'
                 ))
 
@@ -377,28 +474,31 @@ def report(ctx, output_dir, force, skip_viz, skip_report,
         click.echo(click.style(f"  Provenance saved: {provenance_path}", fg='green'))
         click.echo()
 
-        # Display final summary
-        click.echo(click.style("=== Final Summary ===", bold=True))
-        click.echo(f"Output Directory: {output_dir}")
-        click.echo()
-        click.echo("Tier Distribution:")
-        click.echo(f"  HIGH:   {high_count} candidates")
-        click.echo(f"  MEDIUM: {medium_count} candidates")
-        click.echo(f"  LOW:    {low_count} candidates")
-        click.echo(f"  Total:  {total_candidates} candidates (from {total_scored} scored genes)")
-        click.echo()
-        click.echo("Output Files:")
-        click.echo(f"  candidates.tsv")
-        click.echo(f"  candidates.parquet")
-        click.echo(f"  candidates.provenance.yaml")
+        # Display final summary — assembled once, flushed in one write
+        output_files = [tsv_name, "candidates.parquet", "candidates.provenance.yaml"]
         if not skip_viz:
-            click.echo(f"  plots/score_distribution.png")
-            click.echo(f"  plots/layer_contributions.png")
-            click.echo(f"  plots/tier_breakdown.png")
+            output_files += [
+                "plots/score_distribution.png",
+                "plots/layer_contributions.png",
+                "plots/tier_breakdown.png",
+            ]
         if not skip_report:
-            click.echo(f"  reproducibility.json")
-            click.echo(f"  reproducibility.md")
-        click.echo()
+            output_files += ["reproducibility.json", "reproducibility.md"]
+
+        click.echo(click.style("=== Final Summary ===", bold=True))
+        click.echo("\n".join([
+            f"Output Directory: {output_dir}",
+            "",
+            "Tier Distribution:",
+            f"  HIGH:   {high_count} candidates",
+            f"  MEDIUM: {medium_count} candidates",
+            f"  LOW:    {low_count} candidates",
+            f"  Total:  {total_candidates} candidates (from {total_scored} scored genes)",
+            "",
+            "Output Files:",
+            *(f"  {name}" for name in output_files),
+            "",
+        ]))
         click.echo(click.style("Report generation complete!", fg='green', bold=True))
 
     except Exception as e:
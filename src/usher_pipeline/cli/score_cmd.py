@@ -12,6 +12,7 @@ import sys
 from pathlib import Path
 
 import click
+import polars as pl
 import structlog
 
 from usher_pipeline.config.loader import load_config
@@ -27,6 +28,19 @@ from usher_pipeline.scoring import (
 
 logger = logging.getLogger(__name__)
 
+# All summary figures in one DuckDB scan: conditional aggregates fill the
+# quality-flag histogram alongside the totals, so no per-flag passes
+_SCORED_SUMMARY_SQL = """
+    SELECT COUNT(*),
+           COUNT(composite_score),
+           AVG(composite_score),
+           COUNT(*) FILTER (WHERE quality_flag = 'sufficient_evidence'),
+           COUNT(*) FILTER (WHERE quality_flag = 'moderate_evidence'),
+           COUNT(*) FILTER (WHERE quality_flag = 'sparse_evidence'),
+           COUNT(*) FILTER (WHERE quality_flag = 'no_evidence')
+    FROM scored_genes
+"""
+
 
 @click.command('score')
 @click.option(
@@ -103,32 +117,28 @@ def score(ctx, force, skip_qc, skip_validation):
             ))
             click.echo()
 
-            # Load existing data for summary display
-            df = store.load_dataframe('scored_genes')
-            if df is not None:
-                total_genes = df.height
-                genes_with_score = df.filter(df['composite_score'].is_not_null()).height
-                mean_score = df.filter(df['composite_score'].is_not_null())['composite_score'].mean()
-
-                # Quality flag distribution
-                sufficient = df.filter(df['quality_flag'] == 'sufficient_evidence').height
-                moderate = df.filter(df['quality_flag'] == 'moderate_evidence').height
-                sparse = df.filter(df['quality_flag'] == 'sparse_evidence').height
-                no_evidence = df.filter(df['quality_flag'] == 'no_evidence').height
+            # Summarize in DuckDB — seven aggregates over two columns
+            # instead of materializing the whole table into Python
+            summary = store.conn.execute(_SCORED_SUMMARY_SQL).fetchone()
+            if summary is not None:
+                (total_genes, genes_with_score, mean_score,
+                 sufficient, moderate, sparse, no_evidence) = summary
 
                 click.echo(click.style("=== Summary ===", bold=True))
-                click.echo(f"Total Genes: {total_genes}")
-                click.echo(f"Genes with scores: {genes_with_score}")
-                click.echo(f"Mean composite score: {mean_score:.4f}")
-                click.echo()
-                click.echo("Quality Flag Distribution:")
-                click.echo(f"  Sufficient evidence (>=4 layers): {sufficient}")
-                click.echo(f"  Moderate evidence (2-3 layers): {moderate}")
-                click.echo(f"  Sparse evidence (1 layer): {sparse}")
-                click.echo(f"  No evidence: {no_evidence}")
-                click.echo()
-                click.echo(f"DuckDB Path: {config.duckdb_path}")
-                click.echo()
+                click.echo("\n".join([
+                    f"Total Genes: {total_genes}",
+                    f"Genes with scores: {genes_with_score}",
+                    f"Mean composite score: {mean_score:.4f}",
+                    "",
+                    "Quality Flag Distribution:",
+                    f"  Sufficient evidence (>=4 layers): {sufficient}",
+                    f"  Moderate evidence (2-3 layers): {moderate}",
+                    f"  Sparse evidence (1 layer): {sparse}",
+                    f"  No evidence: {no_evidence}",
+                    "",
+                    f"DuckDB Path: {config.duckdb_path}",
+                    "",
+                ]))
                 click.echo(click.style("Scoring complete (used existing checkpoint)", fg='green'))
                 return
 
@@ -178,8 +188,10 @@ def score(ctx, force, skip_qc, skip_validation):
         try:
             scored_df = compute_composite_scores(store, scoring_weights)
             total_genes = scored_df.height
-            genes_with_score = scored_df.filter(scored_df['composite_score'].is_not_null()).height
-            mean_score = scored_df.filter(scored_df['composite_score'].is_not_null())['composite_score'].mean()
+            genes_with_score, mean_score = scored_df.select([
+                pl.col('composite_score').is_not_null().sum(),
+                pl.col('composite_score').mean(),
+            ]).row(0)
 
             click.echo(click.style(
                 f"  Scored {genes_with_score}/{total_genes} genes (mean: {mean_score:.4f})",
@@ -229,27 +241,32 @@ def score(ctx, force, skip_qc, skip_validation):
             try:
                 qc_result = run_qc_checks(store)
 
-                # Display warnings
+                # Display warnings (styled once, emitted in one write)
                 if qc_result.get('warnings'):
-                    click.echo(click.style("  Warnings:", fg='yellow'))
-                    for warning in qc_result['warnings']:
-                        click.echo(click.style(f"    - {warning}", fg='yellow'))
+                    click.echo(click.style("\n".join(
+                        ["  Warnings:"]
+                        + [f"    - {w}" for w in qc_result['warnings']]
+                    ), fg='yellow'))
 
                 # Display errors
                 if qc_result.get('errors'):
-                    click.echo(click.style("  Errors:", fg='red'))
-                    for error in qc_result['errors']:
-                        click.echo(click.style(f"    - {error}", fg='red'))
+                    click.echo(click.style("\n".join(
+                        ["  Errors:"]
+                        + [f"    - {e}" for e in qc_result['errors']]
+                    ), fg='red'))
                     qc_passed = False
                 else:
                     click.echo(click.style("  All QC checks passed", fg='green'))
 
                 # Display missing data rates
                 if 'missing_data_rates' in qc_result:
-                    click.echo()
-                    click.echo("  Missing data rates by layer:")
-                    for layer, rate in qc_result['missing_data_rates'].items():
-                        click.echo(f"    {layer}: {rate:.1%}")
+                    click.echo("\n".join(
+                        ["", "  Missing data rates by layer:"]
+                        + [
+                            f"    {layer}: {rate:.1%}"
+                            for layer, rate in qc_result['missing_data_rates'].items()
+                        ]
+                    ))
 
             except Exception as e:
                 click.echo(click.style(f"  Error running QC: {e}", fg='red'), err=True)
@@ -299,36 +316,37 @@ def score(ctx, force, skip_qc, skip_validation):
 
         # Save provenance sidecar
         click.echo("Saving provenance metadata...")
-        scoring_dir = Path(config.data_dir) / "scoring"
-        scoring_dir.mkdir(parents=True, exist_ok=True)
-        provenance_path = scoring_dir / "scoring.provenance.json"
+        # save_sidecar creates parent directories itself
+        provenance_path = config.data_dir / "scoring" / "scoring.provenance.json"
         provenance.save_sidecar(provenance_path)
         click.echo(click.style(f"  Provenance saved: {provenance_path}", fg='green'))
         click.echo()
 
-        # Display final summary
-        sufficient = scored_df.filter(scored_df['quality_flag'] == 'sufficient_evidence').height
-        moderate = scored_df.filter(scored_df['quality_flag'] == 'moderate_evidence').height
-        sparse = scored_df.filter(scored_df['quality_flag'] == 'sparse_evidence').height
-        no_evidence = scored_df.filter(scored_df['quality_flag'] == 'no_evidence').height
+        # Display final summary — the persisted table is summarized in the
+        # same single DuckDB scan used on the checkpoint path
+        (_, _, _, sufficient, moderate, sparse, no_evidence) = (
+            store.conn.execute(_SCORED_SUMMARY_SQL).fetchone()
+        )
 
         click.echo(click.style("=== Final Summary ===", bold=True))
-        click.echo(f"Total Genes: {total_genes}")
-        click.echo(f"Genes with scores: {genes_with_score} ({genes_with_score / total_genes * 100:.1f}%)")
-        click.echo(f"Mean composite score: {mean_score:.4f}")
-        click.echo()
-        click.echo("Quality Flag Distribution:")
-        click.echo(f"  Sufficient evidence (>=4 layers): {sufficient}")
-        click.echo(f"  Moderate evidence (2-3 layers): {moderate}")
-        click.echo(f"  Sparse evidence (1 layer): {sparse}")
-        click.echo(f"  No evidence: {no_evidence}")
-        click.echo()
-        click.echo(f"QC Status: {'PASS' if qc_passed else 'FAIL'}")
-        click.echo(f"Validation Status: {'PASS' if validation_passed or skip_validation else 'FAIL'}")
-        click.echo()
-        click.echo(f"DuckDB Path: {config.duckdb_path}")
-        click.echo(f"Provenance: {provenance_path}")
-        click.echo()
+        click.echo("\n".join([
+            f"Total Genes: {total_genes}",
+            f"Genes with scores: {genes_with_score} ({genes_with_score / total_genes * 100:.1f}%)",
+            f"Mean composite score: {mean_score:.4f}",
+            "",
+            "Quality Flag Distribution:",
+            f"  Sufficient evidence (>=4 layers): {sufficient}",
+            f"  Moderate evidence (2-3 layers): {moderate}",
+            f"  Sparse evidence (1 layer): {sparse}",
+            f"  No evidence: {no_evidence}",
+            "",
+            f"QC Status: {'PASS' if qc_passed else 'FAIL'}",
+            f"Validation Status: {'PASS' if validation_passed or skip_validation else 'FAIL'}",
+            "",
+            f"DuckDB Path: {config.duckdb_path}",
+            f"Provenance: {provenance_path}",
+            "",
+        ]))
         click.echo(click.style("Scoring pipeline complete!", fg='green', bold=True))
 
     except Exception as e:
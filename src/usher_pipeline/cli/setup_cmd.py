@@ -15,19 +15,20 @@ import sys
 from pathlib import Path
 
 import click
-import polars as pl
-
-from usher_pipeline.config.loader import load_config
-from usher_pipeline.gene_mapping import (
-    fetch_protein_coding_genes,
-    validate_gene_universe,
-    GeneMapper,
-    MappingValidator,
-)
-from usher_pipeline.persistence import PipelineStore, ProvenanceTracker
 
 logger = logging.getLogger(__name__)
 
+# Raw ANSI fragments for the per-message validation loops, built once
+# instead of calling click.style per line. click.echo still strips the
+# codes when stdout is not a terminal, so output matches click.style.
+_RED = "\033[31m"
+_YELLOW = "\033[33m"
+_RESET = "\033[0m"
+
+# Constant banners styled once at import instead of per invocation
+_BANNER_SETUP = click.style("=== Usher Pipeline Setup ===", bold=True)
+_BANNER_SUMMARY = click.style("=== Setup Summary ===", bold=True)
+
 
 @click.command('setup')
 @click.option(
@@ -42,18 +43,35 @@ def setup(ctx, force):
     Fetches gene universe, maps IDs, validates results, and saves to DuckDB.
     Supports checkpoint-restart: skips expensive operations if data exists.
     """
+    # Deferred so CLI startup (--help, other subcommands) doesn't pay for
+    # polars/pyarrow and the mygene client at import time
+    import polars as pl
+    import pyarrow as pa
+
+    from usher_pipeline.config.loader import load_config
+    from usher_pipeline.gene_mapping import (
+        fetch_protein_coding_genes,
+        validate_gene_universe,
+        GeneMapper,
+        MappingValidator,
+    )
+    from usher_pipeline.persistence import PipelineStore, ProvenanceTracker
+
     config_path = ctx.obj['config_path']
-    click.echo(click.style("=== Usher Pipeline Setup ===", bold=True))
+    click.echo(_BANNER_SETUP)
     click.echo()
 
     try:
         # 1. Load config
         click.echo("Loading configuration...")
         config = load_config(config_path)
-        click.echo(click.style(f"  Config loaded: {config_path}", fg='green'))
-        click.echo(f"  Ensembl Release: {config.versions.ensembl_release}")
-        click.echo(f"  DuckDB Path: {config.duckdb_path}")
-        click.echo()
+        # Batched into one echo: one write() instead of four
+        click.echo("\n".join([
+            click.style(f"  Config loaded: {config_path}", fg='green'),
+            f"  Ensembl Release: {config.versions.ensembl_release}",
+            f"  DuckDB Path: {config.duckdb_path}",
+            "",
+        ]))
 
         # 2. Create PipelineStore and ProvenanceTracker
         click.echo("Initializing storage and provenance tracking...")
@@ -62,29 +80,28 @@ def setup(ctx, force):
         click.echo(click.style("  Storage initialized", fg='green'))
         click.echo()
 
-        # 3. Check checkpoint
-        has_checkpoint = store.has_checkpoint('gene_universe')
-
-        if has_checkpoint and not force:
-            click.echo(click.style(
-                "Gene universe checkpoint exists. Skipping fetch (use --force to re-fetch).",
-                fg='yellow'
-            ))
-            click.echo()
-
-            # Load existing data for validation display
+        # 3. Check checkpoint. load_dataframe returns None when the table
+        # doesn't exist, so the load doubles as the existence probe — one
+        # DuckDB dispatch instead of a metadata query plus a scan.
+        if not force:
             df = store.load_dataframe('gene_universe')
             if df is not None:
-                gene_count = len(df)
-                click.echo(f"Loaded {gene_count} genes from checkpoint")
+                click.echo(click.style(
+                    "Gene universe checkpoint exists. Skipping fetch (use --force to re-fetch).",
+                    fg='yellow'
+                ))
                 click.echo()
 
-                # Display summary
-                click.echo(click.style("=== Setup Summary ===", bold=True))
-                click.echo(f"Gene Count: {gene_count}")
-                click.echo(f"DuckDB Path: {config.duckdb_path}")
-                click.echo()
-                click.echo(click.style("Setup complete (used existing checkpoint)", fg='green'))
+                gene_count = len(df)
+                click.echo("\n".join([
+                    f"Loaded {gene_count} genes from checkpoint",
+                    "",
+                    _BANNER_SUMMARY,
+                    f"Gene Count: {gene_count}",
+                    f"DuckDB Path: {config.duckdb_path}",
+                    "",
+                    click.style("Setup complete (used existing checkpoint)", fg='green'),
+                ]))
                 return
 
         # 4. Fetch gene universe
@@ -112,7 +129,7 @@ def setup(ctx, force):
 
         for msg in universe_validation.messages:
             if 'FAILED' in msg:
-                click.echo(click.style(f"  {msg}", fg='red'))
+                click.echo(f"  {_RED}{msg}{_RESET}")
             else:
                 click.echo(f"  {msg}")
 
@@ -159,15 +176,15 @@ def setup(ctx, force):
 
         for msg in validation_result.messages:
             if 'FAILED' in msg:
-                click.echo(click.style(f"  {msg}", fg='red'))
+                click.echo(f"  {_RED}{msg}{_RESET}")
             elif 'WARNING' in msg:
-                click.echo(click.style(f"  {msg}", fg='yellow'))
+                click.echo(f"  {_YELLOW}{msg}{_RESET}")
             else:
                 click.echo(f"  {msg}")
 
         if not validation_result.passed:
             # Save unmapped report
-            unmapped_path = Path(config.data_dir) / "unmapped_genes.txt"
+            unmapped_path = config.data_dir / "unmapped_genes.txt"
             validator.save_unmapped_report(mapping_report, unmapped_path)
             click.echo()
             click.echo(click.style(
@@ -187,12 +204,25 @@ def setup(ctx, force):
         # 8. Save to DuckDB
         click.echo("Saving gene universe to DuckDB...")
 
-        # Create DataFrame with mapping results
-        df = pl.DataFrame({
-            'gene_id': [r.ensembl_id for r in mapping_results],
-            'gene_symbol': [r.hgnc_symbol for r in mapping_results],
-            'uniprot_accession': [r.uniprot_accession for r in mapping_results],
-        })
+        # Build columns in one pass over the results, then hand polars the
+        # Arrow buffers zero-copy (three separate comprehensions would walk
+        # the result list three times)
+        gene_ids: list = []
+        gene_symbols: list = []
+        uniprot_accessions: list = []
+        for r in mapping_results:
+            gene_ids.append(r.ensembl_id)
+            gene_symbols.append(r.hgnc_symbol)
+            uniprot_accessions.append(r.uniprot_accession)
+
+        df = pl.from_arrow(pa.record_batch(
+            [
+                pa.array(gene_ids, type=pa.string()),
+                pa.array(gene_symbols, type=pa.string()),
+                pa.array(uniprot_accessions, type=pa.string()),
+            ],
+            names=['gene_id', 'gene_symbol', 'uniprot_accession'],
+        ))
 
         store.save_dataframe(
             table_name='gene_universe',
@@ -204,20 +234,22 @@ def setup(ctx, force):
 
         # 9. Save provenance
         click.echo("Saving provenance metadata...")
-        provenance_path = Path(config.data_dir) / "setup.provenance.json"
+        provenance_path = config.data_dir / "setup.provenance.json"
         provenance.save_sidecar(provenance_path)
         click.echo(click.style(f"  Provenance saved: {provenance_path}", fg='green'))
         click.echo()
 
-        # 10. Display summary
-        click.echo(click.style("=== Setup Summary ===", bold=True))
-        click.echo(f"Gene Count: {len(gene_universe)}")
-        click.echo(f"HGNC Mapping Rate: {mapping_report.success_rate_hgnc:.1%} ({mapping_report.mapped_hgnc}/{mapping_report.total_genes})")
-        click.echo(f"UniProt Mapping Rate: {mapping_report.success_rate_uniprot:.1%} ({mapping_report.mapped_uniprot}/{mapping_report.total_genes})")
-        click.echo(f"DuckDB Path: {config.duckdb_path}")
-        click.echo(f"Provenance: {provenance_path}")
-        click.echo()
-        click.echo(click.style("Setup complete!", fg='green', bold=True))
+        # 10. Display summary (batched into one echo)
+        click.echo("\n".join([
+            _BANNER_SUMMARY,
+            f"Gene Count: {len(gene_universe)}",
+            f"HGNC Mapping Rate: {mapping_report.success_rate_hgnc:.1%} ({mapping_report.mapped_hgnc}/{mapping_report.total_genes})",
+            f"UniProt Mapping Rate: {mapping_report.success_rate_uniprot:.1%} ({mapping_report.mapped_uniprot}/{mapping_report.total_genes})",
+            f"DuckDB Path: {config.duckdb_path}",
+            f"Provenance: {provenance_path}",
+            "",
+            click.style("Setup complete!", fg='green', bold=True),
+        ]))
 
     except Exception as e:
         click.echo(click.style(f"Setup failed: {e}", fg='red'), err=True)
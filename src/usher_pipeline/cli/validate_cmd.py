@@ -8,27 +8,19 @@ Commands for:
 """
 
 import logging
+import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import click
-import structlog
-
-from usher_pipeline.config.loader import load_config
-from usher_pipeline.persistence import PipelineStore, ProvenanceTracker
-from usher_pipeline.scoring import (
-    validate_positive_controls_extended,
-    validate_negative_controls,
-    run_sensitivity_analysis,
-    summarize_sensitivity,
-)
-from usher_pipeline.scoring.validation_report import (
-    generate_comprehensive_validation_report,
-    save_validation_report,
-)
 
 logger = logging.getLogger(__name__)
 
+# Constant banners styled once at import instead of per invocation
+_BANNER_VALIDATE = click.style("=== Comprehensive Validation Pipeline ===", bold=True)
+_BANNER_SUMMARY = click.style("=== Validation Summary ===", bold=True)
+
 
 @click.command('validate')
 @click.option(
@@ -89,9 +81,24 @@ def validate(ctx, force, skip_sensitivity, output_dir, top_n):
         # Sensitivity with more genes
         usher-pipeline validate --top-n 200
     """
+    # Deferred so CLI startup (--help, other subcommands) doesn't pay for
+    # scipy/polars pulled in by the scoring package
+    from usher_pipeline.config.loader import load_config
+    from usher_pipeline.persistence import PipelineStore, ProvenanceTracker
+    from usher_pipeline.scoring import (
+        validate_positive_controls_extended,
+        validate_negative_controls,
+        run_sensitivity_analysis,
+        summarize_sensitivity,
+    )
+    from usher_pipeline.scoring.validation_report import (
+        generate_comprehensive_validation_report,
+        save_validation_report,
+    )
+
     config_path = ctx.obj['config_path']
 
-    click.echo(click.style("=== Comprehensive Validation Pipeline ===", bold=True))
+    click.echo(_BANNER_VALIDATE)
     click.echo()
 
     store = None
@@ -104,14 +111,17 @@ def validate(ctx, force, skip_sensitivity, output_dir, top_n):
 
         # Step 2: Initialize storage and provenance
         click.echo(click.style("Step 2: Initializing storage and provenance tracking...", bold=True))
-        store = PipelineStore.from_config(config)
+        # Validation only reads scored_genes; report and provenance go to
+        # plain files. Read-only skips WAL bookkeeping and lets other
+        # readers share the database.
+        store = PipelineStore.from_config(config, read_only=True)
         provenance = ProvenanceTracker.from_config(config)
         click.echo(click.style("  Storage initialized", fg='green'))
         click.echo()
 
         # Set output directory
         if output_dir is None:
-            output_dir = Path(config.data_dir) / "validation"
+            output_dir = config.data_dir / "validation"
         output_dir.mkdir(parents=True, exist_ok=True)
 
         # Step 3: Check scored_genes checkpoint
@@ -140,11 +150,36 @@ def validate(ctx, force, skip_sensitivity, output_dir, top_n):
             ))
             click.echo()
 
-            # Display existing report
-            report_text = validation_checkpoint_path.read_text(encoding='utf-8')
-            click.echo(report_text)
+            # Display existing report, streamed as raw bytes so a
+            # multi-MB report is never decoded to str and re-encoded —
+            # the file is already UTF-8, exactly what stdout wants
+            with validation_checkpoint_path.open('rb') as f:
+                shutil.copyfileobj(f, sys.stdout.buffer, length=1 << 20)
+            sys.stdout.buffer.flush()
             return
 
+        # Steps 4-6 all read the same scored_genes checkpoint and are
+        # independent, so they run concurrently — each worker gets its
+        # own cursor view (DuckDB connections are not thread-shareable).
+        # Banners, result display, and provenance stay in step order.
+        executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix='validate')
+        future_positive = executor.submit(
+            validate_positive_controls_extended, store.cursor_view()
+        )
+        future_negative = executor.submit(
+            validate_negative_controls, store.cursor_view()
+        )
+        future_sensitivity = None
+        if not skip_sensitivity:
+            future_sensitivity = executor.submit(
+                run_sensitivity_analysis,
+                store.cursor_view(),
+                config.scoring,
+                None,  # deltas: use DEFAULT_DELTAS
+                top_n,
+            )
+        executor.shutdown(wait=False)
+
         # Step 4: Run positive control validation
         click.echo(click.style("Step 4: Running positive control validation...", bold=True))
         click.echo("  Validating known cilia/Usher gene rankings...")
@@ -152,7 +187,7 @@ def validate(ctx, force, skip_sensitivity, output_dir, top_n):
         click.echo("  Generating per-source breakdown...")
 
         try:
-            positive_metrics = validate_positive_controls_extended(store)
+            positive_metrics = future_positive.result()
             pos_passed = positive_metrics.get("validation_passed", False)
 
             median_pct = positive_metrics.get("median_percentile", 0.0) * 100
@@ -186,7 +221,7 @@ def validate(ctx, force, skip_sensitivity, output_dir, top_n):
         click.echo("  Validating housekeeping gene rankings...")
 
         try:
-            negative_metrics = validate_negative_controls(store)
+            negative_metrics = future_negative.result()
             neg_passed = negative_metrics.get("validation_passed", False)
 
             neg_median_pct = negative_metrics.get("median_percentile", 0.0) * 100
@@ -226,15 +261,7 @@ def validate(ctx, force, skip_sensitivity, output_dir, top_n):
             click.echo("  Computing Spearman rank correlations...")
 
             try:
-                scoring_weights = config.scoring
-
-                sensitivity_result = run_sensitivity_analysis(
-                    store,
-                    scoring_weights,
-                    deltas=None,  # Use DEFAULT_DELTAS
-                    top_n=top_n,
-                )
-
+                sensitivity_result = future_sensitivity.result()
                 sensitivity_summary = summarize_sensitivity(sensitivity_result)
                 sens_passed = sensitivity_summary.get("overall_stable", False)
 
@@ -331,7 +358,7 @@ def validate(ctx, force, skip_sensitivity, output_dir, top_n):
         click.echo()
 
         # Display final summary
-        click.echo(click.style("=== Validation Summary ===", bold=True))
+        click.echo(_BANNER_SUMMARY)
         click.echo()
 
         all_passed = pos_passed and neg_passed and (sens_passed if not skip_sensitivity else True)
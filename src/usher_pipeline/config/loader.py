@@ -1,17 +1,98 @@
 """Configuration loading with YAML parsing and validation."""
 
+import functools
+import hashlib
+import os
+import pickle
 from pathlib import Path
 from typing import Any
 
-import pydantic_yaml
+import yaml
 
 from .schema import PipelineConfig
 
+try:
+    # libyaml C extension: parses at C speed vs the pure-Python scanner
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader as _YamlLoader
+
+
+def _disk_cache_path(config_path: str, mtime_ns: int, size: int) -> Path:
+    """Cache file location for a validated config, keyed on (path, mtime, size)."""
+    cache_root = Path(
+        os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")
+    ) / "usher"
+    key = hashlib.blake2b(
+        f"{config_path}:{mtime_ns}:{size}".encode(), digest_size=8
+    ).hexdigest()
+    return cache_root / f"config-{key}.pkl"
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_override_key(key: str) -> tuple[str, ...]:
+    """Pre-split a dotted override key into path parts, memoized.
+
+    CLI flags map to a small fixed set of keys, so repeated loads (tests,
+    multi-command runs) reuse the split tuples instead of re-splitting.
+    """
+    return tuple(key.split("."))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(config_path: str, mtime_ns: int) -> PipelineConfig:
+    """Parse and validate a config file, memoized on (path, mtime).
+
+    The mtime key makes edits to the file invalidate the cache entry
+    automatically. A pickle of the validated model is also kept on disk
+    (keyed on path + mtime + size) so subsequent CLI processes skip the
+    YAML parse and Pydantic validation entirely; set USHER_NO_CONFIG_CACHE
+    to disable it.
+    """
+    use_disk_cache = not os.environ.get("USHER_NO_CONFIG_CACHE")
+    cache_path = None
+    if use_disk_cache:
+        size = os.path.getsize(config_path)
+        cache_path = _disk_cache_path(config_path, mtime_ns, size)
+        if cache_path.exists():
+            try:
+                with open(cache_path, "rb") as f:
+                    config = pickle.load(f)
+                # The validator-side mkdir ran in the original process;
+                # re-assert cheaply in case the dirs were removed since
+                config.data_dir.mkdir(parents=True, exist_ok=True)
+                config.cache_dir.mkdir(parents=True, exist_ok=True)
+                return config
+            except Exception:
+                # Corrupt or incompatible cache entry — fall through to parse
+                pass
+
+    with open(config_path, "rb") as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+
+    config = PipelineConfig.model_validate(data)
+
+    if cache_path is not None:
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".pkl.tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump(config, f)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # Cache is best-effort; never fail a load over it
+            pass
+
+    return config
+
 
 def load_config(config_path: Path | str) -> PipelineConfig:
     """
     Load and validate pipeline configuration from YAML file.
 
+    Repeated loads of an unchanged file return a cached instance instead
+    of reparsing YAML and revalidating the Pydantic model each time.
+
     Args:
         config_path: Path to YAML configuration file
 
@@ -27,14 +108,7 @@ def load_config(config_path: Path | str) -> PipelineConfig:
     if not config_path.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
-    # Read YAML file
-    with open(config_path, "r") as f:
-        yaml_content = f.read()
-
-    # Parse and validate with Pydantic
-    config = pydantic_yaml.parse_yaml_raw_as(PipelineConfig, yaml_content)
-
-    return config
+    return _load_config_cached(str(config_path), config_path.stat().st_mtime_ns)
 
 
 def load_config_with_overrides(
@@ -60,22 +134,38 @@ def load_config_with_overrides(
     # Load base config
     config = load_config(config_path)
 
-    # Convert to dict, apply overrides, re-validate
+    compiled = {key: _compile_override_key(key) for key in overrides}
+
+    if all(len(parts) == 2 for parts in compiled.values()):
+        # Common case: CLI flags target nested section fields like
+        # "api.rate_limit_per_second". Rebuild only the touched submodels
+        # (revalidating their field constraints) and graft them onto the
+        # cached instance, instead of dumping and revalidating the whole
+        # tree.
+        grouped: dict[str, dict[str, Any]] = {}
+        for key, value in overrides.items():
+            section, field = compiled[key]
+            grouped.setdefault(section, {})[field] = value
+
+        updates: dict[str, Any] = {}
+        for section, fields in grouped.items():
+            submodel = getattr(config, section)
+            updates[section] = type(submodel).model_validate(
+                {**submodel.model_dump(), **fields}
+            )
+
+        return config.model_copy(update=updates)
+
+    # Top-level or deeper overrides: fall back to the full dump +
+    # revalidate path so field validators (e.g. directory creation for
+    # data_dir/cache_dir) run against the new values
     config_dict = config.model_dump()
 
-    # Apply overrides (simple flat merge for now)
     for key, value in overrides.items():
-        if "." in key:
-            # Handle nested keys like "api.rate_limit_per_second"
-            parts = key.split(".")
-            target = config_dict
-            for part in parts[:-1]:
-                target = target[part]
-            target[parts[-1]] = value
-        else:
-            config_dict[key] = value
-
-    # Re-validate with overrides applied
-    config = PipelineConfig.model_validate(config_dict)
+        target = config_dict
+        parts = compiled[key]
+        for part in parts[:-1]:
+            target = target[part]
+        target[parts[-1]] = value
 
-    return config
+    return PipelineConfig.model_validate(config_dict)
@@ -5,12 +5,15 @@ import json
 from pathlib import Path
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class DataSourceVersions(BaseModel):
     """Version information for external data sources."""
 
+    # Frozen so cached config instances can't be mutated by callers
+    model_config = ConfigDict(frozen=True)
+
     ensembl_release: int = Field(
         ...,
         ge=100,
@@ -33,6 +36,9 @@ class DataSourceVersions(BaseModel):
 class ScoringWeights(BaseModel):
     """Weights for multi-evidence scoring layers."""
 
+    # Frozen so cached config instances can't be mutated by callers
+    model_config = ConfigDict(frozen=True)
+
     gnomad: float = Field(
         default=0.20,
         ge=0.0,
@@ -97,6 +103,9 @@ class ScoringWeights(BaseModel):
 class APIConfig(BaseModel):
     """Configuration for API clients."""
 
+    # Frozen so cached config instances can't be mutated by callers
+    model_config = ConfigDict(frozen=True)
+
     rate_limit_per_second: int = Field(
         default=5,
         ge=1,
@@ -118,11 +127,22 @@ class APIConfig(BaseModel):
         ge=1,
         description="Request timeout in seconds",
     )
+    ttl_overrides: dict[str, int] = Field(
+        default_factory=dict,
+        description=(
+            "Per-URL cache TTL overrides: URL glob pattern -> seconds "
+            "(e.g. '*.proteinatlas.org/*': 604800). Unmatched URLs use "
+            "cache_ttl_seconds."
+        ),
+    )
 
 
 class PipelineConfig(BaseModel):
     """Main pipeline configuration."""
 
+    # Frozen so cached config instances can't be mutated by callers
+    model_config = ConfigDict(frozen=True)
+
     data_dir: Path = Field(
         ...,
         description="Directory for storing downloaded data",
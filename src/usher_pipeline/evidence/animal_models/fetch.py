@@ -32,6 +32,16 @@ ZFIN_PHENO_URL = "https://zfin.org/downloads/phenoGeneCleanData_fish.txt"
 IMPC_API_BASE = "https://www.ebi.ac.uk/mi/impc/solr/genotype-phenotype/select"
 
 
+def _cache_path(url: str, cache_dir: Optional[Path]) -> Path:
+    """Map a download URL to its on-disk cache file."""
+    cache_dir = Path(cache_dir) if cache_dir else Path("data/animal_models")
+    name = Path(url.split("?")[0]).name
+    # Cached content is stored decompressed
+    if name.endswith(".gz"):
+        name = name[:-3]
+    return cache_dir / name
+
+
 @retry(
     stop=stop_after_attempt(5),
     wait=wait_exponential(multiplier=1, min=4, max=60),
@@ -39,15 +49,26 @@ IMPC_API_BASE = "https://www.ebi.ac.uk/mi/impc/solr/genotype-phenotype/select"
         (httpx.HTTPStatusError, httpx.ConnectError, httpx.TimeoutException)
     ),
 )
-def _download_gzipped(url: str) -> bytes:
-    """Download and decompress a gzipped file.
+def _download_gzipped(
+    url: str,
+    cache_dir: Optional[Path] = None,
+    force: bool = False,
+) -> bytes:
+    """Download and decompress a gzipped file, caching the result on disk.
 
     Args:
         url: URL to download
+        cache_dir: Directory for cached downloads (default: data/animal_models)
+        force: If True, re-download even if cached
 
     Returns:
         Decompressed file content as bytes
     """
+    cache_path = _cache_path(url, cache_dir)
+    if cache_path.exists() and not force:
+        logger.info("download_cache_hit", url=url, path=str(cache_path))
+        return cache_path.read_bytes()
+
     logger.info("download_start", url=url)
 
     with httpx.stream("GET", url, timeout=120.0, follow_redirects=True) as response:
@@ -63,6 +84,9 @@ def _download_gzipped(url: str) -> bytes:
     decompressed = gzip.decompress(compressed_data)
     logger.info("decompress_complete", decompressed_size_mb=round(len(decompressed) / 1024 / 1024, 2))
 
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_bytes(decompressed)
+
     return decompressed
 
 
@@ -73,15 +97,26 @@ def _download_gzipped(url: str) -> bytes:
         (httpx.HTTPStatusError, httpx.ConnectError, httpx.TimeoutException)
     ),
 )
-def _download_text(url: str) -> str:
-    """Download a text file with retry.
+def _download_text(
+    url: str,
+    cache_dir: Optional[Path] = None,
+    force: bool = False,
+) -> str:
+    """Download a text file with retry, caching the result on disk.
 
     Args:
         url: URL to download
+        cache_dir: Directory for cached downloads (default: data/animal_models)
+        force: If True, re-download even if cached
 
     Returns:
         File content as string
     """
+    cache_path = _cache_path(url, cache_dir)
+    if cache_path.exists() and not force:
+        logger.info("download_cache_hit", url=url, path=str(cache_path))
+        return cache_path.read_text()
+
     logger.info("download_text_start", url=url)
 
     with httpx.stream("GET", url, timeout=120.0, follow_redirects=True) as response:
@@ -90,10 +125,18 @@ def _download_text(url: str) -> str:
         content = response.text
 
     logger.info("download_text_complete", size_mb=round(len(content) / 1024 / 1024, 2))
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    cache_path.write_text(content)
+
     return content
 
 
-def fetch_ortholog_mapping(gene_ids: list[str]) -> pl.DataFrame:
+def fetch_ortholog_mapping(
+    gene_ids: list[str] | pl.Series,
+    cache_dir: Optional[Path] = None,
+    force: bool = False,
+) -> pl.DataFrame:
     """Fetch human-to-mouse and human-to-zebrafish ortholog mappings from HCOP.
 
     Downloads HCOP ortholog data, assigns confidence scores based on number of
@@ -106,7 +149,9 @@ def fetch_ortholog_mapping(gene_ids: list[str]) -> pl.DataFrame:
     - LOW: 1-3 supporting databases
 
     Args:
-        gene_ids: List of human gene IDs (ENSG format)
+        gene_ids: Human gene IDs (ENSG format), as a list or Polars Series
+        cache_dir: Directory for cached downloads (default: data/animal_models)
+        force: If True, re-download even if cached
 
     Returns:
         DataFrame with columns:
@@ -120,7 +165,7 @@ def fetch_ortholog_mapping(gene_ids: list[str]) -> pl.DataFrame:
 
     # Download human-mouse HCOP data
     logger.info("fetch_hcop_mouse")
-    mouse_data = _download_gzipped(HCOP_HUMAN_MOUSE_URL)
+    mouse_data = _download_gzipped(HCOP_HUMAN_MOUSE_URL, cache_dir=cache_dir, force=force)
     mouse_df = pl.read_csv(
         io.BytesIO(mouse_data),
         separator="\t",
@@ -155,11 +200,11 @@ def fetch_ortholog_mapping(gene_ids: list[str]) -> pl.DataFrame:
         .select(["gene_id", "mouse_ortholog", "mouse_ortholog_confidence"])
     )
 
-    logger.info("mouse_orthologs_mapped", count=len(mouse_orthologs))
+    logger.info("mouse_orthologs_mapped", count=mouse_orthologs.height)
 
     # Download human-zebrafish HCOP data
     logger.info("fetch_hcop_zebrafish")
-    zebrafish_data = _download_gzipped(HCOP_HUMAN_ZEBRAFISH_URL)
+    zebrafish_data = _download_gzipped(HCOP_HUMAN_ZEBRAFISH_URL, cache_dir=cache_dir, force=force)
     zebrafish_df = pl.read_csv(
         io.BytesIO(zebrafish_data),
         separator="\t",
@@ -223,7 +268,11 @@ def fetch_ortholog_mapping(gene_ids: list[str]) -> pl.DataFrame:
     return result
 
 
-def fetch_mgi_phenotypes(mouse_gene_symbols: list[str]) -> pl.DataFrame:
+def fetch_mgi_phenotypes(
+    mouse_gene_symbols: list[str],
+    cache_dir: Optional[Path] = None,
+    force: bool = False,
+) -> pl.DataFrame:
     """Fetch mouse phenotype data from MGI (Mouse Genome Informatics).
 
     Downloads the MGI gene-phenotype report and extracts phenotype terms
@@ -231,6 +280,8 @@ def fetch_mgi_phenotypes(mouse_gene_symbols: list[str]) -> pl.DataFrame:
 
     Args:
         mouse_gene_symbols: List of mouse gene symbols
+        cache_dir: Directory for cached downloads (default: data/animal_models)
+        force: If True, re-download even if cached
 
     Returns:
         DataFrame with columns:
@@ -249,7 +300,7 @@ def fetch_mgi_phenotypes(mouse_gene_symbols: list[str]) -> pl.DataFrame:
     logger.info("fetch_mgi_phenotypes_start", gene_count=len(mouse_gene_symbols))
 
     # Download MGI phenotype report
-    content = _download_text(MGI_GENE_PHENO_URL)
+    content = _download_text(MGI_GENE_PHENO_URL, cache_dir=cache_dir, force=force)
 
     # Parse TSV (skip first line if it's a comment)
     lines = content.strip().split("\n")
@@ -312,7 +363,11 @@ def fetch_mgi_phenotypes(mouse_gene_symbols: list[str]) -> pl.DataFrame:
     return result
 
 
-def fetch_zfin_phenotypes(zebrafish_gene_symbols: list[str]) -> pl.DataFrame:
+def fetch_zfin_phenotypes(
+    zebrafish_gene_symbols: list[str],
+    cache_dir: Optional[Path] = None,
+    force: bool = False,
+) -> pl.DataFrame:
     """Fetch zebrafish phenotype data from ZFIN.
 
     Downloads ZFIN phenotype data and extracts phenotype terms for the
@@ -320,6 +375,8 @@ def fetch_zfin_phenotypes(zebrafish_gene_symbols: list[str]) -> pl.DataFrame:
 
     Args:
         zebrafish_gene_symbols: List of zebrafish gene symbols
+        cache_dir: Directory for cached downloads (default: data/animal_models)
+        force: If True, re-download even if cached
 
     Returns:
         DataFrame with columns:
@@ -338,7 +395,7 @@ def fetch_zfin_phenotypes(zebrafish_gene_symbols: list[str]) -> pl.DataFrame:
     logger.info("fetch_zfin_phenotypes_start", gene_count=len(zebrafish_gene_symbols))
 
     # Download ZFIN phenotype data
-    content = _download_text(ZFIN_PHENO_URL)
+    content = _download_text(ZFIN_PHENO_URL, cache_dir=cache_dir, force=force)
 
     # Parse TSV
     df = pl.read_csv(
@@ -447,7 +504,7 @@ def _query_impc_batch(gene_symbols: list[str]) -> pl.DataFrame:
             })
 
     df = pl.DataFrame(records)
-    logger.info("impc_batch_complete", phenotype_count=len(df))
+    logger.info("impc_batch_complete", phenotype_count=df.height)
 
     return df
 
@@ -27,12 +27,15 @@ def load_to_duckdb(
         provenance: ProvenanceTracker instance for metadata recording
         description: Optional description for checkpoint metadata
     """
-    logger.info("animal_model_load_start", row_count=len(df))
+    logger.info("animal_model_load_start", row_count=df.height)
 
     # Calculate summary statistics for provenance
-    with_mouse = df.filter(pl.col("mouse_ortholog").is_not_null()).height
-    with_zebrafish = df.filter(pl.col("zebrafish_ortholog").is_not_null()).height
-    with_sensory = df.filter(pl.col("sensory_phenotype_count").is_not_null()).height
+    # Single fused pass instead of three filter().height scans
+    with_mouse, with_zebrafish, with_sensory = df.select([
+        pl.col("mouse_ortholog").is_not_null().sum(),
+        pl.col("zebrafish_ortholog").is_not_null().sum(),
+        pl.col("sensory_phenotype_count").is_not_null().sum(),
+    ]).row(0)
 
     # Ortholog confidence distribution
     if with_mouse > 0:
@@ -74,7 +77,7 @@ def load_to_duckdb(
 
     # Record provenance step with details
     provenance.record_step("load_animal_model_phenotypes", {
-        "row_count": len(df),
+        "row_count": df.height,
         "genes_with_mouse_ortholog": with_mouse,
         "genes_with_zebrafish_ortholog": with_zebrafish,
         "genes_with_sensory_phenotypes": with_sensory,
@@ -85,7 +88,7 @@ def load_to_duckdb(
 
     logger.info(
         "animal_model_load_complete",
-        row_count=len(df),
+        row_count=df.height,
         with_mouse=with_mouse,
         with_zebrafish=with_zebrafish,
         with_sensory=with_sensory,
@@ -121,6 +124,6 @@ def query_sensory_phenotype_genes(
         params=[min_score]
     )
 
-    logger.info("animal_model_query_complete", result_count=len(df))
+    logger.info("animal_model_query_complete", result_count=df.height)
 
     return df
@@ -1,5 +1,8 @@
 """Transform animal model phenotype data: filter and score."""
 
+from pathlib import Path
+from typing import Optional
+
 import polars as pl
 import structlog
 
@@ -92,7 +95,7 @@ def score_animal_evidence(df: pl.DataFrame) -> pl.DataFrame:
     Returns:
         DataFrame with added animal_model_score_normalized column
     """
-    logger.info("score_animal_evidence_start", gene_count=len(df))
+    logger.info("score_animal_evidence_start", gene_count=df.height)
 
     # Define confidence weights
     confidence_weight = pl.when(pl.col("confidence") == "HIGH").then(1.0)\
@@ -174,7 +177,11 @@ def score_animal_evidence(df: pl.DataFrame) -> pl.DataFrame:
     return result
 
 
-def process_animal_model_evidence(gene_ids: list[str]) -> pl.DataFrame:
+def process_animal_model_evidence(
+    gene_ids: list[str] | pl.Series,
+    cache_dir: Optional[Path] = None,
+    force: bool = False,
+) -> pl.DataFrame:
     """End-to-end processing of animal model phenotype evidence.
 
     Executes the full pipeline:
@@ -185,7 +192,9 @@ def process_animal_model_evidence(gene_ids: list[str]) -> pl.DataFrame:
     5. Score evidence with confidence weighting
 
     Args:
-        gene_ids: List of human gene IDs (ENSG format)
+        gene_ids: Human gene IDs (ENSG format), as a list or Polars Series
+        cache_dir: Directory for cached downloads (default: data/animal_models)
+        force: If True, re-download source files even if cached
 
     Returns:
         DataFrame with animal model evidence for each gene
@@ -194,7 +203,7 @@ def process_animal_model_evidence(gene_ids: list[str]) -> pl.DataFrame:
 
     # Step 1: Fetch ortholog mappings
     logger.info("step_1_fetch_orthologs")
-    orthologs = fetch_ortholog_mapping(gene_ids)
+    orthologs = fetch_ortholog_mapping(gene_ids, cache_dir=cache_dir, force=force)
 
     # Extract lists of orthologs to query
     mouse_genes = orthologs.filter(pl.col("mouse_ortholog").is_not_null())["mouse_ortholog"].to_list()
@@ -210,11 +219,11 @@ def process_animal_model_evidence(gene_ids: list[str]) -> pl.DataFrame:
     logger.info("step_2_fetch_phenotypes")
 
     # MGI phenotypes
-    mgi_pheno = fetch_mgi_phenotypes(mouse_genes)
+    mgi_pheno = fetch_mgi_phenotypes(mouse_genes, cache_dir=cache_dir, force=force)
     mgi_sensory = filter_sensory_phenotypes(mgi_pheno, SENSORY_MP_KEYWORDS, "mp_term_name")
 
     # ZFIN phenotypes
-    zfin_pheno = fetch_zfin_phenotypes(zebrafish_genes)
+    zfin_pheno = fetch_zfin_phenotypes(zebrafish_genes, cache_dir=cache_dir, force=force)
     zfin_sensory = filter_sensory_phenotypes(zfin_pheno, SENSORY_ZP_KEYWORDS, "zp_term_name")
 
     # IMPC phenotypes
@@ -223,11 +232,11 @@ def process_animal_model_evidence(gene_ids: list[str]) -> pl.DataFrame:
 
     logger.info(
         "phenotypes_filtered",
-        mgi_total=len(mgi_pheno),
+        mgi_total=mgi_pheno.height,
         mgi_sensory=len(mgi_sensory),
-        zfin_total=len(zfin_pheno),
+        zfin_total=zfin_pheno.height,
         zfin_sensory=len(zfin_sensory),
-        impc_total=len(impc_pheno),
+        impc_total=impc_pheno.height,
         impc_sensory=len(impc_sensory),
     )
 
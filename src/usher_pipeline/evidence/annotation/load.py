@@ -27,7 +27,7 @@ def load_to_duckdb(
         provenance: ProvenanceTracker instance for metadata recording
         description: Optional description for checkpoint metadata
     """
-    logger.info("annotation_load_start", row_count=len(df))
+    logger.info("annotation_load_start", row_count=df.height)
 
     # Calculate summary statistics for provenance
     well_annotated_count = df.filter(pl.col("annotation_tier") == "well_annotated").height
@@ -56,7 +56,7 @@ def load_to_duckdb(
 
     # Record provenance step with details
     provenance.record_step("load_annotation_completeness", {
-        "row_count": len(df),
+        "row_count": df.height,
         "well_annotated_count": well_annotated_count,
         "partially_annotated_count": partial_count,
         "poorly_annotated_count": poor_count,
@@ -69,7 +69,7 @@ def load_to_duckdb(
 
     logger.info(
         "annotation_load_complete",
-        row_count=len(df),
+        row_count=df.height,
         well_annotated=well_annotated_count,
         partially_annotated=partial_count,
         poorly_annotated=poor_count,
@@ -114,6 +114,6 @@ def query_poorly_annotated(
         params=[max_score]
     )
 
-    logger.info("annotation_query_complete", result_count=len(df))
+    logger.info("annotation_query_complete", result_count=df.height)
 
     return df
@@ -177,7 +177,7 @@ def normalize_annotation_score(df: pl.DataFrame) -> pl.DataFrame:
 
 
 def process_annotation_evidence(
-    gene_ids: list[str],
+    gene_ids: list[str] | pl.Series,
     uniprot_mapping: pl.DataFrame,
 ) -> pl.DataFrame:
     """End-to-end annotation evidence processing pipeline.
@@ -185,7 +185,7 @@ def process_annotation_evidence(
     Composes: fetch GO -> fetch UniProt -> join -> classify tier -> normalize -> collect.
 
     Args:
-        gene_ids: List of Ensembl gene IDs to process
+        gene_ids: Ensembl gene IDs to process (list or Polars Series)
         uniprot_mapping: DataFrame with gene_id and uniprot_accession columns
 
     Returns:
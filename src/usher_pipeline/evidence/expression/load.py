@@ -28,7 +28,7 @@ def load_to_duckdb(
         provenance: ProvenanceTracker instance for metadata recording
         description: Optional description for checkpoint metadata
     """
-    logger.info("expression_load_start", row_count=len(df))
+    logger.info("expression_load_start", row_count=df.height)
 
     # Calculate summary statistics for provenance
     # Genes with retina expression (any source) — check column existence
@@ -67,7 +67,7 @@ def load_to_duckdb(
 
     # Record provenance step with details
     provenance.record_step("load_tissue_expression", {
-        "row_count": len(df),
+        "row_count": df.height,
         "retina_expression_count": retina_expr_count,
         "inner_ear_expression_count": inner_ear_expr_count,
         "mean_tau_specificity": round(mean_tau, 3) if mean_tau else None,
@@ -79,7 +79,7 @@ def load_to_duckdb(
 
     logger.info(
         "expression_load_complete",
-        row_count=len(df),
+        row_count=df.height,
         retina_expr=retina_expr_count,
         inner_ear_expr=inner_ear_expr_count,
         mean_tau=round(mean_tau, 3) if mean_tau else None,
@@ -117,6 +117,6 @@ def query_tissue_enriched(
         params=[min_enrichment]
     )
 
-    logger.info("expression_query_complete", result_count=len(df))
+    logger.info("expression_query_complete", result_count=df.height)
 
     return df
@@ -291,10 +291,10 @@ def process_expression_evidence(
 
     logger.info(
         "expression_pipeline_complete",
-        row_count=len(df),
-        has_hpa=any("hpa_" in col and df[col].null_count() < len(df) for col in df.columns if "hpa_" in col),
-        has_gtex=any("gtex_" in col and df[col].null_count() < len(df) for col in df.columns if "gtex_" in col),
-        has_cellxgene=any("cellxgene_" in col and df[col].null_count() < len(df) for col in df.columns if "cellxgene_" in col),
+        row_count=df.height,
+        has_hpa=any("hpa_" in col and df[col].null_count() < df.height for col in df.columns if "hpa_" in col),
+        has_gtex=any("gtex_" in col and df[col].null_count() < df.height for col in df.columns if "gtex_" in col),
+        has_cellxgene=any("cellxgene_" in col and df[col].null_count() < df.height for col in df.columns if "cellxgene_" in col),
     )
 
     return df
@@ -27,7 +27,7 @@ def load_to_duckdb(
         provenance: ProvenanceTracker instance for metadata recording
         description: Optional description for checkpoint metadata
     """
-    logger.info("gnomad_load_start", row_count=len(df))
+    logger.info("gnomad_load_start", row_count=df.height)
 
     # Enrich with Ensembl gene_id from gene_universe
     # gnomAD gene_id is mixed: some Ensembl (ENSG...), some NCBI numeric (4622).
@@ -61,14 +61,15 @@ def load_to_duckdb(
             before_ensembl=before_ensembl,
             after_ensembl=after_ensembl,
             rescued=after_ensembl - before_ensembl,
-            total=len(df),
+            total=df.height,
         )
 
     # Calculate summary statistics for provenance
-    measured_count = df.filter(pl.col("quality_flag") == "measured").height
-    incomplete_count = df.filter(pl.col("quality_flag") == "incomplete_coverage").height
-    no_data_count = df.filter(pl.col("quality_flag") == "no_data").height
-    null_loeuf_count = df.filter(pl.col("loeuf").is_null()).height
+    flag_counts = dict(df.group_by("quality_flag").len().iter_rows())
+    measured_count = flag_counts.get("measured", 0)
+    incomplete_count = flag_counts.get("incomplete_coverage", 0)
+    no_data_count = flag_counts.get("no_data", 0)
+    null_loeuf_count = df["loeuf"].null_count()
 
     # Save to DuckDB with CREATE OR REPLACE (idempotent)
     store.save_dataframe(
@@ -80,7 +81,7 @@ def load_to_duckdb(
 
     # Record provenance step with details
     provenance.record_step("load_gnomad_constraint", {
-        "row_count": len(df),
+        "row_count": df.height,
         "measured_count": measured_count,
         "incomplete_count": incomplete_count,
         "no_data_count": no_data_count,
@@ -89,7 +90,7 @@ def load_to_duckdb(
 
     logger.info(
         "gnomad_load_complete",
-        row_count=len(df),
+        row_count=df.height,
         measured=measured_count,
         incomplete=incomplete_count,
         no_data=no_data_count,
@@ -130,6 +131,6 @@ def query_constrained_genes(
         params=[loeuf_threshold]
     )
 
-    logger.info("gnomad_query_complete", result_count=len(df))
+    logger.info("gnomad_query_complete", result_count=df.height)
 
     return df
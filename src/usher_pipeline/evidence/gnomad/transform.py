@@ -146,16 +146,15 @@ def process_gnomad_constraint(
     # Parse with lazy evaluation
     lf = parse_constraint_tsv(tsv_path)
 
-    # Filter and normalize
+    # Filter, then materialize once: normalize_scores collects a min/max
+    # stats pass, so keeping the frame lazy here would re-parse the TSV
+    # from disk twice (once for stats, once for the final collect).
     lf = filter_by_coverage(lf, min_depth=min_depth, min_cds_pct=min_cds_pct)
-    lf = normalize_scores(lf)
-
-    # Materialize
-    df = lf.collect()
+    df = normalize_scores(lf.collect().lazy()).collect()
 
     # Log summary statistics
     stats = df.group_by("quality_flag").len().sort("quality_flag")
-    total = len(df)
+    total = df.height
 
     logger.info(
         "gnomad_process_complete",
@@ -27,7 +27,7 @@ def load_to_duckdb(
         provenance: ProvenanceTracker instance for metadata recording
         description: Optional description for checkpoint metadata
     """
-    logger.info("literature_load_start", row_count=len(df))
+    logger.info("literature_load_start", row_count=df.height)
 
     # Calculate summary statistics for provenance
     tier_counts = (
@@ -51,7 +51,7 @@ def load_to_duckdb(
         mean_score = mean_score_result.to_dicts()[0]["literature_score_normalized"]
 
     # Count total PubMed queries made (estimate: 6 queries per gene)
-    total_queries = len(df) * 6
+    total_queries = df.height * 6
 
     # Save to DuckDB with CREATE OR REPLACE (idempotent)
     store.save_dataframe(
@@ -63,7 +63,7 @@ def load_to_duckdb(
 
     # Record provenance step with details
     provenance.record_step("load_literature_evidence", {
-        "row_count": len(df),
+        "row_count": df.height,
         "genes_with_direct_evidence": tier_distribution.get("direct_experimental", 0),
         "genes_with_functional_mention": tier_distribution.get("functional_mention", 0),
         "genes_with_hts_hits": tier_distribution.get("hts_hit", 0),
@@ -75,7 +75,7 @@ def load_to_duckdb(
 
     logger.info(
         "literature_load_complete",
-        row_count=len(df),
+        row_count=df.height,
         tier_distribution=tier_distribution,
         genes_with_evidence=genes_with_evidence,
         mean_score=round(mean_score, 4) if mean_score is not None else None,
@@ -132,6 +132,6 @@ def query_literature_supported(
         """
     )
 
-    logger.info("literature_query_complete", result_count=len(df))
+    logger.info("literature_query_complete", result_count=df.height)
 
     return df
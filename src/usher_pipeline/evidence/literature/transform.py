@@ -45,7 +45,7 @@ def classify_evidence_tier(df: pl.DataFrame) -> pl.DataFrame:
     Returns:
         DataFrame with added evidence_tier column
     """
-    logger.info("literature_classify_start", row_count=len(df))
+    logger.info("literature_classify_start", row_count=df.height)
 
     # Define tier classification logic using polars expressions
     # Priority order: direct_experimental > functional_mention > hts_hit > incidental > none
@@ -124,7 +124,7 @@ def compute_literature_score(df: pl.DataFrame) -> pl.DataFrame:
     Returns:
         DataFrame with added literature_score_normalized column [0-1]
     """
-    logger.info("literature_score_start", row_count=len(df))
+    logger.info("literature_score_start", row_count=df.height)
 
     # Step 1: Compute weighted context score
     df = df.with_columns([
@@ -202,7 +202,7 @@ def compute_literature_score(df: pl.DataFrame) -> pl.DataFrame:
 
 
 def process_literature_evidence(
-    gene_ids: list[str],
+    gene_ids: list[str] | pl.Series,
     gene_symbol_map: pl.DataFrame,
     email: str,
     api_key: Optional[str] = None,
@@ -219,7 +219,7 @@ def process_literature_evidence(
     5. Join back to gene IDs
 
     Args:
-        gene_ids: List of Ensembl gene IDs
+        gene_ids: Ensembl gene IDs (list or Polars Series)
         gene_symbol_map: DataFrame with columns: gene_id, gene_symbol
         email: Email for NCBI E-utilities (required)
         api_key: Optional NCBI API key for higher rate limit
@@ -277,7 +277,7 @@ def process_literature_evidence(
 
     logger.info(
         "literature_process_complete",
-        total_genes=len(result_df),
+        total_genes=result_df.height,
     )
 
     return result_df
@@ -140,7 +140,7 @@ def download_hpa_subcellular(
 
 
 def fetch_hpa_subcellular(
-    gene_ids: list[str],
+    gene_ids: list[str] | pl.Series,
     gene_symbol_map: pl.DataFrame,
     cache_dir: Optional[Path] = None,
     force: bool = False,
@@ -151,7 +151,7 @@ def fetch_hpa_subcellular(
     input gene list. Maps gene symbols to gene IDs using the provided mapping.
 
     Args:
-        gene_ids: List of Ensembl gene IDs to fetch
+        gene_ids: Ensembl gene IDs to fetch (list or Polars Series)
         gene_symbol_map: DataFrame with gene_id and gene_symbol columns
         cache_dir: Directory to cache HPA download (default: data/localization)
         force: If True, re-download HPA data
@@ -219,7 +219,7 @@ def fetch_hpa_subcellular(
     # Collect to DataFrame
     df = df.collect()
 
-    logger.info("hpa_parse_complete", row_count=len(df))
+    logger.info("hpa_parse_complete", row_count=df.height)
 
     # Map gene symbols to gene IDs
     logger.info("hpa_map_gene_ids")
@@ -233,13 +233,13 @@ def fetch_hpa_subcellular(
     gene_ids_set = set(gene_ids)
     df = df.filter(pl.col("gene_id").is_in(gene_ids_set))
 
-    logger.info("hpa_filter_complete", row_count=len(df))
+    logger.info("hpa_filter_complete", row_count=df.height)
 
     return df
 
 
 def fetch_cilia_proteomics(
-    gene_ids: list[str],
+    gene_ids: list[str] | pl.Series,
     gene_symbol_map: pl.DataFrame,
 ) -> pl.DataFrame:
     """Cross-reference genes against curated cilia/centrosome proteomics datasets.
@@ -249,7 +249,7 @@ def fetch_cilia_proteomics(
     from proteomics is informative (not detected vs. not tested).
 
     Args:
-        gene_ids: List of Ensembl gene IDs to check
+        gene_ids: Ensembl gene IDs to check (list or Polars Series)
         gene_symbol_map: DataFrame with gene_id and gene_symbol columns
 
     Returns:
@@ -27,7 +27,7 @@ def load_to_duckdb(
         provenance: ProvenanceTracker instance for metadata recording
         description: Optional description for checkpoint metadata
     """
-    logger.info("localization_load_start", row_count=len(df))
+    logger.info("localization_load_start", row_count=df.height)
 
     # Calculate summary statistics for provenance
     experimental_count = df.filter(pl.col("evidence_type") == "experimental").height
@@ -56,7 +56,7 @@ def load_to_duckdb(
 
     # Record provenance step with details
     provenance.record_step("load_subcellular_localization", {
-        "row_count": len(df),
+        "row_count": df.height,
         "experimental_count": experimental_count,
         "computational_count": computational_count,
         "both_count": both_count,
@@ -68,7 +68,7 @@ def load_to_duckdb(
 
     logger.info(
         "localization_load_complete",
-        row_count=len(df),
+        row_count=df.height,
         experimental=experimental_count,
         computational=computational_count,
         both=both_count,
@@ -114,6 +114,6 @@ def query_cilia_localized(
         params=[proximity_threshold]
     )
 
-    logger.info("localization_query_complete", result_count=len(df))
+    logger.info("localization_query_complete", result_count=df.height)
 
     return df
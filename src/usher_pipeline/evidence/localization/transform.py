@@ -38,7 +38,7 @@ def classify_evidence_type(df: pl.DataFrame) -> pl.DataFrame:
         - hpa_evidence_type: "experimental" or "computational" (NULL if no HPA data)
         - evidence_type: "experimental", "computational", "both", "none"
     """
-    logger.info("classify_evidence_start", row_count=len(df))
+    logger.info("classify_evidence_start", row_count=df.height)
 
     # Classify HPA evidence type based on reliability
     df = df.with_columns([
@@ -116,7 +116,7 @@ def score_localization(df: pl.DataFrame) -> pl.DataFrame:
         - cilia_proximity_score: 0-1 score (NULL if no data)
         - localization_score_normalized: weighted score (NULL if no data)
     """
-    logger.info("score_localization_start", row_count=len(df))
+    logger.info("score_localization_start", row_count=df.height)
 
     # Parse compartment flags from HPA location string
     # Check if any CILIA_COMPARTMENTS substring appears in hpa_main_location
@@ -235,7 +235,7 @@ def score_localization(df: pl.DataFrame) -> pl.DataFrame:
 
 
 def process_localization_evidence(
-    gene_ids: list[str],
+    gene_ids: list[str] | pl.Series,
     gene_symbol_map: pl.DataFrame,
     cache_dir=None,
     force: bool = False,
@@ -246,7 +246,7 @@ def process_localization_evidence(
     merges them, classifies evidence type, and scores cilia proximity.
 
     Args:
-        gene_ids: List of Ensembl gene IDs
+        gene_ids: Ensembl gene IDs (list or Polars Series)
         gene_symbol_map: DataFrame with gene_id and gene_symbol columns
         cache_dir: Directory to cache HPA download
         force: If True, re-download HPA data
@@ -297,7 +297,7 @@ def process_localization_evidence(
 
     logger.info(
         "process_merge_complete",
-        row_count=len(df),
+        row_count=df.height,
         has_hpa=df.filter(pl.col("hpa_main_location").is_not_null()).height,
         has_proteomics=df.filter(
             (pl.col("in_cilia_proteomics") == True) | (pl.col("in_centrosome_proteomics") == True)
@@ -310,6 +310,6 @@ def process_localization_evidence(
     # Score localization
     df = score_localization(df)
 
-    logger.info("process_localization_complete", row_count=len(df))
+    logger.info("process_localization_complete", row_count=df.height)
 
     return df
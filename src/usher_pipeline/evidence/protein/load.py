@@ -27,18 +27,26 @@ def load_to_duckdb(
         provenance: ProvenanceTracker instance for metadata recording
         description: Optional description for checkpoint metadata
     """
-    logger.info("protein_load_start", row_count=len(df))
-
-    # Calculate summary statistics for provenance
-    total_genes = len(df)
-    with_uniprot = df.filter(pl.col("uniprot_id").is_not_null()).height
+    logger.info("protein_load_start", row_count=df.height)
+
+    # Calculate summary statistics for provenance in one fused pass
+    # (boolean columns sum directly — no equality masks or per-count scans)
+    total_genes = df.height
+    (
+        with_uniprot,
+        cilia_domain_count,
+        scaffold_domain_count,
+        coiled_coil_count,
+        tm_domain_count,
+    ) = df.select([
+        pl.col("uniprot_id").is_not_null().sum(),
+        pl.col("has_cilia_domain").sum(),
+        pl.col("scaffold_adaptor_domain").sum(),
+        pl.col("coiled_coil").sum(),
+        (pl.col("transmembrane_count") > 0).sum(),
+    ]).row(0)
     null_uniprot = total_genes - with_uniprot
 
-    cilia_domain_count = df.filter(pl.col("has_cilia_domain") == True).height
-    scaffold_domain_count = df.filter(pl.col("scaffold_adaptor_domain") == True).height
-    coiled_coil_count = df.filter(pl.col("coiled_coil") == True).height
-    tm_domain_count = df.filter(pl.col("transmembrane_count") > 0).height
-
     # Mean domain count (only for proteins with data)
     mean_domain_count = (
         df.filter(pl.col("domain_count").is_not_null())
@@ -123,6 +131,6 @@ def query_cilia_candidates(
         """
     )
 
-    logger.info("protein_query_complete", result_count=len(df))
+    logger.info("protein_query_complete", result_count=df.height)
 
     return df
@@ -1,18 +1,26 @@
 """Output generation: tiered candidate classification and dual-format file writing."""
 
+import importlib
+
 from usher_pipeline.output.evidence_summary import EVIDENCE_LAYERS, add_evidence_summary
 from usher_pipeline.output.reproducibility import (
     ReproducibilityReport,
     generate_reproducibility_report,
 )
 from usher_pipeline.output.tiers import TIER_THRESHOLDS, assign_tiers
-from usher_pipeline.output.visualizations import (
-    generate_all_plots,
-    plot_layer_contributions,
-    plot_score_distribution,
-    plot_tier_breakdown,
+from usher_pipeline.output.writers import (
+    write_candidate_output,
+    write_candidate_output_from_table,
 )
-from usher_pipeline.output.writers import write_candidate_output
+
+# Plotting pulls in matplotlib (~300ms cold import); resolve those names
+# lazily so non-visualization paths (e.g. report --skip-viz) don't pay for it
+_LAZY_PLOT_EXPORTS = {
+    "generate_all_plots",
+    "plot_score_distribution",
+    "plot_layer_contributions",
+    "plot_tier_breakdown",
+}
 
 __all__ = [
     "assign_tiers",
@@ -20,6 +28,7 @@ __all__ = [
     "add_evidence_summary",
     "EVIDENCE_LAYERS",
     "write_candidate_output",
+    "write_candidate_output_from_table",
     "generate_reproducibility_report",
     "ReproducibilityReport",
     "generate_all_plots",
@@ -27,3 +36,10 @@ __all__ = [
     "plot_layer_contributions",
     "plot_tier_breakdown",
 ]
+
+
+def __getattr__(name: str):
+    if name in _LAZY_PLOT_EXPORTS:
+        module = importlib.import_module("usher_pipeline.output.visualizations")
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -13,7 +13,9 @@ EVIDENCE_LAYERS = [
 ]
 
 
-def add_evidence_summary(df: pl.DataFrame) -> pl.DataFrame:
+def add_evidence_summary(
+    df: pl.DataFrame | pl.LazyFrame,
+) -> pl.DataFrame | pl.LazyFrame:
     """
     Add supporting_layers and evidence_gaps columns to scored genes.
 
@@ -21,12 +23,12 @@ def add_evidence_summary(df: pl.DataFrame) -> pl.DataFrame:
     (supporting_layers) and which layers are missing (evidence_gaps).
 
     Args:
-        df: Polars DataFrame with columns like:
+        df: Polars DataFrame or LazyFrame with columns like:
             - gene_id, gene_symbol, composite_score, evidence_count
             - gnomad_score, expression_score, annotation_score, etc. (all nullable)
 
     Returns:
-        DataFrame with two added columns:
+        Frame (same eagerness as the input) with two added columns:
             - supporting_layers (str): comma-separated list of layers with non-NULL scores
             - evidence_gaps (str): comma-separated list of layers with NULL scores
 
@@ -39,7 +41,8 @@ def add_evidence_summary(df: pl.DataFrame) -> pl.DataFrame:
           evidence_gaps = "gnomad,expression,annotation,localization,animal_model,literature"
 
     Notes:
-        - Uses polars expressions (no pandas conversion)
+        - Uses polars expressions (no pandas conversion); a LazyFrame
+          input stays lazy
         - Empty string for supporting_layers if no evidence
         - Preserves DataFrame order and all other columns
     """
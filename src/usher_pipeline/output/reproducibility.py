@@ -1,6 +1,5 @@
 """Reproducibility report generation for pipeline runs."""
 
-import json
 import sys
 import uuid
 from dataclasses import dataclass, field
@@ -8,6 +7,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 
 import duckdb
+import orjson
 import polars as pl
 
 from usher_pipeline.config.schema import PipelineConfig
@@ -87,8 +87,9 @@ class ReproducibilityReport:
         """
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(path, "w") as f:
-            json.dump(self.to_dict(), f, indent=2, default=str)
+        # orjson serializes straight to bytes — one write, no text encoding
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2, default=str))
 
         return path
 
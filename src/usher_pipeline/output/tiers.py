@@ -11,8 +11,8 @@ TIER_THRESHOLDS = {
 
 
 def assign_tiers(
-    scored_df: pl.DataFrame, thresholds: dict | None = None
-) -> pl.DataFrame:
+    scored_df: pl.DataFrame | pl.LazyFrame, thresholds: dict | None = None
+) -> pl.DataFrame | pl.LazyFrame:
     """
     Assign confidence tiers to scored genes and filter out EXCLUDED genes.
 
@@ -21,7 +21,7 @@ def assign_tiers(
     are marked as EXCLUDED and filtered out.
 
     Args:
-        scored_df: Polars DataFrame with columns:
+        scored_df: Polars DataFrame or LazyFrame with columns:
             - gene_id (str)
             - gene_symbol (str)
             - composite_score (float, nullable)
@@ -37,11 +37,13 @@ def assign_tiers(
             }
 
     Returns:
-        DataFrame with added confidence_tier column (str), sorted by
-        composite_score DESC, gene_id ASC. EXCLUDED genes are filtered out.
+        Frame (same eagerness as the input) with added confidence_tier
+        column (str), sorted by composite_score DESC, gene_id ASC.
+        EXCLUDED genes are filtered out.
 
     Notes:
-        - Uses vectorized polars expressions (not row-by-row iteration)
+        - Uses vectorized polars expressions (not row-by-row iteration),
+          so a LazyFrame input stays lazy end to end
         - Genes with NULL composite_score are always EXCLUDED
         - Deterministic sorting for reproducibility
         - Filtering happens before return (EXCLUDED rows removed)
@@ -1,6 +1,10 @@
 """Visualization generation for pipeline outputs."""
 
 import logging
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import matplotlib
@@ -61,8 +65,7 @@ def plot_score_distribution(df: pl.DataFrame, output_path: Path) -> Path:
     ax.set_ylabel("Candidate Count")
     ax.set_title("Score Distribution by Confidence Tier")
 
-    # Save figure
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    # Save figure (caller ensures the directory exists)
     fig.savefig(output_path, dpi=300, bbox_inches="tight")
 
     # CRITICAL: Close figure to prevent memory leak
@@ -123,8 +126,7 @@ def plot_layer_contributions(df: pl.DataFrame, output_path: Path) -> Path:
     ax.set_ylabel("Candidates with Evidence")
     ax.set_title("Evidence Layer Coverage")
 
-    # Save figure
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    # Save figure (caller ensures the directory exists)
     fig.savefig(output_path, dpi=300, bbox_inches="tight")
 
     # Close figure
@@ -182,8 +184,7 @@ def plot_tier_breakdown(df: pl.DataFrame, output_path: Path) -> Path:
 
     ax.set_title("Candidate Tier Breakdown")
 
-    # Save figure
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    # Save figure (caller ensures the directory exists)
     fig.savefig(output_path, dpi=300, bbox_inches="tight")
 
     # Close figure
@@ -193,10 +194,52 @@ def plot_tier_breakdown(df: pl.DataFrame, output_path: Path) -> Path:
     return output_path
 
 
+# Plot name -> builder function; generate_all_plots renders one PNG per entry
+_PLOT_BUILDERS = {
+    "score_distribution": plot_score_distribution,
+    "layer_contributions": plot_layer_contributions,
+    "tier_breakdown": plot_tier_breakdown,
+}
+
+# Columns each plot actually reads — workers prune their Parquet scan to
+# these, and the parent only serializes their union
+_PLOT_COLUMNS = {
+    "score_distribution": ["composite_score", "confidence_tier"],
+    "layer_contributions": [
+        "gnomad_score",
+        "expression_score",
+        "annotation_score",
+        "localization_score",
+        "animal_model_score",
+        "literature_score",
+    ],
+    "tier_breakdown": ["confidence_tier"],
+}
+
+
+def _plot_worker(plot_name: str, parquet_path: str, output_path: str) -> str:
+    """Render one plot in a worker process.
+
+    The input frame arrives as a Parquet path (serialized once by the
+    parent) because DataFrames don't pickle cheaply across spawn. Each
+    worker scans only its plot's columns, so column pruning keeps the
+    load small. Importing this module in the worker sets the Agg
+    backend before pyplot loads.
+    """
+    lf = pl.scan_parquet(parquet_path)
+    available = lf.collect_schema().names()
+    wanted = [c for c in _PLOT_COLUMNS[plot_name] if c in available]
+    df = lf.select(wanted).collect()
+    return str(_PLOT_BUILDERS[plot_name](df, Path(output_path)))
+
+
 def generate_all_plots(df: pl.DataFrame, output_dir: Path) -> dict[str, Path]:
     """
     Generate all visualization plots.
 
+    The three figures are independent and matplotlib rendering is
+    CPU-bound, so each plot runs in its own spawned worker process.
+
     Args:
         df: DataFrame with scoring results
         output_dir: Directory where plots will be saved
@@ -206,39 +249,38 @@ def generate_all_plots(df: pl.DataFrame, output_dir: Path) -> dict[str, Path]:
 
     Notes:
         - Creates output directory if needed
-        - Wraps each plot in try/except to continue on individual failures
+        - Individual plot failures are logged and skipped
         - Uses standard filenames for each plot type
     """
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    plots = {}
+    plots: dict[str, Path] = {}
 
-    # Plot 1: Score distribution
-    try:
-        plots["score_distribution"] = plot_score_distribution(
-            df,
-            output_dir / "score_distribution.png",
-        )
-    except Exception as e:
-        logger.warning(f"Failed to create score distribution plot: {e}")
-
-    # Plot 2: Layer contributions
-    try:
-        plots["layer_contributions"] = plot_layer_contributions(
-            df,
-            output_dir / "layer_contributions.png",
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        parquet_path = str(Path(tmp_dir) / "plot_input.parquet")
+        plot_columns = {col for cols in _PLOT_COLUMNS.values() for col in cols}
+        df.select([c for c in df.columns if c in plot_columns]).write_parquet(
+            parquet_path
         )
-    except Exception as e:
-        logger.warning(f"Failed to create layer contributions plot: {e}")
-
-    # Plot 3: Tier breakdown
-    try:
-        plots["tier_breakdown"] = plot_tier_breakdown(
-            df,
-            output_dir / "tier_breakdown.png",
-        )
-    except Exception as e:
-        logger.warning(f"Failed to create tier breakdown plot: {e}")
+
+        max_workers = min(len(_PLOT_BUILDERS), os.cpu_count() or 1)
+        # spawn (not fork) so each worker gets a clean matplotlib state
+        mp_context = multiprocessing.get_context("spawn")
+
+        with ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=mp_context
+        ) as executor:
+            futures = {
+                name: executor.submit(
+                    _plot_worker, name, parquet_path, str(output_dir / f"{name}.png")
+                )
+                for name in _PLOT_BUILDERS
+            }
+            for name, future in futures.items():
+                try:
+                    plots[name] = Path(future.result())
+                except Exception as e:
+                    logger.warning(f"Failed to create {name} plot: {e}")
 
     logger.info(f"Generated {len(plots)} plots in {output_dir}")
     return plots
@@ -1,16 +1,23 @@
 """Dual-format TSV+Parquet writer with provenance sidecar."""
 
+import gzip
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import polars as pl
 import yaml
 
+if TYPE_CHECKING:
+    import duckdb
+
 
 def write_candidate_output(
     df: pl.DataFrame | pl.LazyFrame,
     output_dir: Path,
     filename_base: str = "candidates",
+    compress_tsv: bool = False,
+    conn: "duckdb.DuckDBPyConnection | None" = None,
 ) -> dict:
     """
     Write candidate genes to TSV and Parquet formats with provenance sidecar.
@@ -26,6 +33,11 @@ def write_candidate_output(
             - supporting_layers, evidence_gaps
         output_dir: Directory to write output files (created if doesn't exist)
         filename_base: Base filename without extension (default: "candidates")
+        compress_tsv: If True, gzip the TSV (written as {filename_base}.tsv.gz)
+        conn: Optional DuckDB connection. When given, the Parquet file is
+            written with DuckDB's multi-threaded COPY TO (the frame is
+            registered as an Arrow view, so no extra copy); otherwise
+            polars writes it in-process.
 
     Returns:
         Dictionary with output file paths:
@@ -38,8 +50,9 @@ def write_candidate_output(
     Notes:
         - Collects LazyFrame if needed
         - Sorts by composite_score DESC, gene_id ASC for deterministic output
-        - TSV uses tab separator with header
-        - Parquet uses snappy compression
+        - TSV uses tab separator with header (Polars' parallel CSV writer)
+        - Parquet uses zstd compression with column statistics so downstream
+          readers can do predicate pushdown
         - Provenance YAML includes:
           - generated_at timestamp
           - output_files list
@@ -58,15 +71,34 @@ def write_candidate_output(
     df = df.sort(["composite_score", "gene_id"], descending=[True, False])
 
     # Define output paths
-    tsv_path = output_dir / f"{filename_base}.tsv"
+    tsv_suffix = ".tsv.gz" if compress_tsv else ".tsv"
+    tsv_path = output_dir / f"{filename_base}{tsv_suffix}"
     parquet_path = output_dir / f"{filename_base}.parquet"
     provenance_path = output_dir / f"{filename_base}.provenance.yaml"
 
-    # Write TSV
-    df.write_csv(tsv_path, separator="\t", include_header=True)
-
-    # Write Parquet
-    df.write_parquet(parquet_path, compression="snappy", use_pyarrow=True)
+    # Write TSV (Polars' Rust-side writer; gzip via stdlib when requested —
+    # zstd is not a project dependency)
+    if compress_tsv:
+        with gzip.open(tsv_path, "wb") as f:
+            df.write_csv(f, separator="\t", include_header=True)
+    else:
+        df.write_csv(tsv_path, separator="\t", include_header=True)
+
+    # Write Parquet (zstd + statistics for downstream predicate pushdown)
+    if conn is not None:
+        # DuckDB's COPY TO parallelizes across row groups; the view shares
+        # the frame's Arrow buffers
+        conn.register("_candidates_out", df.to_arrow())
+        try:
+            escaped_path = str(parquet_path).replace("'", "''")
+            conn.execute(
+                f"COPY _candidates_out TO '{escaped_path}' "
+                "(FORMAT PARQUET, COMPRESSION ZSTD, ROW_GROUP_SIZE 100000)"
+            )
+        finally:
+            conn.unregister("_candidates_out")
+    else:
+        df.write_parquet(parquet_path, compression="zstd", statistics=True)
 
     # Collect statistics for provenance
     total_candidates = df.height
@@ -102,3 +134,88 @@ def write_candidate_output(
         "parquet": parquet_path,
         "provenance": provenance_path,
     }
+
+
+def write_candidate_output_from_table(
+    conn: "duckdb.DuckDBPyConnection",
+    table_name: str,
+    output_dir: Path,
+    filename_base: str = "candidates",
+    compress_tsv: bool = False,
+) -> dict:
+    """
+    Write candidate output directly from a DuckDB table.
+
+    Produces the same TSV/Parquet/provenance trio as
+    write_candidate_output, but everything stays inside DuckDB: both
+    files are written with COPY and statistics come from SQL aggregates,
+    so no DataFrame is materialized in Python. Used by the report
+    command's fast path when the tiered table is already checkpointed
+    and only the files are needed.
+
+    Args:
+        conn: DuckDB connection holding the table
+        table_name: Table to export (e.g. "tiered_candidates")
+        output_dir: Directory to write output files (created if doesn't exist)
+        filename_base: Base filename without extension (default: "candidates")
+        compress_tsv: If True, gzip the TSV (written as {filename_base}.tsv.gz)
+
+    Returns:
+        Same dict of output paths as write_candidate_output
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    tsv_suffix = ".tsv.gz" if compress_tsv else ".tsv"
+    tsv_path = output_dir / f"{filename_base}{tsv_suffix}"
+    parquet_path = output_dir / f"{filename_base}.parquet"
+    provenance_path = output_dir / f"{filename_base}.provenance.yaml"
+
+    # Same deterministic order as the DataFrame path
+    ordered = (
+        f"SELECT * FROM {table_name} "
+        "ORDER BY composite_score DESC, gene_id ASC"
+    )
+
+    tsv_options = "FORMAT CSV, DELIMITER '\t', HEADER"
+    if compress_tsv:
+        tsv_options += ", COMPRESSION GZIP"
+    escaped_tsv = str(tsv_path).replace("'", "''")
+    conn.execute(f"COPY ({ordered}) TO '{escaped_tsv}' ({tsv_options})")
+
+    escaped_parquet = str(parquet_path).replace("'", "''")
+    conn.execute(
+        f"COPY ({ordered}) TO '{escaped_parquet}' "
+        "(FORMAT PARQUET, COMPRESSION ZSTD, ROW_GROUP_SIZE 100000)"
+    )
+
+    # Statistics straight from SQL — O(groups) values cross into Python
+    tier_counts = dict(conn.execute(
+        f"SELECT confidence_tier, COUNT(*) FROM {table_name} GROUP BY confidence_tier"
+    ).fetchall())
+    column_names = [
+        col[0] for col in
+        conn.execute(f"SELECT * FROM {table_name} LIMIT 0").description
+    ]
+
+    provenance = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "output_files": [tsv_path.name, parquet_path.name],
+        "statistics": {
+            "total_candidates": sum(tier_counts.values()),
+            "high_count": tier_counts.get("HIGH", 0),
+            "medium_count": tier_counts.get("MEDIUM", 0),
+            "low_count": tier_counts.get("LOW", 0),
+        },
+        "column_count": len(column_names),
+        "column_names": column_names,
+    }
+
+    with open(provenance_path, "w") as f:
+        yaml.dump(provenance, f, default_flow_style=False, sort_keys=False)
+
+    return {
+        "tsv": tsv_path,
+        "parquet": parquet_path,
+        "provenance": provenance_path,
+    }
@@ -21,30 +21,40 @@ class PipelineStore:
     processing) can be saved as DuckDB tables and skipped on subsequent runs.
     """
 
-    def __init__(self, db_path: Path):
+    def __init__(self, db_path: Path, read_only: bool = False):
         """
         Initialize PipelineStore with a DuckDB database.
 
         Args:
             db_path: Path to DuckDB database file. Parent directories
                      are created automatically.
+            read_only: Open the database read-only. Skips WAL/checkpoint
+                       bookkeeping and lets other processes read the file
+                       concurrently. The database must already exist;
+                       save_dataframe and delete_checkpoint will fail.
         """
         self.db_path = db_path
         # Create parent directories
         db_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Connect to DuckDB
-        self.conn = duckdb.connect(str(db_path))
+        self.conn = duckdb.connect(str(db_path), read_only=read_only)
+
+        # Per-process cache of loaded tables, keyed by (table, columns).
+        # The store is the only writer (single-writer design), so entries
+        # stay valid until this instance rewrites or drops the table.
+        self._df_cache: dict[tuple, pl.DataFrame] = {}
 
         # Create metadata table for tracking checkpoints
-        self.conn.execute("""
-            CREATE TABLE IF NOT EXISTS _checkpoints (
-                table_name VARCHAR PRIMARY KEY,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                row_count INTEGER,
-                description VARCHAR
-            )
-        """)
+        if not read_only:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS _checkpoints (
+                    table_name VARCHAR PRIMARY KEY,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    row_count INTEGER,
+                    description VARCHAR
+                )
+            """)
 
     def save_dataframe(
         self,
@@ -56,6 +66,10 @@ class PipelineStore:
         """
         Save a DataFrame to DuckDB as a table.
 
+        This is the direct-path write used by every evidence loader:
+        the frame is registered as an Arrow view and ingested via
+        CREATE TABLE AS SELECT — never per-row inserts or executemany.
+
         Args:
             df: Polars or pandas DataFrame to save
             table_name: Name for the DuckDB table
@@ -69,23 +83,41 @@ class PipelineStore:
         if not is_polars and not isinstance(df, pd.DataFrame):
             raise ValueError("df must be polars.DataFrame or pandas.DataFrame")
 
-        # Save DataFrame
-        if replace:
-            self.conn.execute(f"CREATE OR REPLACE TABLE {table_name} AS SELECT * FROM df")
-        else:
-            self.conn.execute(f"INSERT INTO {table_name} SELECT * FROM df")
+        # Register the DataFrame explicitly as an Arrow view so DuckDB reads
+        # it zero-copy instead of going through the implicit replacement scan.
+        stage = df.to_arrow() if is_polars else df
+        self.conn.register("_stage_df", stage)
 
-        # Update checkpoint metadata
-        row_count = len(df)
-        self.conn.execute("""
-            INSERT OR REPLACE INTO _checkpoints (table_name, row_count, description, created_at)
-            VALUES (?, ?, ?, CURRENT_TIMESTAMP)
-        """, [table_name, row_count, description])
+        # Write table + checkpoint metadata in one transaction so the two
+        # stay consistent and the write costs a single fsync.
+        self.conn.execute("BEGIN")
+        try:
+            if replace:
+                self.conn.execute(
+                    f"CREATE OR REPLACE TABLE {table_name} AS SELECT * FROM _stage_df"
+                )
+            else:
+                self.conn.execute(f"INSERT INTO {table_name} SELECT * FROM _stage_df")
+
+            # Update checkpoint metadata
+            row_count = len(df)
+            self.conn.execute("""
+                INSERT OR REPLACE INTO _checkpoints (table_name, row_count, description, created_at)
+                VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+            """, [table_name, row_count, description])
+            self.conn.execute("COMMIT")
+            self._invalidate_cache(table_name)
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        finally:
+            self.conn.unregister("_stage_df")
 
     def load_dataframe(
         self,
         table_name: str,
-        as_polars: bool = True
+        as_polars: bool = True,
+        columns: Optional[list[str]] = None
     ) -> Optional[Union[pl.DataFrame, "pd.DataFrame"]]:
         """
         Load a table as a DataFrame.
@@ -93,14 +125,28 @@ class PipelineStore:
         Args:
             table_name: Name of the DuckDB table
             as_polars: If True, return polars DataFrame; else pandas
+            columns: Optional column subset — DuckDB's column store then
+                     only reads the requested columns from disk
 
         Returns:
-            DataFrame or None if table doesn't exist
+            DataFrame or None if table doesn't exist. Polars results are
+            memoized per (table, columns) until save_dataframe or
+            delete_checkpoint invalidates them, so repeated loads (e.g.
+            gene_universe across subcommands) skip the DuckDB scan.
         """
+        cache_key = (table_name, tuple(columns) if columns else None)
+        if as_polars and cache_key in self._df_cache:
+            return self._df_cache[cache_key]
+
+        select_cols = ", ".join(columns) if columns else "*"
         try:
-            result = self.conn.execute(f"SELECT * FROM {table_name}")
+            result = self.conn.execute(f"SELECT {select_cols} FROM {table_name}")
             if as_polars:
-                return result.pl()
+                # Zero-copy handoff: DuckDB exports Arrow buffers and polars
+                # wraps them directly (rechunk would force the copy back)
+                df = pl.from_arrow(result.to_arrow_table(), rechunk=False)
+                self._df_cache[cache_key] = df
+                return df
             else:
                 if not HAS_PANDAS:
                     raise ValueError("pandas not available")
@@ -109,6 +155,101 @@ class PipelineStore:
             # Table doesn't exist
             return None
 
+    def fetch_one(self, table_name: str) -> Optional[dict]:
+        """
+        Fetch the first row of a table as a plain dict.
+
+        LIMIT 1 is pushed into the query and the row comes back through
+        fetchone() plus cursor metadata — no Arrow or DataFrame
+        intermediate — so single-row lookups stay O(1) regardless of
+        table size.
+
+        Args:
+            table_name: Name of the DuckDB table
+
+        Returns:
+            Dict mapping column name -> value, or None if the table
+            doesn't exist or is empty
+        """
+        try:
+            result = self.conn.execute(f"SELECT * FROM {table_name} LIMIT 1")
+        except duckdb.CatalogException:
+            return None
+        row = result.fetchone()
+        if row is None:
+            return None
+        return {col[0]: value for col, value in zip(result.description, row)}
+
+    def scan_lazyframe(self, table_name: str) -> Optional[pl.LazyFrame]:
+        """
+        Open a table as a polars LazyFrame.
+
+        The table arrives from DuckDB through its Arrow reader and is
+        wrapped lazily, so callers can push projections, filters, and
+        expression chains through the polars optimizer before anything
+        is materialized (or sink the result straight to disk).
+
+        Args:
+            table_name: Name of the DuckDB table
+
+        Returns:
+            LazyFrame or None if table doesn't exist
+        """
+        try:
+            reader = self.conn.execute(f"SELECT * FROM {table_name}").to_arrow_reader()
+        except duckdb.CatalogException:
+            return None
+        return pl.from_arrow(reader, rechunk=False).lazy()
+
+    def cursor_view(self) -> "PipelineStore":
+        """
+        Create a read view of this store for use from another thread.
+
+        DuckDB connections are not safe to share across threads, but
+        cursors opened from one connection are independent sessions on
+        the same database. The view shares the database file, skips the
+        metadata DDL, and gets its own frame cache; closing it closes
+        only the cursor. The single-writer rule still applies — views
+        are for concurrent reads.
+
+        Returns:
+            PipelineStore backed by a new cursor on this connection
+        """
+        view = object.__new__(PipelineStore)
+        view.db_path = self.db_path
+        view.conn = self.conn.cursor()
+        view._df_cache = {}
+        return view
+
+    def _invalidate_cache(self, table_name: str) -> None:
+        """Drop all cached frames (any column subset) for a table."""
+        for key in [k for k in self._df_cache if k[0] == table_name]:
+            del self._df_cache[key]
+
+    def count_by(self, table_name: str, column: str) -> Optional[dict]:
+        """
+        Count rows per value of a column using DuckDB aggregation.
+
+        Runs the GROUP BY inside DuckDB so only O(groups) values cross
+        into Python, instead of materializing the whole table as a
+        DataFrame and filtering per category.
+
+        Args:
+            table_name: Name of the DuckDB table
+            column: Column to group by
+
+        Returns:
+            Dict mapping column value -> row count, or None if the
+            table doesn't exist
+        """
+        try:
+            rows = self.conn.execute(
+                f"SELECT {column}, COUNT(*) FROM {table_name} GROUP BY {column}"
+            ).fetchall()
+        except duckdb.CatalogException:
+            return None
+        return dict(rows)
+
     def has_checkpoint(self, table_name: str) -> bool:
         """
         Check if a checkpoint exists.
@@ -119,11 +260,13 @@ class PipelineStore:
         Returns:
             True if checkpoint exists, False otherwise
         """
+        # Existence probe against the keyed metadata table — stops at the
+        # first match instead of aggregating, and never scans data tables
         result = self.conn.execute(
-            "SELECT COUNT(*) FROM _checkpoints WHERE table_name = ?",
+            "SELECT 1 FROM _checkpoints WHERE table_name = ? LIMIT 1",
             [table_name]
         ).fetchone()
-        return result[0] > 0
+        return result is not None
 
     def list_checkpoints(self) -> list[dict]:
         """
@@ -158,6 +301,7 @@ class PipelineStore:
         """
         # Drop table if exists
         self.conn.execute(f"DROP TABLE IF EXISTS {table_name}")
+        self._invalidate_cache(table_name)
 
         # Remove from metadata
         self.conn.execute(
@@ -219,14 +363,19 @@ class PipelineStore:
         return False
 
     @classmethod
-    def from_config(cls, config: "PipelineConfig") -> "PipelineStore":
+    def from_config(
+        cls,
+        config: "PipelineConfig",
+        read_only: bool = False
+    ) -> "PipelineStore":
         """
         Create PipelineStore from a PipelineConfig.
 
         Args:
             config: PipelineConfig instance
+            read_only: Open the database read-only (see __init__)
 
         Returns:
             PipelineStore instance
         """
-        return cls(config.duckdb_path)
+        return cls(config.duckdb_path, read_only=read_only)
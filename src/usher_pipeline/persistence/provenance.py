@@ -1,6 +1,9 @@
 """Provenance tracking for pipeline reproducibility."""
 
 import json
+import os
+
+import orjson
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
@@ -32,6 +35,9 @@ class ProvenanceTracker:
         """
         Record a processing step.
 
+        Pure in-memory append — nothing touches disk until save_sidecar()
+        or save_to_store() flushes all buffered steps in one write.
+
         Args:
             step_name: Name of the processing step
             details: Optional dictionary of additional details
@@ -73,6 +79,10 @@ class ProvenanceTracker:
         """
         Save provenance metadata as a JSON sidecar file.
 
+        The sidecar is written to a temp file and moved into place with
+        os.replace — atomic on POSIX, so readers never see a partial file
+        and no explicit fsync stall is needed on the write path.
+
         Args:
             output_path: Path to the main output file.
                          Sidecar will be saved as {path}.provenance.json
@@ -81,8 +91,11 @@ class ProvenanceTracker:
         sidecar_path.parent.mkdir(parents=True, exist_ok=True)
 
         metadata = self.create_metadata()
-        with open(sidecar_path, "w") as f:
-            json.dump(metadata, f, indent=2, default=str)
+        tmp_path = sidecar_path.with_suffix(".json.tmp")
+        # orjson serializes straight to bytes — one write, no text encoding
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2, default=str))
+        os.replace(tmp_path, sidecar_path)
 
     def save_to_store(self, store: "PipelineStore") -> None:
         """
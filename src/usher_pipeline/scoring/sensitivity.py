@@ -114,9 +114,12 @@ def run_sensitivity_analysis(
     if deltas is None:
         deltas = DEFAULT_DELTAS
 
+    # Dumped once and shared by the start log and the returned payload
+    baseline_dict = baseline_weights.model_dump()
+
     logger.info(
         "run_sensitivity_analysis_start",
-        baseline_weights=baseline_weights.model_dump(),
+        baseline_weights=baseline_dict,
         deltas=deltas,
         top_n=top_n,
         total_perturbations=len(EVIDENCE_LAYERS) * len(deltas),
@@ -208,7 +211,7 @@ def run_sensitivity_analysis(
     )
 
     return {
-        "baseline_weights": baseline_weights.model_dump(),
+        "baseline_weights": baseline_dict,
         "results": results,
         "top_n": top_n,
         "total_perturbations": len(results),
@@ -11,6 +11,35 @@ from usher_pipeline.api_clients.base import CachedAPIClient
 from usher_pipeline.config import load_config
 
 
+def test_async_client_caches_response(tmp_path):
+    """Test that the async client caches bodies and skips repeat fetches."""
+    import asyncio
+
+    import httpx
+
+    from usher_pipeline.api_clients.base_async import AsyncCachedAPIClient
+
+    calls = {"count": 0}
+
+    def handler(request):
+        calls["count"] += 1
+        return httpx.Response(200, json={"data": "test"})
+
+    async def run():
+        client = AsyncCachedAPIClient(cache_dir=tmp_path / "cache", rate_limit=100)
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with client:
+            first = await client.get_json("https://api.example.com/test")
+            second = await client.get_json("https://api.example.com/test")
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first == {"data": "test"}
+    assert second == {"data": "test"}
+    # Second call must be served from the SQLite cache
+    assert calls["count"] == 1
+
+
 def test_client_creates_cache_dir(tmp_path):
     """Test that client creates cache directory if it doesn't exist."""
     cache_dir = tmp_path / "nonexistent_cache"
@@ -26,6 +55,17 @@ def test_client_creates_cache_dir(tmp_path):
     assert cache_dir.is_dir()
 
 
+def test_cache_connection_is_persistent(tmp_path):
+    """Test that the SQLite cache reuses one connection across lookups."""
+    cache_dir = tmp_path / "cache"
+    client = CachedAPIClient(cache_dir=cache_dir)
+
+    storage = client.session.cache.responses
+    with storage.connection() as first, storage.connection() as second:
+        # Same connection object both times — no per-request open/close
+        assert first is second
+
+
 def test_client_caches_response(tmp_path):
     """Test that responses are cached and retrieved from cache."""
     cache_dir = tmp_path / "cache"
@@ -99,8 +139,8 @@ scoring:
     assert client.cache_dir == tmp_path / "cache"
 
 
-def test_rate_limit_respected(tmp_path):
-    """Test that rate limiting sleeps between non-cached requests."""
+def test_rate_limit_allows_burst(tmp_path):
+    """Test that the token bucket lets an initial burst through unthrottled."""
     cache_dir = tmp_path / "cache"
     client = CachedAPIClient(cache_dir=cache_dir, rate_limit=10)
 
@@ -116,15 +156,128 @@ def test_rate_limit_respected(tmp_path):
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
 
-        # Make request
+        # Bucket starts full (10 tokens), so a burst of 10 never sleeps
+        for _ in range(10):
+            client.get(test_url)
+
+        mock_sleep.assert_not_called()
+
+
+def test_rate_limit_sleeps_when_bucket_empty(tmp_path):
+    """Test that an empty token bucket forces a sleep for the deficit."""
+    cache_dir = tmp_path / "cache"
+    client = CachedAPIClient(cache_dir=cache_dir, rate_limit=10)
+
+    test_url = "https://api.example.com/test"
+
+    with patch("time.sleep") as mock_sleep, patch.object(
+        client.session, "get"
+    ) as mock_get, patch("time.monotonic", return_value=client._last_refill):
+        # Configure mock to return non-cached response
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.from_cache = False
+        mock_response.raise_for_status = Mock()
+        mock_get.return_value = mock_response
+
+        # Drain the bucket; with monotonic frozen, no credit accrues
+        client._tokens = 0.0
+
         client.get(test_url)
 
-        # Verify sleep was called with correct rate limit
+        # Deficit of one full token at 10 req/sec = 0.1 seconds
         mock_sleep.assert_called_once()
-        # Rate limit is 10 req/sec = 1/10 = 0.1 seconds between requests
         assert mock_sleep.call_args[0][0] == pytest.approx(0.1)
 
 
+def test_token_buckets_hold_steady_state_rate(tmp_path):
+    """Test that drained token buckets sustain the configured rate, not a multiple.
+
+    Covers all three bucket implementations (sync client, async client,
+    literature limiter). Regression test: forgetting to reset the refill
+    clock after the deficit sleep credits the slept interval twice, which
+    doubles the effective request rate.
+    """
+    import asyncio
+
+    from usher_pipeline.api_clients.base_async import AsyncCachedAPIClient
+    from usher_pipeline.evidence.literature.fetch import _AsyncRateLimiter
+
+    rate, n = 50, 15
+    # n throttled acquires at `rate`/s must take at least ~n/rate seconds
+    floor = 0.9 * n / rate
+
+    client = CachedAPIClient(cache_dir=tmp_path / "sync", rate_limit=rate)
+    client._tokens = 0.0
+    client._last_refill = time.monotonic()
+    start = time.monotonic()
+    for _ in range(n):
+        client._acquire_token()
+    assert time.monotonic() - start >= floor
+
+    async def timed(bucket, acquire):
+        bucket._tokens = 0.0
+        bucket._last_refill = time.monotonic()
+        start = time.monotonic()
+        for _ in range(n):
+            await acquire()
+        return time.monotonic() - start
+
+    async_client = AsyncCachedAPIClient(cache_dir=tmp_path / "async", rate_limit=rate)
+    assert asyncio.run(timed(async_client, async_client._acquire_token)) >= floor
+
+    limiter = _AsyncRateLimiter(float(rate))
+    assert asyncio.run(timed(limiter, limiter.acquire)) >= floor
+
+
+def test_cache_stats_track_hits_and_misses(tmp_path):
+    """Test that cache_stats reports hit/miss counters and hit rate."""
+    cache_dir = tmp_path / "cache"
+    client = CachedAPIClient(cache_dir=cache_dir, rate_limit=100)
+
+    test_url = "https://api.example.com/test"
+
+    with patch.object(client.session, "get") as mock_get:
+        miss = Mock(status_code=200, from_cache=False, raise_for_status=Mock())
+        hit = Mock(status_code=200, from_cache=True, raise_for_status=Mock())
+
+        mock_get.return_value = miss
+        client.get(test_url)
+        mock_get.return_value = hit
+        client.get(test_url)
+        client.get(test_url)
+
+    stats = client.cache_stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == pytest.approx(2 / 3)
+
+
+def test_retry_backoff_is_jittered(tmp_path):
+    """Test that retry delays are drawn from [0, cap] with full jitter."""
+    import random
+
+    from tenacity import wait_random_exponential
+
+    cache_dir = tmp_path / "cache"
+    client = CachedAPIClient(cache_dir=cache_dir, max_retries=5)
+
+    @client._create_retry_decorator()
+    def _dummy():
+        pass
+
+    wait = _dummy.retry.wait
+    assert isinstance(wait, wait_random_exponential)
+
+    # With a seeded RNG, every sampled delay must stay within [0, max]
+    random.seed(42)
+    for attempt in range(1, 10):
+        retry_state = Mock()
+        retry_state.attempt_number = attempt
+        delay = wait(retry_state)
+        assert 0 <= delay <= 60
+
+
 def test_rate_limit_skipped_for_cached(tmp_path):
     """Test that cached requests don't trigger rate limiting sleep."""
     cache_dir = tmp_path / "cache"
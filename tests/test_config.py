@@ -133,3 +133,49 @@ scoring:
     assert cache_dir.exists()
     assert data_dir.is_dir()
     assert cache_dir.is_dir()
+
+
+def test_config_disk_cache_roundtrip(tmp_path, monkeypatch):
+    """Test that a validated config is pickled to disk and loads back identically."""
+    from usher_pipeline.config.loader import _load_config_cached
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg_cache"))
+
+    config_file = tmp_path / "cache_test.yaml"
+    config_file.write_text(f"""
+data_dir: {tmp_path / "data"}
+cache_dir: {tmp_path / "cache"}
+duckdb_path: {tmp_path / "test.duckdb"}
+versions:
+  ensembl_release: 113
+  gnomad_version: v4.1
+api:
+  rate_limit_per_second: 5
+  max_retries: 5
+  cache_ttl_seconds: 86400
+  timeout_seconds: 30
+scoring:
+  gnomad: 0.20
+  expression: 0.20
+  annotation: 0.15
+  localization: 0.15
+  animal_model: 0.15
+  literature: 0.15
+""")
+
+    config = load_config(config_file)
+
+    # The disk cache entry was written alongside the in-process cache
+    cache_files = list((tmp_path / "xdg_cache" / "usher").glob("config-*.pkl"))
+    assert len(cache_files) == 1
+
+    # A fresh process (simulated by clearing the lru cache) loads the pickle
+    _load_config_cached.cache_clear()
+    cached = load_config(config_file)
+    assert cached.config_hash() == config.config_hash()
+
+    # Opt-out skips the disk path entirely
+    monkeypatch.setenv("USHER_NO_CONFIG_CACHE", "1")
+    _load_config_cached.cache_clear()
+    uncached = load_config(config_file)
+    assert uncached.config_hash() == config.config_hash()
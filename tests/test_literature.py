@@ -289,3 +289,45 @@ def test_query_pubmed_gene_mock(mock_entrez):
     assert "sensory_context_count" in result
     assert "direct_experimental_count" in result
     assert "hts_screen_count" in result
+
+
+@patch('usher_pipeline.evidence.literature.fetch.httpx.AsyncClient')
+def test_fetch_genes_async_mock(mock_client_class):
+    """Test the async E-utilities fan-out with mocked HTTP responses."""
+    import asyncio
+    from unittest.mock import AsyncMock, MagicMock
+
+    from usher_pipeline.evidence.literature.fetch import (
+        _AsyncRateLimiter,
+        _fetch_genes_async,
+    )
+
+    # Mock async httpx client (fetch fans queries out via asyncio)
+    mock_client = MagicMock()
+    mock_client_class.return_value.__aenter__ = AsyncMock(return_value=mock_client)
+    mock_client_class.return_value.__aexit__ = AsyncMock(return_value=False)
+
+    mock_response = Mock()
+    mock_response.json.return_value = {"esearchresult": {"count": "7"}}
+    mock_client.get = AsyncMock(return_value=mock_response)
+
+    async def _run():
+        import httpx
+
+        limiter = _AsyncRateLimiter(10.0)
+        sem = asyncio.Semaphore(10)
+        async with httpx.AsyncClient() as client:
+            return await _fetch_genes_async(
+                client, limiter, sem, ["GENE1", "GENE2"],
+                email="test@example.com", api_key="key",
+            )
+
+    results = asyncio.run(_run())
+
+    # One result dict per gene, in input order, with all query fields
+    assert [r["gene_symbol"] for r in results] == ["GENE1", "GENE2"]
+    for result in results:
+        assert result["total_pubmed_count"] == 7
+        assert result["cilia_context_count"] == 7
+        assert result["direct_experimental_count"] == 7
+        assert result["hts_screen_count"] == 7
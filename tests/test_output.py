@@ -12,6 +12,7 @@ from usher_pipeline.output import (
     add_evidence_summary,
     assign_tiers,
     write_candidate_output,
+    write_candidate_output_from_table,
 )
 
 
@@ -509,6 +510,16 @@ def test_add_evidence_summary_gaps(synthetic_scored_genes):
     assert supporting == "", "Gene with all NULL scores should have empty supporting_layers"
 
 
+def test_tiering_accepts_lazyframe(synthetic_scored_genes):
+    """Test that assign_tiers/add_evidence_summary stay lazy and match eager results."""
+    eager = add_evidence_summary(assign_tiers(synthetic_scored_genes))
+
+    lazy = add_evidence_summary(assign_tiers(synthetic_scored_genes.lazy()))
+    assert isinstance(lazy, pl.LazyFrame)
+
+    assert lazy.collect().equals(eager)
+
+
 def test_write_candidate_output_creates_files(tmp_path, synthetic_scored_genes):
     """Test that write_candidate_output creates TSV, Parquet, and provenance files."""
     # Add tier and evidence summary columns
@@ -552,6 +563,24 @@ def test_write_candidate_output_tsv_readable(tmp_path, synthetic_scored_genes):
     assert "evidence_gaps" in tsv_df.columns
 
 
+def test_write_candidate_output_compressed_tsv(tmp_path, synthetic_scored_genes):
+    """Test that compress_tsv writes a readable gzipped TSV."""
+    tiered = assign_tiers(synthetic_scored_genes)
+    full_df = add_evidence_summary(tiered)
+
+    paths = write_candidate_output(full_df, tmp_path, compress_tsv=True)
+
+    assert paths["tsv"].name == "candidates.tsv.gz"
+    assert paths["tsv"].exists()
+
+    # Read back through gzip decompression
+    import gzip
+    with gzip.open(paths["tsv"], "rb") as f:
+        tsv_df = pl.read_csv(f.read(), separator="\t")
+
+    assert tsv_df.height == full_df.height, "Compressed TSV should have same row count as input"
+
+
 def test_write_candidate_output_parquet_readable(tmp_path, synthetic_scored_genes):
     """Test that Parquet output can be read back and schema matches."""
     tiered = assign_tiers(synthetic_scored_genes)
@@ -572,6 +601,51 @@ def test_write_candidate_output_parquet_readable(tmp_path, synthetic_scored_gene
     assert parquet_df.columns == full_df.columns, "Parquet should have identical schema to input"
 
 
+def test_write_candidate_output_duckdb_copy(tmp_path, synthetic_scored_genes):
+    """Test that the DuckDB COPY TO path produces the same Parquet output."""
+    import duckdb
+
+    tiered = assign_tiers(synthetic_scored_genes)
+    full_df = add_evidence_summary(tiered)
+
+    conn = duckdb.connect()
+    paths = write_candidate_output(full_df, tmp_path, conn=conn)
+    conn.close()
+
+    parquet_df = pl.read_parquet(paths["parquet"])
+    assert parquet_df.height == full_df.height
+    assert parquet_df.columns == full_df.columns
+
+
+def test_write_candidate_output_from_table(tmp_path, synthetic_scored_genes):
+    """Test the all-DuckDB export path matches the DataFrame writer."""
+    import duckdb
+
+    tiered = assign_tiers(synthetic_scored_genes)
+    full_df = add_evidence_summary(tiered)
+
+    conn = duckdb.connect()
+    conn.register("_src", full_df.to_arrow())
+    conn.execute("CREATE TABLE tiered_candidates AS SELECT * FROM _src")
+
+    paths = write_candidate_output_from_table(conn, "tiered_candidates", tmp_path)
+    conn.close()
+
+    assert paths["tsv"].exists()
+    assert paths["provenance"].exists()
+
+    tsv_df = pl.read_csv(paths["tsv"], separator="\t")
+    parquet_df = pl.read_parquet(paths["parquet"])
+    assert tsv_df.height == full_df.height
+    assert parquet_df.columns == full_df.columns
+
+    # Deterministic ordering matches the DataFrame path
+    expected = full_df.sort(
+        ["composite_score", "gene_id"], descending=[True, False]
+    )
+    assert parquet_df["gene_id"].to_list() == expected["gene_id"].to_list()
+
+
 def test_write_candidate_output_provenance_yaml(tmp_path, synthetic_scored_genes):
     """Test that provenance YAML contains accurate statistics."""
     tiered = assign_tiers(synthetic_scored_genes)
@@ -85,6 +85,95 @@ def test_save_and_load_polars(tmp_path):
     store.close()
 
 
+def test_fetch_one(tmp_path):
+    """Test fetching the first row as a dict without a DataFrame round-trip."""
+    store = PipelineStore(tmp_path / "test.duckdb")
+
+    df = pl.DataFrame({
+        "gene": ["BRCA1", "TP53"],
+        "score": [0.95, 0.88],
+    })
+    store.save_dataframe(df, "genes", "test genes")
+
+    row = store.fetch_one("genes")
+    assert row == {"gene": "BRCA1", "score": 0.95}
+
+    # Missing and empty tables both return None
+    assert store.fetch_one("missing_table") is None
+    store.conn.execute("CREATE TABLE empty_table (x INTEGER)")
+    assert store.fetch_one("empty_table") is None
+
+    store.close()
+
+
+def test_scan_lazyframe(tmp_path):
+    """Test scanning a table as a LazyFrame with pushed-down projection."""
+    store = PipelineStore(tmp_path / "test.duckdb")
+
+    df = pl.DataFrame({
+        "gene": ["BRCA1", "TP53", "MYO7A"],
+        "score": [0.95, 0.88, 0.92],
+    })
+    store.save_dataframe(df, "genes", "test genes")
+
+    lf = store.scan_lazyframe("genes")
+    assert isinstance(lf, pl.LazyFrame)
+
+    result = lf.filter(pl.col("score") > 0.9).select("gene").collect()
+    assert sorted(result["gene"].to_list()) == ["BRCA1", "MYO7A"]
+
+    # Missing table returns None, matching load_dataframe
+    assert store.scan_lazyframe("missing_table") is None
+
+    store.close()
+
+
+def test_cursor_view_concurrent_reads(tmp_path):
+    """Test that cursor views allow reads from other threads."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    store = PipelineStore(tmp_path / "test.duckdb")
+
+    df = pl.DataFrame({
+        "gene": ["BRCA1", "TP53", "MYO7A"],
+        "score": [0.95, 0.88, 0.92],
+    })
+    store.save_dataframe(df, "genes", "test genes")
+
+    def read_count(view):
+        return view.conn.execute("SELECT COUNT(*) FROM genes").fetchone()[0]
+
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        counts = list(ex.map(read_count, [store.cursor_view(), store.cursor_view()]))
+
+    assert counts == [3, 3]
+
+    # Views carry the full store API and an independent frame cache
+    view = store.cursor_view()
+    assert view.fetch_one("genes") == {"gene": "BRCA1", "score": 0.95}
+    assert view._df_cache == {}
+
+    store.close()
+
+
+def test_read_only_store(tmp_path):
+    """Test read-only opens can read checkpoints but not write."""
+    import duckdb
+
+    db_path = tmp_path / "test.duckdb"
+    with PipelineStore(db_path) as store:
+        store.save_dataframe(pl.DataFrame({"col": [1, 2]}), "genes", "test")
+
+    ro = PipelineStore(db_path, read_only=True)
+    assert ro.has_checkpoint("genes")
+    assert ro.load_dataframe("genes").shape == (2, 1)
+
+    with pytest.raises(duckdb.Error):
+        ro.save_dataframe(pl.DataFrame({"col": [3]}), "other", "test")
+
+    ro.close()
+
+
 def test_save_and_load_pandas(tmp_path):
     """Test saving and loading pandas DataFrame."""
     pd = pytest.importorskip("pandas")
@@ -197,6 +286,25 @@ def test_load_nonexistent_returns_none(tmp_path):
     store.close()
 
 
+def test_count_by(tmp_path):
+    """Test per-category counts computed inside DuckDB."""
+    store = PipelineStore(tmp_path / "test.duckdb")
+
+    df = pl.DataFrame({
+        "gene_id": ["g1", "g2", "g3", "g4"],
+        "quality_flag": ["measured", "measured", "no_data", "incomplete_coverage"],
+    })
+    store.save_dataframe(df, "test_table", "test")
+
+    counts = store.count_by("test_table", "quality_flag")
+    assert counts == {"measured": 2, "no_data": 1, "incomplete_coverage": 1}
+
+    # Non-existent table returns None
+    assert store.count_by("nonexistent_table", "quality_flag") is None
+
+    store.close()
+
+
 def test_context_manager(tmp_path):
     """Test context manager support."""
     db_path = tmp_path / "test.duckdb"
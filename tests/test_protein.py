@@ -1,6 +1,6 @@
 """Unit tests for protein features evidence layer."""
 
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 import polars as pl
 import pytest
 from polars.testing import assert_frame_equal
@@ -240,14 +240,15 @@ def test_domain_keyword_case_insensitive():
     assert result["has_cilia_domain"][2] == True
 
 
-@patch("usher_pipeline.evidence.protein.fetch.httpx.Client")
+@patch("usher_pipeline.evidence.protein.fetch.httpx.AsyncClient")
 def test_fetch_uniprot_features_with_mock(mock_client_class):
     """Test UniProt fetch with mocked HTTP responses."""
     from usher_pipeline.evidence.protein.fetch import fetch_uniprot_features
 
-    # Mock httpx client
+    # Mock async httpx client (fetch fans batches out via asyncio)
     mock_client = MagicMock()
-    mock_client_class.return_value.__enter__.return_value = mock_client
+    mock_client_class.return_value.__aenter__ = AsyncMock(return_value=mock_client)
+    mock_client_class.return_value.__aexit__ = AsyncMock(return_value=False)
 
     # Mock UniProt API response
     mock_response = Mock()
@@ -264,7 +265,7 @@ def test_fetch_uniprot_features_with_mock(mock_client_class):
             }
         ]
     }
-    mock_client.get.return_value = mock_response
+    mock_client.get = AsyncMock(return_value=mock_response)
 
     # Call fetch
     df = fetch_uniprot_features(["P12345"])
@@ -114,14 +114,18 @@ def populated_db(tmp_path):
     })
     conn.execute("CREATE TABLE scored_genes AS SELECT * FROM scored_genes_df")
 
-    # Register checkpoint
+    # Register checkpoint (same schema PipelineStore creates)
     conn.execute("""
         CREATE TABLE IF NOT EXISTS _checkpoints (
             table_name VARCHAR PRIMARY KEY,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            row_count INTEGER,
+            description VARCHAR
         )
     """)
-    conn.execute("INSERT INTO _checkpoints (table_name) VALUES ('scored_genes')")
+    conn.execute(
+        "INSERT INTO _checkpoints (table_name, row_count) VALUES ('scored_genes', 20)"
+    )
 
     conn.close()
     return db_path
@@ -271,6 +275,79 @@ def test_report_custom_thresholds(test_config, populated_db, tmp_path):
     assert high_count == 2  # Only genes with score >= 0.8 and evidence >= 3
 
 
+def test_report_reuses_tier_cache(test_config, populated_db, tmp_path):
+    """Second run with identical thresholds reuses the tiered_candidates checkpoint."""
+    runner = CliRunner()
+
+    first_output = tmp_path / "output_first"
+    result = runner.invoke(cli, [
+        '--config', str(test_config),
+        'report',
+        '--output-dir', str(first_output),
+        '--skip-viz',
+    ])
+    assert result.exit_code == 0
+    assert "Reusing cached tier classification" not in result.output
+
+    # Same thresholds, different output dir: Steps 3-4 should be skipped
+    second_output = tmp_path / "output_second"
+    result = runner.invoke(cli, [
+        '--config', str(test_config),
+        'report',
+        '--output-dir', str(second_output),
+        '--skip-viz',
+    ])
+    assert result.exit_code == 0
+    assert "Reusing cached tier classification" in result.output
+
+    # Cached run produces identical candidates
+    first_df = pl.read_parquet(first_output / "candidates.parquet")
+    second_df = pl.read_parquet(second_output / "candidates.parquet")
+    assert first_df.equals(second_df)
+
+    # Changed thresholds invalidate the cache
+    third_output = tmp_path / "output_third"
+    result = runner.invoke(cli, [
+        '--config', str(test_config),
+        'report',
+        '--output-dir', str(third_output),
+        '--skip-viz',
+        '--high-threshold', '0.8',
+    ])
+    assert result.exit_code == 0
+    assert "Reusing cached tier classification" not in result.output
+
+
+def test_report_fast_path_skip_viz_and_report(test_config, populated_db, tmp_path):
+    """Cached rerun with --skip-viz --skip-report writes outputs straight from DuckDB."""
+    runner = CliRunner()
+
+    first_output = tmp_path / "output_first"
+    result = runner.invoke(cli, [
+        '--config', str(test_config),
+        'report',
+        '--output-dir', str(first_output),
+        '--skip-viz', '--skip-report',
+    ])
+    assert result.exit_code == 0
+
+    second_output = tmp_path / "output_second"
+    result = runner.invoke(cli, [
+        '--config', str(test_config),
+        'report',
+        '--output-dir', str(second_output),
+        '--skip-viz', '--skip-report',
+    ])
+    assert result.exit_code == 0
+    assert "Reusing cached tier classification" in result.output
+
+    first_df = pl.read_parquet(first_output / "candidates.parquet")
+    second_df = pl.read_parquet(second_output / "candidates.parquet")
+    assert second_df.height == first_df.height
+    assert second_df.columns == first_df.columns
+    assert second_df["gene_id"].to_list() == first_df["gene_id"].to_list()
+
+
 def test_report_no_scored_genes_error(test_config, tmp_path):
     """Test report with missing scored_genes table produces clear error."""
     # Create empty DuckDB (no scored_genes table)